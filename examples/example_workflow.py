@@ -27,6 +27,9 @@ from cluspro import (
     group_sequences,
 )
 
+# Rows shown when printing DataFrames; larger tables are elided in the middle
+MAX_PRINT_ROWS = 50
+
 
 def example_single_submission():
     """Example: Submit a single docking job."""
@@ -57,26 +60,33 @@ def example_batch_submission():
     """Example: Submit multiple jobs from DataFrame."""
     print("\n=== Batch Job Submission ===\n")
 
-    # Create a DataFrame with job specifications
+    # Create a DataFrame with job specifications. Typed string columns and a
+    # categorical server column avoid object-dtype boxing on large batches.
     jobs = pd.DataFrame(
         {
-            "job_name": ["batch-job-1", "batch-job-2", "batch-job-3"],
-            "receptor_pdb": [
-                "/path/to/receptor.pdb",
-                "/path/to/receptor.pdb",
-                "/path/to/receptor.pdb",
-            ],
-            "ligand_pdb": [
-                "/path/to/ligand1.pdb",
-                "/path/to/ligand2.pdb",
-                "/path/to/ligand3.pdb",
-            ],
-            "server": ["gpu", "gpu", "gpu"],
+            "job_name": pd.array(["batch-job-1", "batch-job-2", "batch-job-3"], dtype="string"),
+            "receptor_pdb": pd.array(
+                [
+                    "/path/to/receptor.pdb",
+                    "/path/to/receptor.pdb",
+                    "/path/to/receptor.pdb",
+                ],
+                dtype="string",
+            ),
+            "ligand_pdb": pd.array(
+                [
+                    "/path/to/ligand1.pdb",
+                    "/path/to/ligand2.pdb",
+                    "/path/to/ligand3.pdb",
+                ],
+                dtype="string",
+            ),
+            "server": pd.Categorical(["gpu", "gpu", "gpu"], categories=["gpu", "cpu"]),
         }
     )
 
     print("Jobs to submit:")
-    print(jobs)
+    print(jobs.to_string(max_rows=MAX_PRINT_ROWS))
 
     # In dry run mode, just validate
     from cluspro.submit import dry_run
@@ -95,7 +105,21 @@ def example_check_queue():
         print("No matching jobs in queue")
     else:
         print(f"Found {len(df)} jobs in queue:")
-        print(df)
+        print(df.to_string(max_rows=MAX_PRINT_ROWS))
+
+
+def example_monitor_queue():
+    """Example: Poll the queue repeatedly with one reused browser."""
+    print("\n=== Queue Monitoring ===\n")
+
+    from cluspro import BrowserPool
+
+    # Browser startup and login happen once for all polls
+    with BrowserPool(size=1, headless=True) as pool:
+        for _ in range(3):
+            df = get_queue_status(filter_pattern="batch-.*", pool=pool)
+            print(f"{len(df)} matching jobs in queue")
+            time.sleep(60)
 
 
 def example_get_results():
@@ -108,7 +132,7 @@ def example_get_results():
         print("No finished jobs found")
     else:
         print(f"Found {len(df)} finished jobs:")
-        print(df[["job_name", "job_id", "status"]])
+        print(df[["job_name", "job_id", "status"]].to_string(max_rows=MAX_PRINT_ROWS))
 
         # Get compressed job IDs
         if "job_id" in df.columns:
@@ -147,12 +171,12 @@ def example_organize_results():
     )
 
     print("Organization mapping:")
-    print(mapping)
+    print(mapping.to_string(max_rows=MAX_PRINT_ROWS))
 
     print("\nNew directory names would be:")
-    for _, row in mapping.iterrows():
-        new_name = f"{row['peptide_name']}_v_{row['receptor_name']}"
-        print(f"  {row['job_name']} -> {new_name}")
+    new_names = mapping["peptide_name"].str.cat(mapping["receptor_name"], sep="_v_")
+    for old, new in zip(mapping["job_name"].to_numpy(), new_names.to_numpy()):
+        print(f"  {old} -> {new}")
 
 
 def example_sequence_utilities():
@@ -191,6 +215,7 @@ def main():
     # Uncomment these to run actual operations:
     # example_single_submission()
     # example_check_queue()
+    # example_monitor_queue()
     # example_get_results()
 
 
@@ -28,22 +28,71 @@ Example usage:
 __version__ = "0.4.0"
 __author__ = "E Wijaya"
 
-from cluspro.auth import (
-    AuthenticationError,
-    Credentials,
-    CredentialSource,
-    get_credentials,
-    has_credentials,
-)
-from cluspro.browser import authenticate, create_browser
-from cluspro.database import Job, JobDatabase, JobStatus
-from cluspro.download import download_batch, download_results
-from cluspro.organize import organize_results
-from cluspro.queue import get_queue_status
-from cluspro.results import get_finished_jobs
-from cluspro.retry import retry_browser, retry_download, with_retry
-from cluspro.submit import submit_batch, submit_job
-from cluspro.utils import expand_sequences, group_sequences
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cluspro.auth import (
+        AuthenticationError,
+        Credentials,
+        CredentialSource,
+        get_credentials,
+        has_credentials,
+    )
+    from cluspro.browser import authenticate, create_browser
+    from cluspro.browser_pool import BrowserPool
+    from cluspro.database import Job, JobDatabase, JobStatus
+    from cluspro.download import download_batch, download_results
+    from cluspro.organize import organize_results
+    from cluspro.queue import get_queue_status
+    from cluspro.results import get_finished_jobs
+    from cluspro.retry import retry_browser, retry_download, with_retry
+    from cluspro.submit import submit_batch, submit_job
+    from cluspro.utils import expand_sequences, group_sequences
+
+# Public names and the submodule that defines each one. Submodules are
+# imported on first attribute access, so "import cluspro" does not pull in
+# Selenium, pandas or the other heavy dependencies until they are needed.
+_LAZY_IMPORTS = {
+    "AuthenticationError": "cluspro.auth",
+    "Credentials": "cluspro.auth",
+    "CredentialSource": "cluspro.auth",
+    "get_credentials": "cluspro.auth",
+    "has_credentials": "cluspro.auth",
+    "authenticate": "cluspro.browser",
+    "create_browser": "cluspro.browser",
+    "BrowserPool": "cluspro.browser_pool",
+    "Job": "cluspro.database",
+    "JobDatabase": "cluspro.database",
+    "JobStatus": "cluspro.database",
+    "download_batch": "cluspro.download",
+    "download_results": "cluspro.download",
+    "organize_results": "cluspro.organize",
+    "get_queue_status": "cluspro.queue",
+    "get_finished_jobs": "cluspro.results",
+    "retry_browser": "cluspro.retry",
+    "retry_download": "cluspro.retry",
+    "with_retry": "cluspro.retry",
+    "submit_batch": "cluspro.submit",
+    "submit_job": "cluspro.submit",
+    "expand_sequences": "cluspro.utils",
+    "group_sequences": "cluspro.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Authentication
@@ -55,6 +104,7 @@ __all__ = [
     # Browser
     "create_browser",
     "authenticate",
+    "BrowserPool",
     # Submission
     "submit_job",
     "submit_batch",
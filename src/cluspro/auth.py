@@ -8,6 +8,7 @@ Supports multiple credential sources with priority:
 3. Interactive prompt
 """
 
+import functools
 import logging
 import os
 from dataclasses import dataclass
@@ -34,9 +35,14 @@ class CredentialSource(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Credentials:
-    """Container for ClusPro credentials."""
+    """
+    Container for ClusPro credentials.
+
+    Immutable and hashable, so one instance can be shared safely (for
+    example the memoized environment credentials) and used as a cache key.
+    """
 
     username: str
     password: str
@@ -53,9 +59,18 @@ def _get_credentials_from_env() -> Credentials | None:
     Returns:
         Credentials if both env vars are set, None otherwise
     """
-    username = os.environ.get("CLUSPRO_USERNAME")
-    password = os.environ.get("CLUSPRO_PASSWORD")
+    return _credentials_from_env_values(
+        os.environ.get("CLUSPRO_USERNAME"), os.environ.get("CLUSPRO_PASSWORD")
+    )
+
 
+@functools.lru_cache(maxsize=1)
+def _credentials_from_env_values(username: str | None, password: str | None) -> Credentials | None:
+    """
+    Build environment credentials, memoized on the variable values.
+
+    Repeated lookups return the same object until either variable changes.
+    """
     if username and password:
         logger.debug("Credentials loaded from environment variables")
         return Credentials(
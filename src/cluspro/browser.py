@@ -3,24 +3,119 @@ Browser management module for ClusPro automation.
 
 Provides unified browser setup with automatic driver management.
 No external Selenium server required - uses webdriver-manager.
+
+Browsers are created with an implicit wait of 0. Anything that may not be
+on the page yet is waited for explicitly through wait_for_element(), so a
+lookup for an element that is legitimately absent fails immediately
+instead of stalling for the implicit timeout.
 """
 
+import functools
 import logging
+import os
+import threading
+import time
+import weakref
 from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.support.ui import WebDriverWait
+from tenacity import RetryCallState
 from webdriver_manager.firefox import GeckoDriverManager
 
 from cluspro.auth import AuthenticationError, Credentials
-from cluspro.retry import retry_browser
+from cluspro.retry import create_retry_decorator
 from cluspro.utils import load_config
 
+if TYPE_CHECKING:
+    from cluspro.browser_pool import BrowserPool
+
 logger = logging.getLogger(__name__)
 
+# Resolved geckodriver path, shared by every create_browser call in the process
+_GECKODRIVER_PATH: str | None = None
+_GECKODRIVER_LOCK = threading.Lock()
+
+# Resolved path persisted across processes; trusted for a day, like webdriver-manager's cache
+GECKODRIVER_CACHE_FILE = Path.home() / ".cluspro" / "geckodriver_path"
+GECKODRIVER_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Seconds between WebDriverWait condition checks (browser.poll_frequency).
+# Each check is a WebDriver round trip, so polling faster than the floor
+# adds driver traffic without noticeably cutting latency.
+DEFAULT_POLL_FREQUENCY = 0.1
+MIN_POLL_FREQUENCY = 0.1
+
+# Configured poll frequency of each live driver created by create_browser
+_POLL_FREQUENCIES: "weakref.WeakKeyDictionary[webdriver.Firefox, float]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Login form submit button; a CSS selector resolves through the browser's native
+# querySelector, which is cheaper than evaluating an XPath expression
+LOGIN_SUBMIT = (By.CSS_SELECTOR, "input[name=action][value=Login]")
+
+# Link ClusPro shows on its pages until the browser has logged in
+GUEST_LOGIN_TEXT = "Use the server without the benefits of your own account"
+
+# Preferences that shrink each Firefox instance (browser.minimal, on by default).
+# ClusPro pages need JavaScript but not images, WebGL, media or extra content
+# processes, so skipping them cuts memory and lets a BrowserPool hold more browsers.
+# Telemetry, Safe Browsing lookups and session restore add background requests
+# and disk writes that an automated session never benefits from.
+MINIMAL_FIREFOX_PREFS = {
+    "permissions.default.image": 2,
+    "dom.ipc.processCount": 1,
+    "fission.autostart": False,
+    "browser.cache.disk.enable": False,
+    "browser.cache.memory.enable": True,
+    "media.autoplay.default": 5,
+    "webgl.disabled": True,
+    "toolkit.telemetry.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "browser.sessionstore.resume_from_crash": False,
+    "browser.startup.homepage": "about:blank",
+    "startup.homepage_welcome_url": "about:blank",
+    "startup.homepage_welcome_url.additional": "",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_dir_path(path: str) -> Path:
+    """Resolve a configured directory to an absolute path once per process."""
+    return Path(path).expanduser().resolve()
+
+
+def _resolve_dir(path: str) -> str:
+    """
+    Resolve a directory (downloads, profile root) to an absolute path and create it.
+
+    Only the resolution is cached; the directory is (re)created on every
+    call in case it was removed since the last browser started.
+    """
+    resolved = _resolve_dir_path(path)
+    resolved.mkdir(parents=True, exist_ok=True)
+    return str(resolved)
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_executable(path: str) -> str:
+    """Resolve a configured executable path (e.g. geckodriver) once per process."""
+    return str(Path(path).expanduser().resolve())
+
 
 def _find_cached_geckodriver() -> str | None:
     """
@@ -47,6 +142,76 @@ def _find_cached_geckodriver() -> str | None:
     return str(newest)
 
 
+def _read_geckodriver_cache() -> str | None:
+    """Return the persisted geckodriver path if it is recent and still exists."""
+    try:
+        age = time.time() - GECKODRIVER_CACHE_FILE.stat().st_mtime
+        if age > GECKODRIVER_CACHE_MAX_AGE:
+            return None
+        path = GECKODRIVER_CACHE_FILE.read_text().strip()
+    except OSError:
+        return None
+
+    return path if path and Path(path).is_file() else None
+
+
+def _write_geckodriver_cache(path: str) -> None:
+    """Persist the resolved geckodriver path for later processes."""
+    try:
+        GECKODRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        GECKODRIVER_CACHE_FILE.write_text(str(path))
+    except OSError as e:
+        logger.debug(f"Could not write geckodriver cache: {e}")
+
+
+def _install_geckodriver() -> str:
+    """
+    Resolve the geckodriver path once per process.
+
+    The first call reuses the path persisted by an earlier process if it is
+    less than a day old, otherwise it runs webdriver-manager (falling back to
+    a cached driver on GitHub API errors). Later calls reuse the stored path.
+
+    Returns:
+        Path to geckodriver executable
+
+    Raises:
+        RuntimeError: If rate limited and no cached geckodriver is available
+    """
+    global _GECKODRIVER_PATH
+
+    with _GECKODRIVER_LOCK:
+        if _GECKODRIVER_PATH is not None:
+            return _GECKODRIVER_PATH
+
+        cached = _read_geckodriver_cache()
+        if cached:
+            logger.debug(f"Using persisted geckodriver path: {cached}")
+            _GECKODRIVER_PATH = cached
+            return cached
+
+        try:
+            _GECKODRIVER_PATH = GeckoDriverManager().install()
+            _write_geckodriver_cache(_GECKODRIVER_PATH)
+        except Exception as e:
+            error_msg = str(e)
+            if "rate limit" in error_msg.lower() or "API" in error_msg:
+                logger.warning(f"GitHub API error: {e}")
+                logger.info("Falling back to cached geckodriver...")
+                cached_path = _find_cached_geckodriver()
+                if not cached_path:
+                    raise RuntimeError(
+                        "GitHub API rate limit exceeded and no cached geckodriver found. "
+                        "Set 'geckodriver_path' in config or wait for rate limit reset."
+                    ) from e
+                logger.info(f"Using cached geckodriver: {cached_path}")
+                _GECKODRIVER_PATH = cached_path
+            else:
+                raise
+
+        return _GECKODRIVER_PATH
+
+
 def create_browser(
     headless: bool = True,
     download_dir: str | None = None,
@@ -55,6 +220,11 @@ def create_browser(
     """
     Create and configure a Firefox browser instance.
 
+    All preferences are passed with Options.set_preference, which travels in
+    the session capabilities. Do not switch to a FirefoxProfile: Selenium
+    copies and zips a profile directory on every launch, which makes each
+    browser noticeably slower to start.
+
     Args:
         headless: Run browser without visible window (default: True)
         download_dir: Directory for downloaded files (auto-downloads without prompt)
@@ -90,8 +260,7 @@ def create_browser(
 
     # Download configuration
     if download_dir:
-        download_path = str(Path(download_dir).expanduser().resolve())
-        Path(download_path).mkdir(parents=True, exist_ok=True)
+        download_path = _resolve_dir(str(download_dir))
 
         options.set_preference("browser.download.folderList", 2)
         options.set_preference("browser.download.dir", download_path)
@@ -112,49 +281,56 @@ def create_browser(
         options.set_preference("browser.helperApps.neverAsk.saveToDisk", ",".join(mime_types))
         logger.debug(f"Download directory set to: {download_path}")
 
+    # Return from driver.get() at DOMContentLoaded; anything the automation
+    # needs is waited for explicitly, so waiting for every subresource is wasted
+    options.page_load_strategy = browser_config.get("page_load_strategy", "eager")
+
     # Disable notifications and other popups
     options.set_preference("dom.webnotifications.enabled", False)
     options.set_preference("dom.push.enabled", False)
 
+    if browser_config.get("minimal", True):
+        for name, value in MINIMAL_FIREFOX_PREFS.items():
+            options.set_preference(name, value)
+        logger.debug("Browser configured with minimal-footprint preferences")
+
     # Use webdriver-manager to automatically download and manage geckodriver
     logger.info("Initializing Firefox WebDriver...")
 
-    # Check for direct geckodriver path in config (bypasses GitHub API calls)
-    geckodriver_path = browser_config.get("geckodriver_path")
+    # Direct geckodriver path from env or config bypasses webdriver-manager entirely
+    geckodriver_path = os.environ.get("CLUSPRO_GECKODRIVER") or browser_config.get(
+        "geckodriver_path"
+    )
     if geckodriver_path:
-        geckodriver_path = str(Path(geckodriver_path).expanduser().resolve())
-        logger.debug(f"Using geckodriver from config: {geckodriver_path}")
-        service = FirefoxService(geckodriver_path)
+        geckodriver_path = _resolve_executable(geckodriver_path)
+        logger.debug(f"Using geckodriver from env/config: {geckodriver_path}")
     else:
-        # Try webdriver-manager, fall back to cached driver on API errors
-        try:
-            service = FirefoxService(GeckoDriverManager().install())
-        except Exception as e:
-            error_msg = str(e)
-            if "rate limit" in error_msg.lower() or "API" in error_msg:
-                logger.warning(f"GitHub API error: {e}")
-                logger.info("Falling back to cached geckodriver...")
-                cached_path = _find_cached_geckodriver()
-                if cached_path:
-                    logger.info(f"Using cached geckodriver: {cached_path}")
-                    service = FirefoxService(cached_path)
-                else:
-                    raise RuntimeError(
-                        "GitHub API rate limit exceeded and no cached geckodriver found. "
-                        "Set 'geckodriver_path' in config or wait for rate limit reset."
-                    ) from e
-            else:
-                raise
+        geckodriver_path = _install_geckodriver()
+
+    # geckodriver creates a fresh temporary profile per session; browser.profile_root
+    # lets it live on fast local storage (e.g. a tmpfs) instead of the default tmp dir
+    profile_root = browser_config.get("profile_root")
+    if profile_root:
+        profile_root = _resolve_dir(str(profile_root))
+        service = FirefoxService(geckodriver_path, service_args=["--profile-root", profile_root])
+        logger.debug(f"geckodriver profile root: {profile_root}")
+    else:
+        service = FirefoxService(geckodriver_path)
 
     driver = webdriver.Firefox(service=service, options=options)
 
-    # Configure timeouts
-    implicit_wait = browser_config.get("implicit_wait", 10)
+    # Configure timeouts. Implicit wait defaults to 0: every lookup that may need
+    # to wait uses an explicit WebDriverWait, and a non-zero implicit wait would
+    # stall each missing-element probe for the full duration.
+    implicit_wait = browser_config.get("implicit_wait", 0)
     page_load_timeout = browser_config.get("page_load_timeout", 30)
 
     driver.implicitly_wait(implicit_wait)
     driver.set_page_load_timeout(page_load_timeout)
 
+    poll_frequency = browser_config.get("poll_frequency", DEFAULT_POLL_FREQUENCY)
+    _POLL_FREQUENCIES[driver] = max(poll_frequency, MIN_POLL_FREQUENCY)
+
     logger.info("Firefox WebDriver initialized successfully")
     return driver
 
@@ -164,16 +340,20 @@ def browser_session(
     headless: bool = True,
     download_dir: str | None = None,
     config: dict | None = None,
+    pool: "BrowserPool | None" = None,
 ):
     """
     Context manager for browser sessions with automatic cleanup.
 
     Ensures the browser is properly closed even if exceptions occur.
+    When a pool is given, a driver is leased from it and returned to the
+    pool afterwards instead of being quit.
 
     Args:
         headless: Run browser without visible window
         download_dir: Directory for downloaded files
         config: Optional configuration dict
+        pool: Optional BrowserPool to lease a long-lived driver from
 
     Yields:
         Configured Firefox WebDriver instance
@@ -183,6 +363,11 @@ def browser_session(
         ...     driver.get("https://cluspro.bu.edu")
         ...     # Browser automatically closed after this block
     """
+    if pool is not None:
+        with pool.lease() as driver:
+            yield driver
+        return
+
     driver = create_browser(headless=headless, download_dir=download_dir, config=config)
     try:
         yield driver
@@ -191,13 +376,17 @@ def browser_session(
         driver.quit()
 
 
-def wait_for_element(driver: webdriver.Firefox, timeout: int = 10):
+def wait_for_element(
+    driver: webdriver.Firefox, timeout: int = 10, poll_frequency: float | None = None
+):
     """
     Create a WebDriverWait instance for explicit waits.
 
     Args:
         driver: WebDriver instance
         timeout: Maximum wait time in seconds
+        poll_frequency: Seconds between condition checks (default: the driver's
+                        browser.poll_frequency, 0.1; Selenium's default is 0.5)
 
     Returns:
         WebDriverWait instance
@@ -208,10 +397,42 @@ def wait_for_element(driver: webdriver.Firefox, timeout: int = 10):
         >>> wait = wait_for_element(driver, timeout=15)
         >>> element = wait.until(EC.presence_of_element_located((By.ID, "myid")))
     """
-    return WebDriverWait(driver, timeout)
+    if poll_frequency is None:
+        poll_frequency = _POLL_FREQUENCIES.get(driver, DEFAULT_POLL_FREQUENCY)
+    return WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
+
 
+def _reload_before_retry(retry_state: RetryCallState) -> None:
+    """
+    Reload the current page in the same browser before a page step is retried.
 
-@retry_browser
+    Uses a GET of the current URL rather than refresh() so a failed form
+    POST is never resubmitted.
+    """
+    # Page steps take the driver first, positionally or as driver=...
+    driver = retry_state.args[0] if retry_state.args else retry_state.kwargs.get("driver")
+    if driver is None:
+        logger.debug("No driver to reload before retry")
+        return
+
+    try:
+        driver.get(driver.current_url)
+    except WebDriverException as e:
+        logger.debug(f"Could not reload page before retry: {e}")
+
+
+# Page steps retry in the same browser after a reload, with short backoff
+# (0.5 s, then 1 s) instead of restarting Firefox
+retry_page_step = create_retry_decorator(
+    max_attempts=3,
+    min_wait=0.25,
+    max_wait=1,
+    multiplier=0.5,
+    before_retry=_reload_before_retry,
+)
+
+
+@retry_page_step
 def click_guest_login(driver: webdriver.Firefox) -> None:
     """
     Click the guest login link on ClusPro pages.
@@ -222,20 +443,47 @@ def click_guest_login(driver: webdriver.Firefox) -> None:
     Args:
         driver: WebDriver instance on a ClusPro page
     """
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.support import expected_conditions as EC
 
     wait = wait_for_element(driver, timeout=15)
-    guest_link = wait.until(
-        EC.element_to_be_clickable(
-            (By.LINK_TEXT, "Use the server without the benefits of your own account")
-        )
-    )
+    guest_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, GUEST_LOGIN_TEXT)))
     guest_link.click()
     logger.debug("Clicked guest login link")
 
 
-@retry_browser
+def is_logged_out(driver: webdriver.Firefox) -> bool:
+    """
+    Check whether ClusPro is asking this browser to log in (again).
+
+    An expired session lands on login.php, or on a page offering the guest
+    login link, instead of the requested content.
+
+    Args:
+        driver: WebDriver instance on a ClusPro page
+
+    Returns:
+        True if the page is a login prompt
+    """
+    if "/login.php" in driver.current_url:
+        return True
+    return len(driver.find_elements(By.LINK_TEXT, GUEST_LOGIN_TEXT)) > 0
+
+
+def _login_outcome(driver: webdriver.Firefox) -> bool | str:
+    """
+    WebDriverWait condition for a submitted login form.
+
+    Returns:
+        True once the browser has left login.php, the error message if the
+        page shows one, or False to keep polling
+    """
+    errors = driver.find_elements(By.CSS_SELECTOR, ".error")
+    if errors:
+        return errors[0].text or "unknown error"
+    return "/login.php" not in driver.current_url
+
+
+@retry_page_step
 def perform_login(driver: webdriver.Firefox, credentials: Credentials) -> None:
     """
     Perform account login on ClusPro login page.
@@ -255,10 +503,7 @@ def perform_login(driver: webdriver.Firefox, credentials: Credentials) -> None:
         >>> creds = Credentials("user", "pass", CredentialSource.ENVIRONMENT)
         >>> perform_login(driver, creds)
     """
-    import time
-
-    from selenium.common.exceptions import NoSuchElementException
-    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import TimeoutException
     from selenium.webdriver.support import expected_conditions as EC
 
     login_url = "https://cluspro.bu.edu/login.php"
@@ -275,32 +520,32 @@ def perform_login(driver: webdriver.Firefox, credentials: Credentials) -> None:
     username_field.clear()
     username_field.send_keys(credentials.username)
 
-    # Fill password
+    # Fill password (same form as the username field, so already present)
     password_field = driver.find_element(By.ID, "password")
     password_field.clear()
     password_field.send_keys(credentials.password)
 
     # Click login button
-    login_button = driver.find_element(By.XPATH, "//input[@name='action'][@value='Login']")
+    login_button = wait.until(EC.element_to_be_clickable(LOGIN_SUBMIT))
     login_button.click()
     logger.debug("Submitted login form")
 
-    # Wait for page to load
-    time.sleep(2)
+    # Wait for the redirect or an error message instead of a fixed delay
+    try:
+        outcome = wait.until(_login_outcome)
+    except TimeoutException:
+        outcome = None
 
     # Check for login error on page
-    try:
-        error_elem = driver.find_element(By.CLASS_NAME, "error")
-        error_text = error_elem.text
-        raise AuthenticationError(f"Login failed: {error_text}")
-    except NoSuchElementException:
-        pass  # No error element, continue
-
-    # Verify redirect to home.php (successful login)
-    if "/home.php" not in driver.current_url and "/login.php" in driver.current_url:
+    if isinstance(outcome, str):
+        raise AuthenticationError(f"Login failed: {outcome}")
+
+    # Verify redirect to home.php (successful login). current_url is a WebDriver
+    # round trip, so read it once.
+    current_url = driver.current_url
+    if "/home.php" not in current_url and "/login.php" in current_url:
         raise AuthenticationError(
-            f"Login may have failed. Expected redirect to /home.php, "
-            f"but still on {driver.current_url}"
+            f"Login may have failed. Expected redirect to /home.php, but still on {current_url}"
         )
 
     logger.info(f"Logged in as: {credentials.username}")
@@ -341,3 +586,62 @@ def authenticate(
     else:
         logger.debug(f"Using account login (source: {credentials.source.value})")
         perform_login(driver, credentials)
+
+
+def create_http_session(
+    headless: bool = True,
+    config: dict | None = None,
+    credentials: Credentials | None = None,
+    force_guest: bool = False,
+    pool_size: int = 10,
+    login_url: str | None = None,
+) -> requests.Session:
+    """
+    Log in through a browser once and return an authenticated HTTP session.
+
+    The browser logs in on login_url and that host's cookies are copied into
+    a connection-pooled requests.Session, so follow-up page fetches skip
+    Selenium entirely. Pass a URL on the host the session will fetch from:
+    ClusPro serves pages from more than one domain and cookies do not carry
+    across them.
+
+    Args:
+        headless: Run the login browser in headless mode
+        config: Optional configuration dict
+        credentials: Optional credentials for account login
+        force_guest: Force guest mode even if credentials provided
+        pool_size: Number of pooled connections per host
+        login_url: Page to log in on (default: the ClusPro home page)
+
+    Returns:
+        requests.Session carrying the login host's ClusPro cookies
+    """
+    if config is None:
+        config = load_config()
+
+    if login_url is None:
+        urls = config.get("cluspro", {}).get("urls", {})
+        login_url = urls.get("home", "https://cluspro.bu.edu/home.php")
+    login_host = urlparse(login_url).hostname or ""
+
+    with browser_session(headless=headless, config=config) as driver:
+        driver.get(login_url)
+        authenticate(driver, credentials=credentials, force_guest=force_guest)
+        cookies = driver.get_cookies()
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            # Host-only cookies come back without a domain; pin them to the login host
+            domain=cookie.get("domain") or login_host,
+            path=cookie.get("path", "/"),
+        )
+
+    logger.debug(f"HTTP session created with {len(cookies)} cookies")
+    return session
@@ -0,0 +1,181 @@
+"""
+Browser pool module for ClusPro automation.
+
+Keeps long-lived Firefox instances around so repeated queue/results polls
+pay browser startup and login once instead of on every call.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from selenium import webdriver
+
+from cluspro.auth import Credentials
+from cluspro.browser import authenticate, create_browser, is_logged_out
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Pool of reusable, already-authenticated Firefox WebDriver instances.
+
+    Drivers are created lazily up to ``size`` and handed out with
+    ``acquire()``/``release()`` or the ``lease()`` context manager. A driver
+    that raised while leased is quit and replaced on the next acquire.
+
+    Example:
+        >>> with BrowserPool(size=1) as pool:
+        ...     for _ in range(10):
+        ...         df = get_queue_status(filter_pattern="bb-.*", pool=pool)
+        ...         time.sleep(60)
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        headless: bool = True,
+        download_dir: str | None = None,
+        config: dict | None = None,
+    ):
+        """
+        Initialize an empty pool.
+
+        Args:
+            size: Maximum number of browsers kept alive
+            headless: Run browsers without visible window
+            download_dir: Directory for downloaded files
+            config: Optional configuration dict
+        """
+        self.size = size
+        self.headless = headless
+        self.download_dir = download_dir
+        self.config = config
+
+        self._idle: queue.Queue[webdriver.Firefox] = queue.Queue()
+        self._drivers: list[webdriver.Firefox] = []
+        self._authenticated: set[int] = set()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> webdriver.Firefox:
+        """
+        Take a driver from the pool, creating one if below capacity.
+
+        Args:
+            timeout: Seconds to wait for a free driver (None waits forever)
+
+        Returns:
+            Firefox WebDriver instance
+
+        Raises:
+            queue.Empty: If no driver became free within timeout
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._drivers) < self.size:
+                driver = create_browser(
+                    headless=self.headless, download_dir=self.download_dir, config=self.config
+                )
+                self._drivers.append(driver)
+                logger.debug(f"Browser pool grew to {len(self._drivers)}/{self.size}")
+                return driver
+
+        return self._idle.get(timeout=timeout)
+
+    def release(self, driver: webdriver.Firefox) -> None:
+        """Return a driver to the pool."""
+        self._idle.put(driver)
+
+    def discard(self, driver: webdriver.Firefox) -> None:
+        """Quit a broken driver and free its slot."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._authenticated.discard(id(driver))
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting discarded browser: {e}")
+
+    @contextmanager
+    def lease(self) -> Iterator[webdriver.Firefox]:
+        """
+        Context manager that acquires a driver and returns it afterwards.
+
+        Yields:
+            Firefox WebDriver instance
+        """
+        driver = self.acquire()
+        try:
+            yield driver
+        except BaseException:
+            self.discard(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def authenticate(
+        self,
+        driver: webdriver.Firefox,
+        credentials: Credentials | None = None,
+        force_guest: bool = False,
+    ) -> bool:
+        """
+        Authenticate a pooled driver unless it is still logged in.
+
+        A driver that logged in before is checked for a login prompt, so a
+        ClusPro session that expired in a long-lived pool logs in again.
+
+        Args:
+            driver: Driver obtained from this pool
+            credentials: Optional credentials for account login
+            force_guest: Force guest mode even if credentials provided
+
+        Returns:
+            True if the driver logged in during this call (and may have
+            left the page it was on)
+        """
+        if id(driver) in self._authenticated:
+            if not is_logged_out(driver):
+                return False
+            logger.info("ClusPro session expired, logging in again")
+
+        authenticate(driver, credentials=credentials, force_guest=force_guest)
+        self._authenticated.add(id(driver))
+        return True
+
+    def shutdown(self) -> None:
+        """Quit every browser owned by the pool."""
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._authenticated.clear()
+
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting pooled browser: {e}")
+
+        logger.debug(f"Browser pool shut down ({len(drivers)} browsers closed)")
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+__all__ = [
+    "BrowserPool",
+]
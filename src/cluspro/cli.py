@@ -4,12 +4,13 @@ Command-line interface for ClusPro automation.
 Provides CLI commands for all ClusPro automation operations.
 """
 
+import logging
+import re
 import sys
+from typing import TYPE_CHECKING
 
 import click
-import pandas as pd
 
-from cluspro.auth import get_credentials
 from cluspro.utils import (
     expand_sequences,
     group_sequences,
@@ -17,6 +18,84 @@ from cluspro.utils import (
     setup_logging,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Rows of a result table printed to the terminal
+MAX_DISPLAY_ROWS = 50
+
+# Tables longer than this are printed as tab-separated text instead of aligned
+TSV_DISPLAY_ROWS = 200
+
+# Column layout of the `jobs list` table
+JOBS_ROW_FMT = "{:<6} | {:<25} | {:<12} | {:<12} | {:<20}"
+JOBS_HEADER = JOBS_ROW_FMT.format("ID", "Name", "ClusPro ID", "Status", "Submitted")
+
+# Column layout of the `validate` table and how many ranked rows it shows
+VALIDATE_ROW_FMT = "{:<6}{:<20}{:<18}{:<10}{:<8.1f}{:<8.1f}"
+VALIDATE_HEADER = f"{'Rank':<6}{'Target':<20}{'Model':<18}{'Clashes':<10}{'EC%':<8}{'Score':<8}"
+VALIDATE_DISPLAY_ROWS = 20
+
+# Status updates `jobs resume` buffers before writing them in one transaction
+STATUS_FLUSH_SIZE = 50
+
+# Pure string helpers that need neither the config file nor credentials
+OFFLINE_COMMANDS = frozenset({"expand", "compress"})
+
+
+def _echo_table(df: "pd.DataFrame") -> None:
+    """
+    Print a DataFrame, switching to tab-separated output for long tables.
+
+    to_string() measures and pads every cell in Python; to_csv() writes
+    through pandas' C writer, which matters once tables run to hundreds of rows.
+    """
+    if len(df) > TSV_DISPLAY_ROWS:
+        click.echo(df.to_csv(sep="\t", index=False), nl=False)
+    else:
+        click.echo(df.to_string(index=False))
+
+
+def _from_daemon(ctx, method: str, params: dict, headless: bool) -> "pd.DataFrame | None":
+    """
+    Answer a queue/results request from a running daemon, if it matches this run.
+
+    Returns None (so the caller starts its own browser) when no daemon is
+    running or it was started with another login, config or headless setting.
+    """
+    from cluspro import daemon
+
+    if not daemon.is_running():
+        return None
+
+    caller = daemon.identity(
+        ctx.obj["config"],
+        ctx.obj.get("credentials"),
+        ctx.obj.get("force_guest", False),
+        headless,
+    )
+    try:
+        rows = daemon.call(method, params, caller=caller)
+    except daemon.DaemonMismatchError:
+        logger.info("Daemon runs with a different login or config, starting a browser")
+        return None
+
+    import pandas as pd
+
+    return pd.DataFrame(rows)
+
+
+def _check_pattern(ctx, param, value: str | None) -> str | None:
+    """Reject an invalid --pattern regex before any browser is started."""
+    if value is not None:
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise click.BadParameter(f"invalid regex: {e}") from e
+    return value
+
 
 @click.group()
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose output")
@@ -71,17 +150,24 @@ def main(ctx, verbose: bool, quiet: bool, config: str | None, guest: bool, login
 
     setup_logging(level=level)
 
+    ctx.obj["verbose"] = verbose
+    if ctx.invoked_subcommand in OFFLINE_COMMANDS:
+        return
+
     # Load config
     cfg = load_config(config)
     ctx.obj["config"] = cfg
-    ctx.obj["verbose"] = verbose
     ctx.obj["force_guest"] = guest
 
     # Handle credentials
     if guest:
         # Guest mode forced, no credentials needed
         ctx.obj["credentials"] = None
-    elif login:
+        return
+
+    from cluspro.auth import get_credentials
+
+    if login:
         # Account login forced, get credentials (prompt if needed)
         creds = get_credentials(config=cfg, interactive=True)
         if creds is None:
@@ -178,7 +264,7 @@ def submit_batch_cmd(
             force_guest=ctx.obj.get("force_guest", False),
         )
 
-        success = len(results[results["status"] == "success"])
+        success = int((results["status"] == "success").sum())
         failed = len(results) - success
 
         click.echo(f"Submitted: {success} successful, {failed} failed")
@@ -210,13 +296,13 @@ def dry_run_cmd(ctx, input_file: str):
     Example:
       cluspro dry-run -i jobs.csv
     """
-    from cluspro.submit import dry_run
+    from cluspro.submit import dry_run, read_jobs_csv
 
     try:
-        jobs = pd.read_csv(input_file)
+        jobs = read_jobs_csv(input_file)
         results = dry_run(jobs, output=True)
 
-        valid = len(results[results["valid"]])
+        valid = int(results["valid"].sum())
         invalid = len(results) - valid
 
         click.echo(f"\nSummary: {valid} valid, {invalid} invalid")
@@ -233,7 +319,7 @@ def dry_run_cmd(ctx, input_file: str):
 
 @main.command()
 @click.option("-u", "--user", help="Filter by username")
-@click.option("-p", "--pattern", help="Filter by job name pattern (regex)")
+@click.option("-p", "--pattern", callback=_check_pattern, help="Filter by job name pattern (regex)")
 @click.option("--no-headless", is_flag=True, help="Show browser window")
 @click.option("-o", "--output", type=click.Path(), help="Output CSV file")
 @click.pass_context
@@ -241,21 +327,28 @@ def queue(ctx, user: str | None, pattern: str | None, no_headless: bool, output:
     """
     Check ClusPro job queue status.
 
+    A running `cluspro daemon` answers instead of a new browser, but only
+    if it was started with the same login (--guest/--login), --config and
+    --no-headless setting as this command.
+
     \b
     Example:
       cluspro queue --user piper --pattern "bb-.*"
     """
-    from cluspro.queue import get_queue_status
-
     try:
-        df = get_queue_status(
-            filter_user=user,
-            filter_pattern=pattern,
-            headless=not no_headless,
-            config=ctx.obj["config"],
-            credentials=ctx.obj.get("credentials"),
-            force_guest=ctx.obj.get("force_guest", False),
-        )
+        params = {"filter_user": user, "filter_pattern": pattern}
+        df = _from_daemon(ctx, "queue", params, headless=not no_headless)
+        if df is None:
+            from cluspro.queue import get_queue_status
+
+            df = get_queue_status(
+                filter_user=user,
+                filter_pattern=pattern,
+                headless=not no_headless,
+                config=ctx.obj["config"],
+                credentials=ctx.obj.get("credentials"),
+                force_guest=ctx.obj.get("force_guest", False),
+            )
 
         if df.empty:
             click.echo("Queue is empty (or no matches found)")
@@ -263,7 +356,7 @@ def queue(ctx, user: str | None, pattern: str | None, no_headless: bool, output:
 
         # Display results
         click.echo(f"\nFound {len(df)} jobs in queue:\n")
-        click.echo(df.to_string(index=False))
+        _echo_table(df)
 
         if output:
             df.to_csv(output, index=False)
@@ -280,7 +373,7 @@ def queue(ctx, user: str | None, pattern: str | None, no_headless: bool, output:
 
 
 @main.command()
-@click.option("-p", "--pattern", help="Filter by job name pattern (regex)")
+@click.option("-p", "--pattern", callback=_check_pattern, help="Filter by job name pattern (regex)")
 @click.option("--max-pages", default=50, help="Maximum pages to parse")
 @click.option("--no-headless", is_flag=True, help="Show browser window")
 @click.option("-o", "--output", type=click.Path(), help="Output file for job IDs")
@@ -297,21 +390,28 @@ def results(
     """
     Get completed job results from ClusPro.
 
+    A running `cluspro daemon` answers instead of a new browser, but only
+    if it was started with the same login (--guest/--login), --config and
+    --no-headless setting as this command.
+
     \b
     Example:
       cluspro results --pattern "pad-.*" --output job_ids.txt
     """
-    from cluspro.results import get_finished_jobs
-
     try:
-        df = get_finished_jobs(
-            filter_pattern=pattern,
-            max_pages=max_pages,
-            headless=not no_headless,
-            config=ctx.obj["config"],
-            credentials=ctx.obj.get("credentials"),
-            force_guest=ctx.obj.get("force_guest", False),
-        )
+        params = {"filter_pattern": pattern, "max_pages": max_pages}
+        df = _from_daemon(ctx, "results", params, headless=not no_headless)
+        if df is None:
+            from cluspro.results import get_finished_jobs
+
+            df = get_finished_jobs(
+                filter_pattern=pattern,
+                max_pages=max_pages,
+                headless=not no_headless,
+                config=ctx.obj["config"],
+                credentials=ctx.obj.get("credentials"),
+                force_guest=ctx.obj.get("force_guest", False),
+            )
 
         if df.empty:
             click.echo("No finished jobs found")
@@ -321,8 +421,7 @@ def results(
 
         # Show summary
         if "job_id" in df.columns:
-            job_ids = df["job_id"].dropna().astype(int).tolist()
-            compressed = group_sequences(job_ids)
+            compressed = group_sequences(df["job_id"].dropna().tolist())
             click.echo(f"Job IDs (compressed): {compressed}\n")
 
             if output:
@@ -330,9 +429,11 @@ def results(
                     f.write(compressed)
                 click.echo(f"Job IDs saved to: {output}")
 
-        # Show table
+        # Show table, capped so large result sets don't build a huge string
         display_cols = [c for c in ["job_name", "job_id", "status"] if c in df.columns]
-        click.echo(df[display_cols].to_string(index=False))
+        click.echo(df[display_cols].head(MAX_DISPLAY_ROWS).to_string(index=False))
+        if len(df) > MAX_DISPLAY_ROWS:
+            click.echo(f"...and {len(df) - MAX_DISPLAY_ROWS} more (use --csv for the full list)")
 
         if output_csv:
             df.to_csv(output_csv, index=False)
@@ -344,7 +445,7 @@ def results(
 
 
 @main.command()
-@click.option("-p", "--pattern", help="Filter by job name pattern (regex)")
+@click.option("-p", "--pattern", callback=_check_pattern, help="Filter by job name pattern (regex)")
 @click.option("--max-pages", default=50, help="Maximum pages to parse")
 @click.option("--no-headless", is_flag=True, help="Show browser window")
 @click.pass_context
@@ -426,9 +527,21 @@ def download(ctx, job_id: int, output_dir: str | None, pdb: bool, no_headless: b
 @click.option("--pdb/--no-pdb", default=True, help="Download PDB files")
 @click.option("--no-headless", is_flag=True, help="Show browser window")
 @click.option("--stop-on-error", is_flag=True, help="Stop on first error")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Parallel downloads (default from config download.workers)",
+)
 @click.pass_context
 def download_batch_cmd(
-    ctx, ids: str, output_dir: str | None, pdb: bool, no_headless: bool, stop_on_error: bool
+    ctx,
+    ids: str,
+    output_dir: str | None,
+    pdb: bool,
+    no_headless: bool,
+    stop_on_error: bool,
+    workers: int | None,
 ):
     """
     Download results for multiple jobs.
@@ -449,6 +562,7 @@ def download_batch_cmd(
             config=ctx.obj["config"],
             credentials=ctx.obj.get("credentials"),
             force_guest=ctx.obj.get("force_guest", False),
+            workers=workers,
         )
 
         success = sum(1 for r in results.values() if r["status"] == "success")
@@ -478,6 +592,12 @@ def download_batch_cmd(
 @click.option("-s", "--source-dir", type=click.Path(exists=True), help="Source directory")
 @click.option("-t", "--target-dir", type=click.Path(), help="Target directory")
 @click.option("--pdb/--no-pdb", default=True, help="Include PDB files")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Parallel copies (default from config organize.workers)",
+)
 @click.pass_context
 def organize(
     ctx,
@@ -485,6 +605,7 @@ def organize(
     source_dir: str | None,
     target_dir: str | None,
     pdb: bool,
+    workers: int | None,
 ):
     """
     Organize downloaded results using mapping file.
@@ -505,6 +626,7 @@ def organize(
             target_dir=target_dir,
             include_pdb=pdb,
             config=ctx.obj["config"],
+            workers=workers,
         )
 
         success = sum(1 for r in results.values() if r["status"] == "success")
@@ -539,7 +661,7 @@ def list_organized(ctx, target_dir: str | None):
 
         click.echo(f"\nFound {len(df)} result directories:\n")
         display_cols = ["name", "has_pdb", "has_csv", "pdb_count", "csv_count"]
-        click.echo(df[display_cols].to_string(index=False))
+        _echo_table(df[display_cols])
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -563,7 +685,7 @@ def expand(sequence: str):
     """
     try:
         ids = expand_sequences(sequence)
-        click.echo(",".join(str(i) for i in ids))
+        click.echo(",".join(map(str, ids)))
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -580,7 +702,7 @@ def compress(ids: tuple[int, ...]):
       cluspro compress 1154309 1154310 1154311 1154315
     """
     try:
-        compressed = group_sequences(list(ids))
+        compressed = group_sequences(ids)
         click.echo(compressed)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -595,7 +717,12 @@ def config(ctx):
     """
     import yaml
 
-    click.echo(yaml.dump(ctx.obj["config"], default_flow_style=False))
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+
+    click.echo(yaml.dump(ctx.obj["config"], Dumper=Dumper, default_flow_style=False))
 
 
 # ============================================================================
@@ -710,25 +837,30 @@ def validate(
 
         # Display summary
         click.echo(f"\nValidated {len(results)} targets:")
-        click.echo("-" * 80)
-        click.echo(f"{'Rank':<6}{'Target':<20}{'Model':<18}{'Clashes':<10}{'EC%':<8}{'Score':<8}")
-        click.echo("-" * 80)
-
-        for i, r in enumerate(results[:20], 1):  # Show top 20
-            if r.error is None:
-                click.echo(
-                    f"{i:<6}{r.target:<20}{r.model:<18}{r.clashes:<10}{r.ec_pct:<8.1f}{r.validity_score:<8.1f}"
-                )
 
-        if len(results) > 20:
-            click.echo(f"... and {len(results) - 20} more")
+        lines = ["-" * 80, VALIDATE_HEADER, "-" * 80]
+        lines.extend(
+            VALIDATE_ROW_FMT.format(i, r.target, r.model, r.clashes, r.ec_pct, r.validity_score)
+            for i, r in enumerate(results[:VALIDATE_DISPLAY_ROWS], 1)
+            if r.error is None
+        )
+        if len(results) > VALIDATE_DISPLAY_ROWS:
+            lines.append(f"... and {len(results) - VALIDATE_DISPLAY_ROWS} more")
+        click.echo("\n".join(lines))
 
         # Statistics
         valid_results = [r for r in results if r.error is None]
         if valid_results:
-            avg_ec = sum(r.ec_pct for r in valid_results) / len(valid_results)
-            zero_clash = sum(1 for r in valid_results if r.clashes == 0)
-            high_ec = sum(1 for r in valid_results if r.ec_pct >= 90)
+            import numpy as np  # already loaded by cluspro.validate
+
+            # One pass to collect, then array reductions for every statistic
+            count = len(valid_results)
+            ec = np.fromiter((r.ec_pct for r in valid_results), dtype=np.float64, count=count)
+            clashes = np.fromiter((r.clashes for r in valid_results), dtype=np.int64, count=count)
+
+            avg_ec = float(ec.mean())
+            zero_clash = int((clashes == 0).sum())
+            high_ec = int((ec >= 90).sum())
 
             click.echo("\nSummary:")
             click.echo(f"  Average EC%: {avg_ec:.1f}%")
@@ -772,53 +904,70 @@ def jobs(ctx):
     help="Filter by status",
 )
 @click.option("--batch", "batch_id", help="Filter by batch ID")
+@click.option("-p", "--pattern", callback=_check_pattern, help="Filter by job name pattern (regex)")
 @click.option("--limit", default=50, help="Maximum records to show")
+@click.option(
+    "--before-id",
+    type=int,
+    help="Only show jobs with a smaller ID (next page after the last ID shown)",
+)
 @click.pass_context
-def jobs_list(ctx, status: str | None, batch_id: str | None, limit: int):
+def jobs_list(
+    ctx,
+    status: str | None,
+    batch_id: str | None,
+    pattern: str | None,
+    limit: int,
+    before_id: int | None,
+):
     """
-    List job records from database.
+    List job records from database, newest first.
 
     \b
     Example:
       cluspro jobs list --status pending
-      cluspro jobs list --batch my-batch-001
+      cluspro jobs list --batch my-batch-001 --status failed
+      cluspro jobs list --pattern "bb-.*"
+      cluspro jobs list --before-id 120
     """
     from cluspro.database import JobDatabase, JobStatus
 
     try:
         db = JobDatabase()
+        ctx.call_on_close(db.close)
+
+        # Format rows straight off the cursor; the table is written with a single echo
+        rows = []
+        last_id = None
+        for job in db.iter_jobs(
+            batch_id=batch_id,
+            status=JobStatus(status) if status else None,
+            limit=limit,
+            before_id=before_id,
+            name_pattern=pattern,
+        ):
+            # isoformat is a C fast path; strftime parses its format string per call
+            submitted = job.submitted_at.isoformat(" ", "minutes") if job.submitted_at else "-"
+            rows.append(
+                JOBS_ROW_FMT.format(
+                    str(job.id),
+                    job.job_name[:25],
+                    str(job.cluspro_job_id or "-"),
+                    job.status.value,
+                    submitted,
+                )
+            )
+            last_id = job.id
 
-        if batch_id:
-            jobs_list = db.get_jobs_by_batch(batch_id)
-        elif status:
-            jobs_list = db.get_all_jobs(status=JobStatus(status), limit=limit)
-        else:
-            jobs_list = db.get_all_jobs(limit=limit)
-
-        if not jobs_list:
+        if not rows:
             click.echo("No jobs found")
             return
 
-        click.echo(f"\nFound {len(jobs_list)} jobs:\n")
-
-        # Format as table
-        headers = ["ID", "Name", "ClusPro ID", "Status", "Submitted"]
-        widths = [6, 25, 12, 12, 20]
-
-        header_line = " | ".join(h.ljust(w) for h, w in zip(headers, widths))
-        click.echo(header_line)
-        click.echo("-" * len(header_line))
+        click.echo(f"\nFound {len(rows)} jobs:\n")
+        click.echo("\n".join([JOBS_HEADER, "-" * len(JOBS_HEADER), *rows]))
 
-        for job in jobs_list:
-            submitted = job.submitted_at.strftime("%Y-%m-%d %H:%M") if job.submitted_at else "-"
-            row = [
-                str(job.id).ljust(6),
-                job.job_name[:25].ljust(25),
-                str(job.cluspro_job_id or "-").ljust(12),
-                job.status.value.ljust(12),
-                submitted.ljust(20),
-            ]
-            click.echo(" | ".join(row))
+        if len(rows) == limit:
+            click.echo(f"\nMore jobs may exist: use --before-id {last_id}")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -829,28 +978,36 @@ def jobs_list(ctx, status: str | None, batch_id: str | None, limit: int):
 @click.option("--batch", "batch_id", required=True, help="Batch ID to resume")
 @click.option("--include-failed", is_flag=True, help="Also retry failed jobs")
 @click.option("--no-headless", is_flag=True, help="Show browser window")
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Parallel browsers (default from config batch.browser_workers)",
+)
 @click.pass_context
-def jobs_resume(ctx, batch_id: str, include_failed: bool, no_headless: bool):
+def jobs_resume(ctx, batch_id: str, include_failed: bool, no_headless: bool, workers: int | None):
     """
     Resume an interrupted batch submission.
 
+    Jobs are submitted in parallel through pooled browsers that each log
+    in once; status updates are written to the database in batches.
+
     \b
     Example:
       cluspro jobs resume --batch my-batch-001
       cluspro jobs resume --batch my-batch-001 --include-failed
     """
-    from cluspro.database import JobDatabase, JobStatus
-    from cluspro.submit import submit_job
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from cluspro.browser_pool import BrowserPool
+    from cluspro.database import JobDatabase, JobStatus, StatusUpdate
+    from cluspro.submit import DEFAULT_BROWSER_WORKERS, submit_job
 
     try:
         db = JobDatabase()
+        ctx.call_on_close(db.close)
 
-        # Get pending jobs
-        pending = db.get_pending_jobs(batch_id=batch_id)
-
-        if include_failed:
-            failed = db.get_failed_jobs(batch_id=batch_id)
-            pending.extend(failed)
+        pending = db.get_resumable_jobs(batch_id, include_failed=include_failed)
 
         if not pending:
             click.echo(f"No pending jobs found for batch: {batch_id}")
@@ -858,30 +1015,74 @@ def jobs_resume(ctx, batch_id: str, include_failed: bool, no_headless: bool):
 
         click.echo(f"Resuming {len(pending)} jobs from batch: {batch_id}")
 
+        config = ctx.obj["config"]
+        if workers is None:
+            workers = config.get("batch", {}).get("browser_workers", DEFAULT_BROWSER_WORKERS)
+        workers = max(1, min(workers, len(pending)))
+
         success = 0
-        for job in pending:
-            assert job.id is not None, "Job from database must have an ID"
-            try:
-                cluspro_id = submit_job(
+        updates: list[StatusUpdate] = []
+        # Executor exits (and drains) before the pool shuts its browsers down
+        with (
+            BrowserPool(size=workers, headless=not no_headless, config=config) as pool,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            futures = {
+                executor.submit(
+                    submit_job,
                     job_name=job.job_name,
                     receptor_pdb=job.receptor_pdb,
                     ligand_pdb=job.ligand_pdb,
                     server=job.server,
                     headless=not no_headless,
-                    config=ctx.obj["config"],
+                    config=config,
                     credentials=ctx.obj.get("credentials"),
                     force_guest=ctx.obj.get("force_guest", False),
-                )
-                db.update_status(
-                    job.id,
-                    JobStatus.SUBMITTED,
-                    cluspro_job_id=int(cluspro_id) if cluspro_id else None,
-                )
-                success += 1
-                click.echo(f"  Submitted: {job.job_name}")
-            except Exception as e:
-                db.update_status(job.id, JobStatus.FAILED, error_message=str(e))
-                click.echo(f"  Failed: {job.job_name} - {e}", err=True)
+                    pool=pool,
+                ): job
+                for job in pending
+            }
+
+            def record(future) -> None:
+                nonlocal success
+                job = futures.pop(future)
+                assert job.id is not None, "Job from database must have an ID"
+                try:
+                    cluspro_id = future.result()
+                    updates.append(
+                        (
+                            job.id,
+                            JobStatus.SUBMITTED,
+                            int(cluspro_id) if cluspro_id else None,
+                            None,
+                        )
+                    )
+                    success += 1
+                    click.echo(f"  Submitted: {job.job_name}")
+                except Exception as e:
+                    updates.append((job.id, JobStatus.FAILED, None, str(e)))
+                    click.echo(f"  Failed: {job.job_name} - {e}", err=True)
+
+                if len(updates) >= STATUS_FLUSH_SIZE:
+                    db.update_status_many(updates)
+                    updates.clear()
+
+            # Database writes stay on this thread; whatever is buffered is
+            # still written if the loop is interrupted
+            try:
+                try:
+                    for future in as_completed(list(futures)):
+                        record(future)
+                except BaseException:
+                    # Drop the queued jobs so they are not posted after the
+                    # loop stopped, but record the ones already in flight so
+                    # the next resume does not submit them again
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    for future in as_completed([f for f in futures if not f.cancelled()]):
+                        record(future)
+                    raise
+            finally:
+                db.update_status_many(updates)
 
         click.echo(f"\nCompleted: {success}/{len(pending)} jobs submitted")
 
@@ -905,6 +1106,7 @@ def jobs_status(ctx, batch_id: str):
 
     try:
         db = JobDatabase()
+        ctx.call_on_close(db.close)
         summary = db.get_batch_summary(batch_id)
 
         click.echo(f"\nBatch: {batch_id}")
@@ -919,5 +1121,83 @@ def jobs_status(ctx, batch_id: str):
         sys.exit(1)
 
 
+# ============================================================================
+# Daemon Commands
+# ============================================================================
+
+
+@main.group()
+@click.pass_context
+def daemon(ctx):
+    """
+    Keep a logged-in browser running for fast queue/results calls.
+
+    \b
+    Commands:
+      start   Run the daemon in the foreground
+      stop    Stop a running daemon
+      status  Check whether a daemon is running
+    """
+    pass
+
+
+@daemon.command("start")
+@click.option("--no-headless", is_flag=True, help="Show browser window")
+@click.pass_context
+def daemon_start(ctx, no_headless: bool):
+    """
+    Run the browser daemon until stopped.
+
+    While it runs, `cluspro queue` and `cluspro results` reuse its browser
+    instead of starting their own.
+
+    \b
+    Example:
+      cluspro daemon start &
+    """
+    from cluspro.daemon import DAEMON_SOCKET, serve
+
+    try:
+        click.echo(f"Daemon listening on {DAEMON_SOCKET} (stop with: cluspro daemon stop)")
+        serve(
+            headless=not no_headless,
+            config=ctx.obj["config"],
+            credentials=ctx.obj.get("credentials"),
+            force_guest=ctx.obj.get("force_guest", False),
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """
+    Stop a running browser daemon.
+    """
+    from cluspro import daemon as daemon_client
+
+    if not daemon_client.is_running():
+        click.echo("No daemon running")
+        return
+
+    daemon_client.call("stop")
+    click.echo("Daemon stopped")
+
+
+@daemon.command("status")
+def daemon_status():
+    """
+    Check whether a browser daemon is running.
+    """
+    from cluspro import daemon as daemon_client
+
+    if daemon_client.is_running():
+        click.echo(f"Daemon running on {daemon_client.DAEMON_SOCKET}")
+    else:
+        click.echo("No daemon running")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,361 @@
+"""
+Browser daemon module for ClusPro automation.
+
+Keeps one logged-in Firefox alive in a background process so repeated
+``cluspro queue`` / ``cluspro results`` calls skip browser startup and
+login. The daemon listens on a Unix socket and answers one JSON request
+per connection:
+
+    {"method": "queue", "params": {"filter_pattern": "bb-.*"}}
+    -> {"result": [{"job_name": ..., ...}, ...]}
+
+CLI commands check for a running daemon with is_running() and fall back to
+launching their own browser when there is none. Requests carry the caller's
+identity() (login, config and headless setting); a daemon started with a
+different one refuses them, and the caller runs its own browser instead.
+
+Example usage:
+    $ cluspro daemon start &
+    $ cluspro queue --pattern "bb-.*"   # served by the daemon
+    $ cluspro daemon stop
+"""
+
+import hashlib
+import json
+import logging
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from cluspro.auth import Credentials
+    from cluspro.browser_pool import BrowserPool
+
+logger = logging.getLogger(__name__)
+
+# Default socket location
+DAEMON_SOCKET = Path.home() / ".cluspro" / "daemon.sock"
+
+# Seconds a client waits for a reply (results may walk many pages)
+DEFAULT_CALL_TIMEOUT = 600
+
+# Seconds is_running waits for the reply to its ping
+PING_TIMEOUT = 2
+
+
+class DaemonError(Exception):
+    """Exception raised when the daemon reports a failed request."""
+
+    pass
+
+
+class DaemonMismatchError(DaemonError):
+    """Exception raised when the daemon runs with another login or config."""
+
+    pass
+
+
+def identity(
+    config: dict | None,
+    credentials: "Credentials | None",
+    force_guest: bool,
+    headless: bool,
+) -> dict[str, Any]:
+    """
+    Describe the login and settings queue/results requests run with.
+
+    Args:
+        config: Configuration dict
+        credentials: Credentials for account login, if any
+        force_guest: Force guest mode even if credentials provided
+        headless: Run the browser without visible window
+
+    Returns:
+        JSON-ready dict: the account user name (None for guest mode), a
+        digest of the config and the headless flag
+    """
+    user = None if force_guest or credentials is None else credentials.username
+    config_json = json.dumps(config or {}, sort_keys=True, default=str)
+    return {
+        "user": user,
+        "config": hashlib.sha256(config_json.encode()).hexdigest(),
+        "headless": headless,
+    }
+
+
+def _records(df: "pd.DataFrame") -> list[dict[str, Any]]:
+    """Convert a DataFrame to JSON-ready rows, with missing values as None."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _handle_queue(server: "_DaemonServer", params: dict[str, Any]) -> list[dict[str, Any]]:
+    from cluspro.queue import get_queue_status
+
+    df = get_queue_status(
+        filter_user=params.get("filter_user"),
+        filter_pattern=params.get("filter_pattern"),
+        config=server.config,
+        credentials=server.credentials,
+        force_guest=server.force_guest,
+        pool=server.pool,
+    )
+    return _records(df)
+
+
+def _handle_results(server: "_DaemonServer", params: dict[str, Any]) -> list[dict[str, Any]]:
+    from cluspro.results import get_finished_jobs
+
+    df = get_finished_jobs(
+        filter_pattern=params.get("filter_pattern"),
+        max_pages=params.get("max_pages", 50),
+        config=server.config,
+        credentials=server.credentials,
+        force_guest=server.force_guest,
+        pool=server.pool,
+    )
+    return _records(df)
+
+
+def _handle_ping(server: "_DaemonServer", params: dict[str, Any]) -> str:
+    return "pong"
+
+
+def _handle_stop(server: "_DaemonServer", params: dict[str, Any]) -> None:
+    # shutdown() blocks until serve_forever() returns, so it cannot run on the
+    # thread that is serving this request
+    threading.Thread(target=server.shutdown, daemon=True).start()
+
+
+METHODS = {
+    "ping": _handle_ping,
+    "queue": _handle_queue,
+    "results": _handle_results,
+    "stop": _handle_stop,
+}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON request per connection."""
+
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # Client closed without sending a request
+            return
+
+        try:
+            request = json.loads(line)
+            handler = METHODS[request["method"]]
+            expected = request.get("identity")
+            if expected is not None and expected != self.server.identity:
+                reply: dict[str, Any] = {
+                    "error": "Daemon runs with a different login or config",
+                    "mismatch": True,
+                }
+            else:
+                reply = {"result": handler(self.server, request.get("params", {}))}
+        except KeyError as e:
+            reply = {"error": f"Unknown or malformed request: {e}"}
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            reply = {"error": str(e)}
+
+        try:
+            self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client disconnected before the reply was sent")
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server holding the shared browser pool and login."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        pool: "BrowserPool",
+        config: dict | None,
+        credentials: "Credentials | None",
+        force_guest: bool,
+        headless: bool,
+    ):
+        self.pool = pool
+        self.config = config
+        self.credentials = credentials
+        self.force_guest = force_guest
+        self.identity = identity(config, credentials, force_guest, headless)
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+def is_running(socket_path: str | Path | None = None) -> bool:
+    """
+    Check whether a daemon is answering on the socket.
+
+    Sends a "ping" request. A daemon still busy with another request (it
+    serves one at a time) accepts the connection but cannot answer within
+    PING_TIMEOUT; it is reported as running.
+
+    Args:
+        socket_path: Daemon socket (default ~/.cluspro/daemon.sock)
+
+    Returns:
+        True if a daemon answered the ping or is busy serving a request
+    """
+    path = Path(socket_path) if socket_path else DAEMON_SOCKET
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(PING_TIMEOUT)
+        try:
+            sock.connect(str(path))
+            sock.sendall(json.dumps({"method": "ping"}).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                reply = json.loads(reader.readline())
+        except TimeoutError:
+            return True
+        except (OSError, ValueError):
+            return False
+
+    return reply.get("result") == "pong"
+
+
+def call(
+    method: str,
+    params: dict[str, Any] | None = None,
+    socket_path: str | Path | None = None,
+    timeout: float = DEFAULT_CALL_TIMEOUT,
+    caller: dict[str, Any] | None = None,
+) -> Any:
+    """
+    Send one request to the daemon and return its result.
+
+    Args:
+        method: Method name ("ping", "queue", "results" or "stop")
+        params: Keyword arguments for the method
+        socket_path: Daemon socket (default ~/.cluspro/daemon.sock)
+        timeout: Seconds to wait for the reply
+        caller: The caller's identity(); the daemon refuses the request
+                unless it was started with the same one
+
+    Returns:
+        The method's result (lists of row dicts for queue/results)
+
+    Raises:
+        DaemonMismatchError: If the daemon's identity differs from caller
+        DaemonError: If the daemon reports an error
+        OSError: If no daemon is listening
+    """
+    path = Path(socket_path) if socket_path else DAEMON_SOCKET
+    message: dict[str, Any] = {"method": method, "params": params or {}}
+    if caller is not None:
+        message["identity"] = caller
+    request = json.dumps(message).encode() + b"\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(request)
+        with sock.makefile("rb") as reader:
+            reply = json.loads(reader.readline())
+
+    if reply.get("mismatch"):
+        raise DaemonMismatchError(reply["error"])
+    if "error" in reply:
+        raise DaemonError(reply["error"])
+    return reply.get("result")
+
+
+def create_server(
+    pool: "BrowserPool",
+    socket_path: str | Path | None = None,
+    config: dict | None = None,
+    credentials: "Credentials | None" = None,
+    force_guest: bool = False,
+    headless: bool = True,
+) -> socketserver.UnixStreamServer:
+    """
+    Bind the daemon socket without starting to serve.
+
+    A leftover socket file from a daemon that is no longer running is
+    removed first.
+
+    Args:
+        pool: Browser pool the daemon's requests lease drivers from
+        socket_path: Socket to listen on (default ~/.cluspro/daemon.sock)
+        config: Optional configuration dict
+        credentials: Optional credentials for account login
+        force_guest: Force guest mode even if credentials provided
+        headless: Whether the pool's browsers run headless
+
+    Returns:
+        Bound server; call serve_forever() to handle requests
+
+    Raises:
+        RuntimeError: If a daemon is already listening on the socket
+    """
+    path = Path(socket_path) if socket_path else DAEMON_SOCKET
+
+    if is_running(path):
+        raise RuntimeError(f"A daemon is already running on {path}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    return _DaemonServer(path, pool, config, credentials, force_guest, headless)
+
+
+def serve(
+    socket_path: str | Path | None = None,
+    headless: bool = True,
+    config: dict | None = None,
+    credentials: "Credentials | None" = None,
+    force_guest: bool = False,
+) -> None:
+    """
+    Run the daemon in the foreground until a "stop" request arrives.
+
+    Args:
+        socket_path: Socket to listen on (default ~/.cluspro/daemon.sock)
+        headless: Run the browser without visible window
+        config: Optional configuration dict
+        credentials: Optional credentials for account login
+        force_guest: Force guest mode even if credentials provided
+    """
+    from cluspro.browser_pool import BrowserPool
+
+    path = Path(socket_path) if socket_path else DAEMON_SOCKET
+
+    with BrowserPool(size=1, headless=headless, config=config) as pool:
+        server = create_server(
+            pool,
+            socket_path=path,
+            config=config,
+            credentials=credentials,
+            force_guest=force_guest,
+            headless=headless,
+        )
+        logger.info(f"Daemon listening on {path}")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+            logger.info("Daemon stopped")
+
+
+__all__ = [
+    "DaemonError",
+    "DaemonMismatchError",
+    "DAEMON_SOCKET",
+    "call",
+    "create_server",
+    "identity",
+    "is_running",
+    "serve",
+]
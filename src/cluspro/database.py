@@ -5,16 +5,20 @@ Provides SQLite-based storage for tracking job submissions,
 status changes, and enabling batch operation resumption.
 """
 
+import itertools
 import logging
 import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
-from cluspro.utils import resolve_path
+from cluspro.utils import compile_name_pattern, resolve_path
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +38,7 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job record dataclass."""
 
@@ -67,6 +71,66 @@ class Job:
         }
 
 
+# Job fields in dataclass order, so _row_to_job can unpack rows positionally
+_SELECT_JOBS = (
+    "SELECT id, job_name, cluspro_job_id, status, receptor_pdb, ligand_pdb, server,"
+    " submitted_at, completed_at, error_message, batch_id FROM jobs"
+)
+
+# Status strings as stored in the database, mapped back to their enum members
+_STATUS_BY_VALUE = {status.value: status for status in JobStatus}
+
+# (job_name, receptor_pdb, ligand_pdb, server, batch_id) for create_jobs
+JobRow = tuple[str, str, str, str, str | None]
+
+# (job_id, status, cluspro_job_id, error_message) for update_status_many
+StatusUpdate = tuple[int, JobStatus, int | None, str | None]
+
+# Local wall-clock time, stamped by SQLite itself (CURRENT_TIMESTAMP is UTC)
+_NOW_SQL = "datetime('now', 'localtime')"
+
+# Status UPDATEs, one per set of columns a status change touches
+_UPDATE_SUBMITTED_SQL = (
+    f"UPDATE jobs SET status = ?, cluspro_job_id = ?, submitted_at = {_NOW_SQL},"
+    f" updated_at = {_NOW_SQL} WHERE id = ?"
+)
+_UPDATE_FINISHED_SQL = (
+    f"UPDATE jobs SET status = ?, completed_at = {_NOW_SQL}, error_message = ?,"
+    f" updated_at = {_NOW_SQL} WHERE id = ?"
+)
+_UPDATE_STATUS_SQL = f"UPDATE jobs SET status = ?, updated_at = {_NOW_SQL} WHERE id = ?"
+
+# Job IDs per update_status_bulk statement, well under SQLite's bound-parameter limit
+BULK_UPDATE_CHUNK = 500
+
+# Rows _iter_query reads per trip to the shared connection
+ITER_FETCH_SIZE = 500
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    """SQLite REGEXP implementation, anchored at the start like re.match."""
+    if value is None:
+        return False
+    compiled = compile_name_pattern(pattern)
+    if isinstance(compiled, str):
+        return value.startswith(compiled)
+    return compiled.match(value) is not None
+
+
+def _name_pattern_clause(pattern: str) -> tuple[str, str]:
+    """
+    Build a WHERE clause matching job names against a --pattern regex.
+
+    A plain "prefix.*" pattern becomes a case-sensitive GLOB prefix test;
+    anything else goes through the REGEXP function.
+    """
+    compiled = compile_name_pattern(pattern)
+    if isinstance(compiled, str):
+        # A literal prefix holds no regex metacharacters, so none of GLOB's *?[
+        return "job_name GLOB ?", compiled + "*"
+    return "job_name REGEXP ?", pattern
+
+
 class JobDatabase:
     """
     SQLite database for job state persistence.
@@ -74,6 +138,10 @@ class JobDatabase:
     Provides methods for creating, updating, and querying job records.
     Enables resumption of interrupted batch operations.
 
+    One connection is opened per instance and shared by all methods (and
+    threads, behind a lock); call close() or use the instance as a context
+    manager to release it.
+
     Example:
         >>> db = JobDatabase()
         >>> job = db.create_job("test-job", "receptor.pdb", "ligand.pdb")
@@ -94,11 +162,45 @@ class JobDatabase:
         self.db_path = resolve_path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Guards the shared connection; reentrant so helpers can nest
+        self._lock = threading.RLock()
+        self._closed = False
+        # Timestamps come back as text and are parsed in _row_to_job; the
+        # declared-type converters would also parse columns Job never reads
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        # With WAL, commits skip the fsync; only a power loss or OS crash (not
+        # a killed process) can roll back the latest ones, and never corrupts
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
         self._init_db()
 
+    def close(self) -> None:
+        """
+        Close the database connection, first letting SQLite refresh its statistics.
+
+        Safe to call more than once (e.g. a with block around an explicit close).
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
+    def __enter__(self) -> "JobDatabase":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._connection() as conn:
+            # WAL lets readers such as `jobs status` run while a resume writes
+            conn.execute("PRAGMA journal_mode=WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -125,6 +227,11 @@ class JobDatabase:
                 CREATE INDEX IF NOT EXISTS idx_jobs_batch_id ON jobs(batch_id)
             """)
 
+            # Covers the per-batch status counts in get_batch_summary
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_batch_status ON jobs(batch_id, status)
+            """)
+
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_jobs_cluspro_id ON jobs(cluspro_job_id)
             """)
@@ -133,19 +240,14 @@ class JobDatabase:
 
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(
-            self.db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-        )
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager for one transaction on the shared connection."""
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
 
     def create_job(
         self,
@@ -184,25 +286,71 @@ class JobDatabase:
         assert job is not None, f"Failed to retrieve job after creation: {job_id}"
         return job
 
+    def create_jobs(self, rows: list[JobRow]) -> list[int]:
+        """
+        Create many job records in a single transaction.
+
+        Args:
+            rows: (job_name, receptor_pdb, ligand_pdb, server, batch_id) tuples
+
+        Returns:
+            IDs of the created jobs, in the order of rows
+        """
+        if not rows:
+            return []
+
+        with self._connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO jobs (job_name, receptor_pdb, ligand_pdb, server, batch_id)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            # The transaction holds the write lock from the first INSERT, so
+            # the AUTOINCREMENT ids it handed out are consecutive
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        logger.debug(f"Created {len(rows)} job records")
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def get_job(self, job_id: int) -> Job | None:
         """Get job by ID."""
         with self._connection() as conn:
-            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            row = conn.execute(f"{_SELECT_JOBS} WHERE id = ?", (job_id,)).fetchone()
 
         return self._row_to_job(row) if row else None
 
     def get_job_by_name(self, job_name: str) -> Job | None:
         """Get job by name."""
         with self._connection() as conn:
-            row = conn.execute("SELECT * FROM jobs WHERE job_name = ?", (job_name,)).fetchone()
+            row = conn.execute(f"{_SELECT_JOBS} WHERE job_name = ?", (job_name,)).fetchone()
 
         return self._row_to_job(row) if row else None
 
+    def job_exists(self, job_name: str) -> bool:
+        """Check whether a job with this name is recorded, without loading it."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM jobs WHERE job_name = ? LIMIT 1", (job_name,)
+            ).fetchone()
+
+        return row is not None
+
+    def get_job_id_by_name(self, job_name: str) -> int | None:
+        """Get the database ID of a job by name, without loading the whole record."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE job_name = ? LIMIT 1", (job_name,)
+            ).fetchone()
+
+        return row[0] if row else None
+
     def get_job_by_cluspro_id(self, cluspro_job_id: int) -> Job | None:
         """Get job by ClusPro job ID."""
         with self._connection() as conn:
             row = conn.execute(
-                "SELECT * FROM jobs WHERE cluspro_job_id = ?", (cluspro_job_id,)
+                f"{_SELECT_JOBS} WHERE cluspro_job_id = ?", (cluspro_job_id,)
             ).fetchone()
 
         return self._row_to_job(row) if row else None
@@ -223,72 +371,169 @@ class JobDatabase:
             cluspro_job_id: ClusPro job ID (if captured)
             error_message: Error message (if failed)
         """
-        now = datetime.now()
+        self.update_status_many([(job_id, status, cluspro_job_id, error_message)])
+        logger.debug(f"Updated job {job_id} status to: {status.value}")
 
-        with self._connection() as conn:
+    def update_status_many(self, updates: list[StatusUpdate]) -> None:
+        """
+        Apply several status updates in one transaction.
+
+        Updates are applied in list order, so a later update for the same
+        job wins. Consecutive rows that need the same UPDATE statement are
+        written with one executemany, and the whole list costs a single commit.
+
+        Args:
+            updates: (job_id, status, cluspro_job_id, error_message) tuples
+        """
+        if not updates:
+            return
+
+        def statement(update: StatusUpdate) -> tuple[str, tuple]:
+            job_id, status, cluspro_job_id, error_message = update
             if status == JobStatus.SUBMITTED:
+                return _UPDATE_SUBMITTED_SQL, (status.value, cluspro_job_id, job_id)
+            if status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return _UPDATE_FINISHED_SQL, (status.value, error_message, job_id)
+            return _UPDATE_STATUS_SQL, (status.value, job_id)
+
+        with self._connection() as conn:
+            # Each statement is compiled once per run of rows that share it
+            for sql, run in itertools.groupby(map(statement, updates), key=itemgetter(0)):
+                conn.executemany(sql, [params for _, params in run])
+
+    def _iter_query(self, sql: str, params: tuple | list = ()) -> Iterator[Job]:
+        """
+        Yield a Job for each row of a _SELECT_JOBS query.
+
+        Rows are fetched ITER_FETCH_SIZE at a time under the lock and yielded
+        after releasing it, so a slow consumer never holds the connection.
+        """
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(ITER_FETCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield self._row_to_job(row)
+        finally:
+            with self._lock:
+                cursor.close()
+
+    def update_status_bulk(
+        self,
+        job_ids: list[int],
+        status: JobStatus,
+        error_message: str | None = None,
+    ) -> None:
+        """
+        Move many jobs to the same status in one transaction.
+
+        Each chunk of BULK_UPDATE_CHUNK ids is a single UPDATE ... WHERE id IN
+        (...). Use update_status_many instead when jobs need their own
+        ClusPro job ID or error message.
+
+        Args:
+            job_ids: Database job IDs
+            status: New status for every job
+            error_message: Error message stored on completed/failed jobs
+        """
+        if not job_ids:
+            return
+
+        if status == JobStatus.SUBMITTED:
+            columns = f"status = ?, submitted_at = {_NOW_SQL}"
+            values: list[Any] = [status.value]
+        elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            columns = f"status = ?, completed_at = {_NOW_SQL}, error_message = ?"
+            values = [status.value, error_message]
+        else:
+            columns = "status = ?"
+            values = [status.value]
+
+        with self._connection() as conn:
+            for start in range(0, len(job_ids), BULK_UPDATE_CHUNK):
+                chunk = job_ids[start : start + BULK_UPDATE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
                 conn.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, cluspro_job_id = ?, submitted_at = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, cluspro_job_id, now, now, job_id),
-                )
-            elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
-                conn.execute(
-                    """
-                    UPDATE jobs
-                    SET status = ?, completed_at = ?, error_message = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (status.value, now, error_message, now, job_id),
-                )
-            else:
-                conn.execute(
-                    """
-                    UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?
-                    """,
-                    (status.value, now, job_id),
+                    f"UPDATE jobs SET {columns}, updated_at = {_NOW_SQL}"
+                    f" WHERE id IN ({placeholders})",
+                    [*values, *chunk],
                 )
 
-        logger.debug(f"Updated job {job_id} status to: {status.value}")
+        logger.debug(f"Updated {len(job_ids)} jobs to status: {status.value}")
 
     def get_pending_jobs(self, batch_id: str | None = None) -> list[Job]:
         """Get all pending jobs, optionally filtered by batch."""
-        with self._connection() as conn:
-            if batch_id:
-                rows = conn.execute(
-                    "SELECT * FROM jobs WHERE status = 'pending' AND batch_id = ?",
-                    (batch_id,),
-                ).fetchall()
-            else:
-                rows = conn.execute("SELECT * FROM jobs WHERE status = 'pending'").fetchall()
-
-        return [self._row_to_job(row) for row in rows]
+        if batch_id:
+            return list(
+                self._iter_query(
+                    f"{_SELECT_JOBS} WHERE status = 'pending' AND batch_id = ?", (batch_id,)
+                )
+            )
+        return list(self._iter_query(f"{_SELECT_JOBS} WHERE status = 'pending'"))
 
     def get_failed_jobs(self, batch_id: str | None = None) -> list[Job]:
         """Get all failed jobs for retry."""
-        with self._connection() as conn:
-            if batch_id:
-                rows = conn.execute(
-                    "SELECT * FROM jobs WHERE status = 'failed' AND batch_id = ?",
-                    (batch_id,),
-                ).fetchall()
-            else:
-                rows = conn.execute("SELECT * FROM jobs WHERE status = 'failed'").fetchall()
+        if batch_id:
+            return list(
+                self._iter_query(
+                    f"{_SELECT_JOBS} WHERE status = 'failed' AND batch_id = ?", (batch_id,)
+                )
+            )
+        return list(self._iter_query(f"{_SELECT_JOBS} WHERE status = 'failed'"))
+
+    def get_resumable_jobs(self, batch_id: str, include_failed: bool = False) -> list[Job]:
+        """
+        Get the jobs of a batch that still need submitting, in one query.
+
+        Args:
+            batch_id: Batch identifier
+            include_failed: Also return failed jobs for retry
 
-        return [self._row_to_job(row) for row in rows]
+        Returns:
+            Pending (and optionally failed) jobs, in creation order
+        """
+        statuses = [JobStatus.PENDING]
+        if include_failed:
+            statuses.append(JobStatus.FAILED)
+        return list(self.iter_batch_jobs(batch_id, statuses))
 
     def get_jobs_by_batch(self, batch_id: str) -> list[Job]:
         """Get all jobs in a batch."""
-        with self._connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM jobs WHERE batch_id = ? ORDER BY id",
-                (batch_id,),
-            ).fetchall()
+        return list(self.iter_batch_jobs(batch_id))
+
+    def iter_batch_jobs(
+        self,
+        batch_id: str,
+        statuses: list[JobStatus] | None = None,
+    ) -> Iterator[Job]:
+        """
+        Yield the jobs of a batch in creation order.
 
-        return [self._row_to_job(row) for row in rows]
+        Like iter_jobs, rows are read in chunks as they are consumed, so a
+        large batch is never held in memory at once.
+
+        Args:
+            batch_id: Batch identifier
+            statuses: Only jobs with one of these statuses (default: all)
+
+        Yields:
+            Matching jobs, oldest first
+        """
+        if not statuses:
+            yield from self._iter_query(
+                f"{_SELECT_JOBS} WHERE batch_id = ? ORDER BY id", (batch_id,)
+            )
+            return
+
+        placeholders = ", ".join("?" * len(statuses))
+        yield from self._iter_query(
+            f"{_SELECT_JOBS} WHERE batch_id = ? AND status IN ({placeholders}) ORDER BY id",
+            (batch_id, *(status.value for status in statuses)),
+        )
 
     def get_all_jobs(
         self,
@@ -296,37 +541,88 @@ class JobDatabase:
         limit: int = 100,
     ) -> list[Job]:
         """Get all jobs with optional status filter."""
-        with self._connection() as conn:
-            if status:
-                rows = conn.execute(
-                    "SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?",
-                    (status.value, limit),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM jobs ORDER BY id DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-
-        return [self._row_to_job(row) for row in rows]
+        return self.query_jobs(status=status, limit=limit)
+
+    def query_jobs(
+        self,
+        batch_id: str | None = None,
+        status: JobStatus | None = None,
+        limit: int = 100,
+        before_id: int | None = None,
+        name_pattern: str | None = None,
+    ) -> list[Job]:
+        """Get the newest jobs matching the given filters as a list (see iter_jobs)."""
+        return list(self.iter_jobs(batch_id, status, limit, before_id, name_pattern))
+
+    def iter_jobs(
+        self,
+        batch_id: str | None = None,
+        status: JobStatus | None = None,
+        limit: int = 100,
+        before_id: int | None = None,
+        name_pattern: str | None = None,
+    ) -> Iterator[Job]:
+        """
+        Yield the newest jobs matching the given filters.
+
+        Rows are read from the cursor in chunks as they are consumed rather
+        than fetched all at once. The connection is only locked while a
+        chunk is read, so other threads can use the database in between.
+
+        Filtering and the limit run in SQLite, where the batch/status
+        indexes (which include the row id) serve both the WHERE and the
+        ORDER BY, so only ``limit`` rows are read.
+
+        Args:
+            batch_id: Only jobs in this batch
+            status: Only jobs with this status
+            limit: Maximum number of jobs to return
+            before_id: Only jobs with a smaller ID; pass the last ID of the
+                previous page to fetch the next one
+            name_pattern: Only jobs whose name matches this regex (anchored
+                at the start, like --pattern elsewhere)
+
+        Yields:
+            Matching jobs, newest first
+        """
+        clauses = []
+        params: list[Any] = []
+
+        if batch_id:
+            clauses.append("batch_id = ?")
+            params.append(batch_id)
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(before_id)
+        if name_pattern:
+            clause, value = _name_pattern_clause(name_pattern)
+            clauses.append(clause)
+            params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        yield from self._iter_query(f"{_SELECT_JOBS} {where} ORDER BY id DESC LIMIT ?", params)
 
     def get_batch_summary(self, batch_id: str) -> dict:
-        """Get summary statistics for a batch."""
+        """
+        Get summary statistics for a batch.
+
+        Returns a count for every JobStatus value (0 when absent) plus "total".
+        """
         with self._connection() as conn:
-            row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed
-                FROM jobs WHERE batch_id = ?
-                """,
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE batch_id = ? GROUP BY status",
                 (batch_id,),
-            ).fetchone()
+            ).fetchall()
 
-        return dict(row)
+        summary = {status.value: 0 for status in JobStatus}
+        summary.update({status: count for status, count in rows})
+        summary["total"] = sum(summary.values())
+        return summary
 
     def delete_job(self, job_id: int) -> bool:
         """Delete a job record."""
@@ -335,25 +631,21 @@ class JobDatabase:
             return cursor.rowcount > 0
 
     def _row_to_job(self, row: sqlite3.Row) -> Job:
-        """Convert database row to Job object."""
-        return Job(
-            id=row["id"],
-            job_name=row["job_name"],
-            cluspro_job_id=row["cluspro_job_id"],
-            status=JobStatus(row["status"]),
-            receptor_pdb=row["receptor_pdb"],
-            ligand_pdb=row["ligand_pdb"],
-            server=row["server"],
-            submitted_at=row["submitted_at"],
-            completed_at=row["completed_at"],
-            error_message=row["error_message"],
-            batch_id=row["batch_id"],
-        )
+        """Convert a _SELECT_JOBS row, whose columns follow the Job fields, to a Job."""
+        job = Job(*row)
+        job.status = _STATUS_BY_VALUE[row[3]]
+        if row[7]:
+            job.submitted_at = datetime.fromisoformat(row[7])
+        if row[8]:
+            job.completed_at = datetime.fromisoformat(row[8])
+        return job
 
 
 __all__ = [
     "JobDatabase",
     "JobStatus",
     "Job",
+    "JobRow",
+    "StatusUpdate",
     "DEFAULT_DB_PATH",
 ]
@@ -5,11 +5,12 @@ Downloads PDB models and energy scores from ClusPro job results.
 """
 
 import logging
+import os
 import shutil
-import subprocess
+import tarfile
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
@@ -21,8 +22,14 @@ from cluspro.browser import authenticate, browser_session, wait_for_element
 from cluspro.retry import retry_download, with_retry
 from cluspro.utils import ensure_dir, expand_sequences, load_config
 
+if TYPE_CHECKING:
+    from cluspro.browser_pool import BrowserPool
+
 logger = logging.getLogger(__name__)
 
+# Seconds between checks of the download directory for a finished file
+DOWNLOAD_POLL_INTERVAL = 0.2
+
 
 class DownloadError(Exception):
     """Exception raised when download fails."""
@@ -30,32 +37,80 @@ class DownloadError(Exception):
     pass
 
 
+def _list_downloads(download_dir: Path) -> set[str]:
+    """Names of the entries currently in the download directory."""
+    with os.scandir(download_dir) as entries:
+        return {entry.name for entry in entries}
+
+
+def _wait_for_download(
+    download_dir: Path, suffix: str, timeout: float, existing: set[str]
+) -> Path | None:
+    """
+    Wait for a new download ending in suffix to finish.
+
+    Firefox writes into a ``.part`` file next to the target and removes it
+    once the download completes, so a new file without a ``.part`` sibling
+    is finished.
+
+    Args:
+        download_dir: Directory the browser saves downloads to
+        suffix: File name ending to wait for (e.g. ".tar.bz2")
+        timeout: Maximum seconds to wait
+        existing: Entry names present before the download started
+
+    Returns:
+        Path to the finished file, or None if none appeared within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        names = _list_downloads(download_dir)
+        for name in names - existing:
+            if name.endswith(suffix) and f"{name}.part" not in names:
+                return download_dir / name
+
+        if time.monotonic() >= deadline:
+            logger.warning(f"No {suffix} download finished within {timeout}s")
+            return None
+        time.sleep(DOWNLOAD_POLL_INTERVAL)
+
+
 @retry_download
-def _download_pdb_models(driver, wait, download_wait: int) -> None:
+def _download_pdb_models(driver, wait, download_dir: Path, download_wait: int) -> Path | None:
     """
     Download PDB models with retry on transient failures.
 
     Args:
         driver: WebDriver instance
         wait: WebDriverWait instance
-        download_wait: Time to wait for download to complete
+        download_dir: Directory the browser saves downloads to
+        download_wait: Maximum time to wait for the download to complete
+
+    Returns:
+        Path to the downloaded archive, or None if it did not finish in time
     """
     download_link = wait.until(
         EC.element_to_be_clickable((By.LINK_TEXT, "Download all Models for all Coefficients"))
     )
+    existing = _list_downloads(download_dir)
     download_link.click()
     logger.debug("Clicked download models link")
-    time.sleep(download_wait)
+    return _wait_for_download(download_dir, ".tar.bz2", download_wait, existing)
 
 
 @retry_download
-def _download_scores(driver, wait) -> None:
+def _download_scores(driver, wait, download_dir: Path, timeout: float = 5) -> Path | None:
     """
     Download model scores with retry on transient failures.
 
     Args:
         driver: WebDriver instance
         wait: WebDriverWait instance
+        download_dir: Directory the browser saves downloads to
+        timeout: Maximum time to wait for the download to complete
+
+    Returns:
+        Path to the downloaded CSV, or None if it did not finish in time
     """
     scores_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "View Model Scores")))
     scores_link.click()
@@ -64,9 +119,10 @@ def _download_scores(driver, wait) -> None:
     download_scores_link = wait.until(
         EC.element_to_be_clickable((By.LINK_TEXT, "Download Model Scores for this Coefficient"))
     )
+    existing = _list_downloads(download_dir)
     download_scores_link.click()
     logger.debug("Clicked download scores link")
-    time.sleep(5)
+    return _wait_for_download(download_dir, ".csv", timeout, existing)
 
 
 def download_results(
@@ -77,6 +133,7 @@ def download_results(
     config: dict[str, Any] | None = None,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    pool: "BrowserPool | None" = None,
 ) -> Path:
     """
     Download results for a single ClusPro job.
@@ -89,6 +146,8 @@ def download_results(
         config: Optional configuration dict
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        pool: Optional BrowserPool to reuse an authenticated browser across jobs.
+              Its download_dir must be the same directory as output_dir.
 
     Returns:
         Path to the job results directory
@@ -118,14 +177,19 @@ def download_results(
 
     logger.info(f"Downloading results for job {job_id}...")
 
-    with browser_session(headless=headless, download_dir=str(output_path), config=config) as driver:
+    with browser_session(
+        headless=headless, download_dir=str(output_path), config=config, pool=pool
+    ) as driver:
         try:
             # Navigate to job results page
             driver.get(job_url)
             logger.debug(f"Navigated to: {job_url}")
 
-            # Authenticate (guest or account login)
-            authenticate(driver, credentials=credentials, force_guest=force_guest)
+            # Authenticate (guest or account login); pooled drivers only log in once
+            if pool is not None:
+                pool.authenticate(driver, credentials=credentials, force_guest=force_guest)
+            else:
+                authenticate(driver, credentials=credentials, force_guest=force_guest)
             time.sleep(2)
 
             wait = wait_for_element(driver, timeout=15)
@@ -148,15 +212,22 @@ def download_results(
             # Download PDB models if requested (with automatic retry)
             if download_pdb:
                 try:
-                    _download_pdb_models(driver, wait, download_wait)
-                    extract_archive(output_path, job_output_dir)
+                    archive = _download_pdb_models(driver, wait, output_path, download_wait)
+                    # output_path is shared, so never fall back to globbing it
+                    if archive is None:
+                        logger.warning(f"Models for job {job_id} did not download, skipping")
+                    else:
+                        extract_archive(output_path, job_output_dir, archive_path=archive)
                 except NoSuchElementException:
                     logger.warning("Download models link not found, skipping PDB download")
 
             # Download model scores (with automatic retry)
             try:
-                _download_scores(driver, wait)
-                move_score_file(output_path, job_output_dir)
+                scores = _download_scores(driver, wait, output_path)
+                if scores is None:
+                    logger.warning(f"Scores for job {job_id} did not download, skipping")
+                else:
+                    move_score_file(output_path, job_output_dir, csv_path=scores)
             except NoSuchElementException:
                 logger.warning("Model scores link not found")
 
@@ -168,10 +239,42 @@ def download_results(
             raise DownloadError(f"Failed to download job {job_id}: {e}") from e
 
 
-@with_retry(
-    max_attempts=3, min_wait=2, exceptions=(OSError, IOError, subprocess.CalledProcessError)
-)
-def extract_archive(download_dir: Path, output_dir: Path) -> None:
+def _check_member(member: tarfile.TarInfo, dest: Path) -> None:
+    """
+    Refuse an archive member that would be written outside dest.
+
+    Args:
+        member: Archive member about to be extracted
+        dest: Extraction directory
+
+    Raises:
+        tarfile.TarError: If the member is absolute, climbs out with "..",
+                          links outside dest, or is not a regular file,
+                          directory or link
+    """
+    name = member.name
+    if os.path.isabs(name) or name.startswith(("/", "\\")):
+        raise tarfile.TarError(f"Refusing absolute path in archive: {name!r}")
+    if ".." in Path(name).parts:
+        raise tarfile.TarError(f"Refusing '..' in archive path: {name!r}")
+
+    root = dest.resolve()
+    target = (root / name).resolve()
+    if not target.is_relative_to(root):
+        raise tarfile.TarError(f"Refusing archive path outside {dest}: {name!r}")
+
+    if member.issym() or member.islnk():
+        # Symlinks are relative to their own directory, hard links to dest
+        base = target.parent if member.issym() else root
+        link_target = (base / member.linkname).resolve()
+        if os.path.isabs(member.linkname) or not link_target.is_relative_to(root):
+            raise tarfile.TarError(f"Refusing link outside {dest}: {name!r} -> {member.linkname!r}")
+    elif not (member.isfile() or member.isdir()):
+        raise tarfile.TarError(f"Refusing special file in archive: {name!r}")
+
+
+@with_retry(max_attempts=3, min_wait=2, exceptions=(OSError, tarfile.TarError))
+def extract_archive(download_dir: Path, output_dir: Path, archive_path: Path | None = None) -> None:
     """
     Extract downloaded tar.bz2 archive.
 
@@ -180,24 +283,29 @@ def extract_archive(download_dir: Path, output_dir: Path) -> None:
     Args:
         download_dir: Directory where archive was downloaded
         output_dir: Directory to extract files to
+        archive_path: The downloaded archive, when known; otherwise the first
+                      *.tar.bz2 in download_dir is used
     """
-    # Find tar.bz2 file
-    archives = list(download_dir.glob("*.tar.bz2"))
+    if archive_path is None:
+        archive_path = next(download_dir.glob("*.tar.bz2"), None)
 
-    if not archives:
+    if archive_path is None:
         logger.warning("No tar.bz2 archive found to extract")
         return
 
-    archive_path = archives[0]
     logger.debug(f"Extracting archive: {archive_path}")
 
     try:
-        # Extract using tar command
-        subprocess.run(
-            ["tar", "-xvjf", str(archive_path), "-C", str(download_dir)],
-            check=True,
-            capture_output=True,
-        )
+        # Decompress in a single streaming pass, without spawning tar; the
+        # "data" filter (Python 3.10.12+) refuses members escaping download_dir
+        with tarfile.open(archive_path, mode="r|bz2") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(download_dir, filter="data")
+            else:
+                # Older Pythons: vet each member before it is written
+                for member in tar:
+                    _check_member(member, download_dir)
+                    tar.extract(member, download_dir)
 
         # Find extracted directory (usually named cluspro.JOBID)
         extracted_dirs = [
@@ -206,15 +314,22 @@ def extract_archive(download_dir: Path, output_dir: Path) -> None:
 
         if extracted_dirs:
             extracted_dir = extracted_dirs[0]
-            # Move contents to output directory
-            for item in extracted_dir.iterdir():
-                dest = output_dir / item.name
-                if dest.exists():
+            # Move contents to output directory; a rename per entry, since
+            # both sides normally live on the same filesystem
+            with os.scandir(extracted_dir) as entries:
+                for entry in entries:
+                    dest = output_dir / entry.name
+                    # os.replace overwrites a file, but not a directory or
+                    # a file with a directory
                     if dest.is_dir():
                         shutil.rmtree(dest)
-                    else:
+                    elif entry.is_dir() and dest.exists():
                         dest.unlink()
-                shutil.move(str(item), str(dest))
+                    try:
+                        os.replace(entry.path, dest)
+                    except OSError:
+                        # e.g. output_dir on another filesystem
+                        shutil.move(entry.path, dest)
 
             # Remove empty extracted directory
             extracted_dir.rmdir()
@@ -224,29 +339,29 @@ def extract_archive(download_dir: Path, output_dir: Path) -> None:
         archive_path.unlink()
         logger.debug(f"Removed archive: {archive_path}")
 
-    except subprocess.CalledProcessError as e:
+    except tarfile.TarError as e:
         logger.error(f"Failed to extract archive: {e}")
     except Exception as e:
         logger.error(f"Error during extraction: {e}")
 
 
-def move_score_file(download_dir: Path, output_dir: Path) -> None:
+def move_score_file(download_dir: Path, output_dir: Path, csv_path: Path | None = None) -> None:
     """
     Move and rename downloaded score CSV file.
 
     Args:
         download_dir: Directory where CSV was downloaded
         output_dir: Directory to move file to
+        csv_path: The downloaded CSV, when known; otherwise the first *.csv
+                  in download_dir is used
     """
-    # Find CSV files
-    csv_files = list(download_dir.glob("*.csv"))
+    if csv_path is None:
+        csv_path = next(download_dir.glob("*.csv"), None)
 
-    if not csv_files:
+    if csv_path is None:
         logger.warning("No CSV file found to move")
         return
 
-    csv_path = csv_files[0]
-
     # Rename with .balanced.csv suffix
     base_name = csv_path.stem
     new_name = f"{base_name}.balanced.csv"
@@ -266,10 +381,15 @@ def download_batch(
     progress: bool = True,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    workers: int | None = None,
 ) -> dict[int, dict[str, str]]:
     """
     Download results for multiple jobs.
 
+    With more than one job and ``download.http`` enabled (the default), jobs
+    are fetched in parallel over a shared HTTP session. Otherwise jobs are
+    downloaded one after another through a single reused browser.
+
     Args:
         job_ids: List of job IDs or compressed string (e.g., "1154309:1154338")
         output_dir: Directory to save results
@@ -280,6 +400,7 @@ def download_batch(
         progress: Show progress bar
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        workers: Number of parallel HTTP downloads (default ``download.workers``)
 
     Returns:
         Dict mapping job_id to result (path or error message)
@@ -302,35 +423,65 @@ def download_batch(
 
     timeouts = config.get("timeouts", {})
     between_jobs = timeouts.get("between_jobs", 10)
+    use_http = config.get("download", {}).get("http", True)
+
+    results: dict[int, dict[str, str]] = {}
+
+    if use_http and len(job_ids) > 1:
+        # Parallel HTTP downloads sharing one logged-in session
+        from cluspro.download_fast import download_batch_http
+
+        results = download_batch_http(
+            job_ids=job_ids,
+            output_dir=output_dir,
+            download_pdb=download_pdb,
+            continue_on_error=continue_on_error,
+            headless=headless,
+            config=config,
+            progress=progress,
+            credentials=credentials,
+            force_guest=force_guest,
+            workers=workers,
+        )
+    else:
+        from cluspro.browser_pool import BrowserPool
 
-    results = {}
-    job_iter = job_ids
+        if output_dir is None:
+            output_dir = config.get("paths", {}).get("output_dir", "~/Desktop/ClusPro_results")
+        output_path = ensure_dir(output_dir)
 
-    if progress:
-        job_iter = tqdm(job_ids, desc="Downloading jobs", unit="job")
+        job_iter = job_ids
 
-    for job_id in job_iter:
-        try:
-            result_path = download_results(
-                job_id=job_id,
-                output_dir=output_dir,
-                download_pdb=download_pdb,
-                headless=headless,
-                config=config,
-                credentials=credentials,
-                force_guest=force_guest,
-            )
-            results[job_id] = {"status": "success", "path": str(result_path)}
+        if progress:
+            job_iter = tqdm(job_ids, desc="Downloading jobs", unit="job")
 
-        except Exception as e:
-            logger.error(f"Failed to download job {job_id}: {e}")
-            results[job_id] = {"status": "error", "error": str(e)}
-
-            if not continue_on_error:
-                raise
-
-        # Delay between downloads
-        time.sleep(between_jobs)
+        # One browser, started and logged in once, serves every job
+        with BrowserPool(
+            size=1, headless=headless, download_dir=str(output_path), config=config
+        ) as pool:
+            for job_id in job_iter:
+                try:
+                    result_path = download_results(
+                        job_id=job_id,
+                        output_dir=output_path,
+                        download_pdb=download_pdb,
+                        headless=headless,
+                        config=config,
+                        credentials=credentials,
+                        force_guest=force_guest,
+                        pool=pool,
+                    )
+                    results[job_id] = {"status": "success", "path": str(result_path)}
+
+                except Exception as e:
+                    logger.error(f"Failed to download job {job_id}: {e}")
+                    results[job_id] = {"status": "error", "error": str(e)}
+
+                    if not continue_on_error:
+                        raise
+
+                # Delay between downloads
+                time.sleep(between_jobs)
 
     # Summary
     success = sum(1 for r in results.values() if r["status"] == "success")
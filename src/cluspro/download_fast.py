@@ -0,0 +1,252 @@
+"""
+Fast batch download module for ClusPro automation.
+
+Downloads results for many jobs in parallel over one connection-pooled
+requests.Session. A browser is used once to log in; its cookies are then
+copied into the HTTP session, so each job costs a few HTTP requests
+instead of a full browser session.
+"""
+
+import logging
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from tqdm import tqdm
+
+from cluspro.auth import Credentials
+from cluspro.browser import create_http_session
+from cluspro.download import DownloadError, extract_archive, move_score_file
+from cluspro.utils import ensure_dir, load_config
+
+logger = logging.getLogger(__name__)
+
+# Default number of parallel job downloads
+DEFAULT_WORKERS = 8
+
+# Bytes per read/write when streaming responses to disk
+CHUNK_SIZE = 1 << 20
+
+# Seconds to wait for the server on each request
+REQUEST_TIMEOUT = 60
+
+MODELS_LINK_TEXT = "Download all Models for all Coefficients"
+SCORES_PAGE_LINK_TEXT = "View Model Scores"
+SCORES_LINK_TEXT = "Download Model Scores for this Coefficient"
+
+
+def _find_link(soup: BeautifulSoup, base_url: str, text: str) -> str:
+    """Return the absolute href of the link with the given text."""
+    link = soup.find("a", string=lambda s: s is not None and s.strip() == text)
+    if link is None or not link.get("href"):
+        raise DownloadError(f"Link not found: {text}")
+    return urljoin(base_url, str(link["href"]))
+
+
+def _parse_job_name(soup: BeautifulSoup) -> str | None:
+    """Extract the job name from the 'Job Details' header on a models page."""
+    header = soup.find("div", id="main-header-right")
+    h3 = header.find_next("h3") if header else None
+    if h3 is None:
+        return None
+    return h3.get_text().replace("Job Details: ", "").strip() or None
+
+
+def _response_filename(response: requests.Response, default: str) -> str:
+    """Pick a file name from Content-Disposition or the URL path."""
+    disposition = response.headers.get("Content-Disposition", "")
+    match = re.search(r'filename="?([^";]+)"?', disposition)
+    if match:
+        return Path(match.group(1)).name
+
+    name = Path(unquote(urlparse(response.url).path)).name
+    return name or default
+
+
+def _stream_to_file(session: requests.Session, url: str, dest_dir: Path, default: str) -> Path:
+    """
+    Stream a URL to disk without holding the body in memory.
+
+    Args:
+        session: Authenticated HTTP session
+        url: URL to download
+        dest_dir: Directory to write into
+        default: File name to use if the response does not provide one
+
+    Returns:
+        Path to the written file
+    """
+    with session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        dest = dest_dir / _response_filename(response, default)
+        # Undo any Content-Encoding so the file holds the served bytes
+        response.raw.decode_content = True
+        # Large unbuffered writes straight from the socket: one syscall per MiB
+        with open(dest, "wb", buffering=0) as f:
+            shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+
+    logger.debug(f"Downloaded {url} -> {dest}")
+    return dest
+
+
+def _download_one(
+    session: requests.Session,
+    job_id: int,
+    output_path: Path,
+    models_url: str,
+    download_pdb: bool,
+) -> Path:
+    """
+    Download models and scores for one job over HTTP.
+
+    Files are staged in a per-job temporary directory so parallel jobs never
+    see each other's archives or CSVs.
+
+    Returns:
+        Path to the job results directory
+    """
+    job_url = f"{models_url}?job={job_id}"
+    response = session.get(job_url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.text, "lxml")
+
+    job_name = _parse_job_name(soup)
+    if job_name is None:
+        job_name = f"cluspro.{job_id}"
+        logger.warning(f"Could not extract job name, using: {job_name}")
+
+    job_output_dir = output_path / job_name
+    job_output_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix=f".cluspro.{job_id}.", dir=output_path) as staging:
+        staging_path = Path(staging)
+
+        if download_pdb:
+            try:
+                models_link = _find_link(soup, response.url, MODELS_LINK_TEXT)
+                archive = _stream_to_file(
+                    session, models_link, staging_path, f"cluspro.{job_id}.tar.bz2"
+                )
+                extract_archive(staging_path, job_output_dir, archive_path=archive)
+            except DownloadError:
+                logger.warning("Download models link not found, skipping PDB download")
+
+        try:
+            scores_page = _find_link(soup, response.url, SCORES_PAGE_LINK_TEXT)
+            scores_response = session.get(scores_page, timeout=REQUEST_TIMEOUT)
+            scores_response.raise_for_status()
+            scores_soup = BeautifulSoup(scores_response.text, "lxml")
+            scores_link = _find_link(scores_soup, scores_response.url, SCORES_LINK_TEXT)
+            scores = _stream_to_file(session, scores_link, staging_path, f"cluspro.{job_id}.csv")
+            move_score_file(staging_path, job_output_dir, csv_path=scores)
+        except DownloadError:
+            logger.warning("Model scores link not found")
+
+    logger.info(f"Results for job {job_id} saved to: {job_output_dir}")
+    return job_output_dir
+
+
+def download_batch_http(
+    job_ids: list[int],
+    output_dir: str | Path | None = None,
+    download_pdb: bool = True,
+    continue_on_error: bool = True,
+    headless: bool = True,
+    config: dict[str, Any] | None = None,
+    progress: bool = True,
+    credentials: Credentials | None = None,
+    force_guest: bool = False,
+    workers: int | None = None,
+) -> dict[int, dict[str, str]]:
+    """
+    Download results for multiple jobs in parallel over HTTP.
+
+    Uses ``workers`` threads (default ``download.workers``, 8) sharing one
+    pooled session.
+
+    Args:
+        job_ids: List of job IDs
+        output_dir: Directory to save results (default from config)
+        download_pdb: Whether to download PDB files
+        continue_on_error: Continue with remaining jobs if one fails
+        headless: Run the login browser in headless mode
+        config: Optional configuration dict
+        progress: Show progress bar
+        credentials: Optional credentials for account login
+        force_guest: Force guest mode even if credentials provided
+        workers: Number of parallel downloads (default from config)
+
+    Returns:
+        Dict mapping job_id to result (path or error message), in input order
+
+    Raises:
+        DownloadError: If a job fails and continue_on_error is False
+
+    Example:
+        >>> results = download_batch_http([1154309, 1154310], download_pdb=True)
+    """
+    if config is None:
+        config = load_config()
+
+    urls = config.get("cluspro", {}).get("urls", {})
+    paths = config.get("paths", {})
+    if workers is None:
+        workers = config.get("download", {}).get("workers", DEFAULT_WORKERS)
+
+    models_url = urls.get("models", "https://cluspro.bu.edu/models.php")
+
+    if output_dir is None:
+        output_dir = paths.get("output_dir", "~/Desktop/ClusPro_results")
+    output_path = ensure_dir(output_dir)
+
+    session = create_http_session(
+        headless=headless,
+        config=config,
+        credentials=credentials,
+        force_guest=force_guest,
+        pool_size=workers,
+    )
+
+    results: dict[int, dict[str, str]] = {}
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        futures = {
+            executor.submit(
+                _download_one, session, job_id, output_path, models_url, download_pdb
+            ): job_id
+            for job_id in job_ids
+        }
+
+        done = as_completed(futures)
+        if progress:
+            done = tqdm(done, total=len(futures), desc="Downloading jobs", unit="job")
+
+        for future in done:
+            job_id = futures[future]
+            try:
+                results[job_id] = {"status": "success", "path": str(future.result())}
+            except Exception as e:
+                logger.error(f"Failed to download job {job_id}: {e}")
+                results[job_id] = {"status": "error", "error": str(e)}
+
+                if not continue_on_error:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise DownloadError(f"Failed to download job {job_id}: {e}") from e
+    finally:
+        executor.shutdown(wait=True)
+        session.close()
+
+    return {job_id: results[job_id] for job_id in job_ids if job_id in results}
+
+
+__all__ = [
+    "download_batch_http",
+    "DEFAULT_WORKERS",
+]
@@ -5,7 +5,9 @@ Organizes downloaded results into meaningful directory structures.
 """
 
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -14,6 +16,88 @@ from cluspro.utils import ensure_dir, load_config, resolve_path
 
 logger = logging.getLogger(__name__)
 
+# Standard receptor name substitutions, applied in order
+RECEPTOR_SUBSTITUTIONS = {
+    "mMrgprx2": "rMrgprx2",
+    "mEndg": "mEndg_dimer",
+}
+
+# Target directories copied in parallel (organize.workers)
+DEFAULT_WORKERS = 8
+
+# Mapping CSV columns organize_results reads; all are names, so parse as text
+MAPPING_CSV_COLUMNS = frozenset(
+    {"my_jobname", "job_name", "jobname", "peptide_name", "receptor_name"}
+)
+
+
+def _scan_dir(path: str | Path) -> list[os.DirEntry]:
+    """
+    List a directory in one scandir pass.
+
+    DirEntry caches the file type returned with the listing, so is_file() and
+    is_dir() on the entries cost no extra stat calls.
+    """
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _organize_target(
+    job_names: list[str],
+    source_path: Path,
+    source_dirs: set[str],
+    new_dir_path: Path,
+    include_pdb: bool,
+) -> dict[str, str]:
+    """
+    Copy the results of every job mapped to one target directory.
+
+    Jobs are copied in mapping order and the last one decides the returned
+    status, as when each mapping row was organized in turn.
+
+    Returns:
+        Status dict for the target directory
+    """
+    result: dict[str, str] = {}
+
+    for job_name in job_names:
+        source_job_dir = source_path / job_name
+
+        if job_name not in source_dirs:
+            logger.warning(f"Source directory not found: {source_job_dir}")
+            result = {"status": "error", "error": "Source not found"}
+            continue
+
+        try:
+            # Create target directory
+            new_dir_path.mkdir(parents=True, exist_ok=True)
+
+            if include_pdb:
+                # Copy all files
+                for entry in _scan_dir(source_job_dir):
+                    dest = new_dir_path / entry.name
+                    if entry.is_file():
+                        shutil.copy2(entry.path, str(dest))
+                    elif entry.is_dir():
+                        if dest.exists():
+                            shutil.rmtree(dest)
+                        shutil.copytree(entry.path, str(dest))
+                logger.debug(f"Copied all files from {job_name} to {new_dir_path.name}")
+            else:
+                # Copy only CSV files
+                for entry in _scan_dir(source_job_dir):
+                    if entry.name.endswith(".csv") and entry.is_file():
+                        shutil.copy2(entry.path, str(new_dir_path / entry.name))
+                logger.debug(f"Copied CSV files from {job_name} to {new_dir_path.name}")
+
+            result = {"status": "success", "path": str(new_dir_path)}
+
+        except Exception as e:
+            logger.error(f"Failed to organize {job_name}: {e}")
+            result = {"status": "error", "error": str(e)}
+
+    return result
+
 
 def organize_results(
     job_mapping: pd.DataFrame | dict | list[dict],
@@ -21,11 +105,13 @@ def organize_results(
     target_dir: str | Path | None = None,
     include_pdb: bool = True,
     config: dict | None = None,
+    workers: int | None = None,
 ) -> dict:
     """
     Organize downloaded results into meaningful directory structure.
 
-    Renames directories from job IDs to peptide_v_receptor format.
+    Renames directories from job IDs to peptide_v_receptor format. Target
+    directories are copied in parallel, since copying is I/O bound.
 
     Args:
         job_mapping: Mapping of job info. DataFrame or list of dicts with:
@@ -36,6 +122,7 @@ def organize_results(
         target_dir: Directory for organized results (default from config)
         include_pdb: Whether to copy PDB files (True) or only CSV (False)
         config: Optional configuration dict
+        workers: Number of parallel copies (default ``organize.workers``)
 
     Returns:
         Dict mapping new directory names to their paths
@@ -81,56 +168,43 @@ def organize_results(
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    results = {}
-
-    for idx, row in job_mapping.iterrows():
-        job_name = row[job_col]
-        peptide_name = row["peptide_name"]
-        receptor_name = row["receptor_name"]
-
-        # Apply receptor name substitutions (matching R behavior)
-        receptor_name = apply_receptor_substitutions(receptor_name)
-
-        # Create new directory name
-        new_dir_name = f"{peptide_name}_v_{receptor_name}"
-        new_dir_path = target_path / new_dir_name
-
-        # Find source directory
-        source_job_dir = source_path / job_name
-
-        if not source_job_dir.exists():
-            logger.warning(f"Source directory not found: {source_job_dir}")
-            results[new_dir_name] = {"status": "error", "error": "Source not found"}
-            continue
-
-        try:
-            # Create target directory
-            new_dir_path.mkdir(parents=True, exist_ok=True)
-
-            if include_pdb:
-                # Copy all files
-                for item in source_job_dir.iterdir():
-                    dest = new_dir_path / item.name
-                    if item.is_file():
-                        shutil.copy2(str(item), str(dest))
-                    elif item.is_dir():
-                        if dest.exists():
-                            shutil.rmtree(dest)
-                        shutil.copytree(str(item), str(dest))
-                logger.debug(f"Copied all files from {job_name} to {new_dir_name}")
-            else:
-                # Copy only CSV files
-                csv_files = list(source_job_dir.glob("*.csv"))
-                for csv_file in csv_files:
-                    dest = new_dir_path / csv_file.name
-                    shutil.copy2(str(csv_file), str(dest))
-                logger.debug(f"Copied CSV files from {job_name} to {new_dir_name}")
-
-            results[new_dir_name] = {"status": "success", "path": str(new_dir_path)}
-
-        except Exception as e:
-            logger.error(f"Failed to organize {job_name}: {e}")
-            results[new_dir_name] = {"status": "error", "error": str(e)}
+    # Build all new directory names in one vectorized pass, applying receptor
+    # name substitutions (matching R behavior)
+    receptor_names = job_mapping["receptor_name"].astype(str)
+    for old, new in RECEPTOR_SUBSTITUTIONS.items():
+        receptor_names = receptor_names.str.replace(old, new, regex=False)
+    new_dir_names = job_mapping["peptide_name"].astype(str).str.cat(receptor_names, sep="_v_")
+
+    # One scan of the source directory instead of an exists() call per job
+    try:
+        source_dirs = {entry.name for entry in _scan_dir(source_path) if entry.is_dir()}
+    except FileNotFoundError:
+        source_dirs = set()
+
+    # Rows sharing a target directory form one task, so no two threads ever
+    # write into the same directory
+    tasks: dict[str, list[str]] = {}
+    for job_name, new_dir_name in zip(job_mapping[job_col].tolist(), new_dir_names.tolist()):
+        tasks.setdefault(new_dir_name, []).append(job_name)
+
+    if workers is None:
+        workers = config.get("organize", {}).get("workers", DEFAULT_WORKERS)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tasks)))) as executor:
+        futures = {
+            new_dir_name: executor.submit(
+                _organize_target,
+                job_names,
+                source_path,
+                source_dirs,
+                target_path / new_dir_name,
+                include_pdb,
+            )
+            for new_dir_name, job_names in tasks.items()
+        }
+
+    # Collected in mapping order once every copy has finished
+    results = {new_dir_name: future.result() for new_dir_name, future in futures.items()}
 
     # Summary
     success = sum(1 for r in results.values() if r["status"] == "success")
@@ -152,12 +226,7 @@ def apply_receptor_substitutions(receptor_name: str) -> str:
     Returns:
         Substituted receptor name
     """
-    substitutions = {
-        "mMrgprx2": "rMrgprx2",
-        "mEndg": "mEndg_dimer",
-    }
-
-    for old, new in substitutions.items():
+    for old, new in RECEPTOR_SUBSTITUTIONS.items():
         receptor_name = receptor_name.replace(old, new)
 
     return receptor_name
@@ -169,6 +238,7 @@ def organize_from_csv(
     target_dir: str | Path | None = None,
     include_pdb: bool = True,
     config: dict | None = None,
+    workers: int | None = None,
 ) -> dict:
     """
     Organize results using mapping from CSV file.
@@ -181,6 +251,7 @@ def organize_from_csv(
         target_dir: Directory for organized results
         include_pdb: Whether to include PDB files
         config: Optional configuration dict
+        workers: Number of parallel copies (default ``organize.workers``)
 
     Returns:
         Dict mapping new directory names to their paths
@@ -193,7 +264,11 @@ def organize_from_csv(
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    mapping = pd.read_csv(csv_path)
+    mapping = pd.read_csv(
+        csv_path,
+        usecols=lambda column: column in MAPPING_CSV_COLUMNS,
+        dtype=str,
+    )
     logger.info(f"Loaded {len(mapping)} entries from {csv_path}")
 
     return organize_results(
@@ -202,6 +277,7 @@ def organize_from_csv(
         target_dir=target_dir,
         include_pdb=include_pdb,
         config=config,
+        workers=workers,
     )
 
 
@@ -239,17 +315,20 @@ def list_organized_results(
 
     target_path = resolve_path(target_dir)
 
-    if not target_path.exists():
+    # Let the listing itself report a missing directory instead of a separate stat
+    try:
+        entries = _scan_dir(target_path)
+    except FileNotFoundError:
         logger.warning(f"Target directory does not exist: {target_path}")
         return pd.DataFrame()
 
     results = []
 
-    for item in sorted(target_path.iterdir()):
-        if not item.is_dir():
+    for entry in sorted(entries, key=lambda e: e.name):
+        if not entry.is_dir():
             continue
 
-        name = item.name
+        name = entry.name
 
         # Parse peptide and receptor from name
         peptide, receptor = None, None
@@ -258,20 +337,26 @@ def list_organized_results(
             peptide = parts[0]
             receptor = parts[1] if len(parts) > 1 else None
 
-        # Check for file types
-        pdb_files = list(item.glob("*.pdb"))
-        csv_files = list(item.glob("*.csv"))
+        # Count file types by name in one pass (hidden files are skipped, as glob would)
+        pdb_count = csv_count = 0
+        for child in _scan_dir(entry.path):
+            if child.name.startswith("."):
+                continue
+            if child.name.endswith(".pdb"):
+                pdb_count += 1
+            elif child.name.endswith(".csv"):
+                csv_count += 1
 
         results.append(
             {
                 "name": name,
-                "path": str(item),
+                "path": entry.path,
                 "peptide": peptide,
                 "receptor": receptor,
-                "has_pdb": len(pdb_files) > 0,
-                "has_csv": len(csv_files) > 0,
-                "pdb_count": len(pdb_files),
-                "csv_count": len(csv_files),
+                "has_pdb": pdb_count > 0,
+                "has_csv": csv_count > 0,
+                "pdb_count": pdb_count,
+                "csv_count": csv_count,
             }
         )
 
@@ -315,13 +400,17 @@ def cleanup_empty_dirs(
 
     removed = []
 
-    for item in target_path.iterdir():
-        if not item.is_dir():
+    for entry in _scan_dir(target_path):
+        if not entry.is_dir(follow_symlinks=False):
             continue
 
-        # Check if directory is empty
-        contents = list(item.iterdir())
-        if not contents:
+        item = Path(entry.path)
+
+        # Check if directory is empty without listing all of it
+        with os.scandir(entry.path) as it:
+            is_empty = next(it, None) is None
+
+        if is_empty:
             if dry_run:
                 logger.info(f"Would remove empty directory: {item}")
             else:
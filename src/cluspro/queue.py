@@ -5,16 +5,18 @@ Parses the ClusPro job queue to check status of submitted jobs.
 """
 
 import logging
-import re
 import time
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
 from bs4 import BeautifulSoup
 
 from cluspro.auth import Credentials
 from cluspro.browser import authenticate, browser_session
-from cluspro.utils import load_config
+from cluspro.utils import load_config, match_pattern
+
+if TYPE_CHECKING:
+    from cluspro.browser_pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ def get_queue_status(
     config: dict[str, Any] | None = None,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    pool: "BrowserPool | None" = None,
 ) -> pd.DataFrame:
     """
     Get current ClusPro job queue status.
@@ -37,6 +40,7 @@ def get_queue_status(
         config: Optional configuration dict
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        pool: Optional BrowserPool to reuse an authenticated browser across calls
 
     Returns:
         DataFrame with queue entries:
@@ -61,14 +65,19 @@ def get_queue_status(
 
     logger.info("Fetching ClusPro queue status...")
 
-    with browser_session(headless=headless, config=config) as driver:
+    with browser_session(headless=headless, config=config, pool=pool) as driver:
         try:
             # Navigate to queue page
             driver.get(queue_url)
             logger.debug(f"Navigated to: {queue_url}")
 
-            # Authenticate (guest or account login)
-            authenticate(driver, credentials=credentials, force_guest=force_guest)
+            # Authenticate (guest or account login); pooled drivers only log in
+            # again once their session expired, then reload the queue page
+            if pool is not None:
+                if pool.authenticate(driver, credentials=credentials, force_guest=force_guest):
+                    driver.get(queue_url)
+            else:
+                authenticate(driver, credentials=credentials, force_guest=force_guest)
             time.sleep(page_load_wait)
 
             # Parse page source
@@ -108,8 +117,7 @@ def get_queue_status(
                 logger.debug(f"Filtered to user: {filter_user}")
 
             if filter_pattern and "job_name" in df.columns:
-                pattern = re.compile(filter_pattern)
-                df = df[df["job_name"].str.match(pattern, na=False)]
+                df = df[match_pattern(df["job_name"], filter_pattern)]
                 logger.debug(f"Filtered by pattern: {filter_pattern}")
 
             logger.info(f"Found {len(df)} jobs in queue")
@@ -205,11 +213,15 @@ def wait_for_queue_clear(
     config: dict[str, Any] | None = None,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    pool: "BrowserPool | None" = None,
 ) -> bool:
     """
     Wait until filtered queue is empty.
 
     Useful for waiting until all submitted jobs have started processing.
+    A single browser is reused for every poll; pass ``pool`` to share one
+    that outlives this call. Each poll logs the browser in again if its
+    ClusPro session expired, so a login page is never read as an empty queue.
 
     Args:
         filter_user: Filter by username
@@ -220,6 +232,7 @@ def wait_for_queue_clear(
         config: Optional configuration dict
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        pool: Optional BrowserPool to poll with
 
     Returns:
         True if queue cleared, False if timeout
@@ -230,24 +243,35 @@ def wait_for_queue_clear(
     """
     import time
 
+    from cluspro.browser_pool import BrowserPool
+
+    owns_pool = pool is None
+    if pool is None:
+        pool = BrowserPool(headless=headless, config=config)
+
     start_time = time.time()
 
-    while time.time() - start_time < max_wait:
-        df = get_queue_status(
-            filter_user=filter_user,
-            filter_pattern=filter_pattern,
-            headless=headless,
-            config=config,
-            credentials=credentials,
-            force_guest=force_guest,
-        )
-
-        if df.empty:
-            logger.info("Queue is now empty")
-            return True
-
-        logger.info(f"{len(df)} jobs still in queue, waiting {check_interval}s...")
-        time.sleep(check_interval)
+    try:
+        while time.time() - start_time < max_wait:
+            df = get_queue_status(
+                filter_user=filter_user,
+                filter_pattern=filter_pattern,
+                headless=headless,
+                config=config,
+                credentials=credentials,
+                force_guest=force_guest,
+                pool=pool,
+            )
+
+            if df.empty:
+                logger.info("Queue is now empty")
+                return True
+
+            logger.info(f"{len(df)} jobs still in queue, waiting {check_interval}s...")
+            time.sleep(check_interval)
+    finally:
+        if owns_pool:
+            pool.shutdown()
 
     logger.warning(f"Timeout after {max_wait}s, {len(df)} jobs still in queue")
     return False
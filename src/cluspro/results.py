@@ -5,20 +5,34 @@ Parses the ClusPro results pages to find completed jobs.
 """
 
 import logging
-import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import pandas as pd
+import requests
 from bs4 import BeautifulSoup
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
 from cluspro.auth import Credentials
-from cluspro.browser import authenticate, browser_session
-from cluspro.utils import group_sequences, load_config
+from cluspro.browser import authenticate, browser_session, create_http_session
+from cluspro.utils import group_sequences, load_config, match_pattern
+
+if TYPE_CHECKING:
+    from cluspro.browser_pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
+# Default number of results pages fetched in parallel over HTTP
+DEFAULT_PAGE_WORKERS = 8
+
+# Seconds to wait for the server on each page request
+REQUEST_TIMEOUT = 60
+
+# Pagination link on results pages (matched by text, so XPath is needed)
+NEXT_PAGE_XPATH = "//a[contains(text(),'next ->')]"
+
 
 def get_finished_jobs(
     filter_pattern: str | None = None,
@@ -27,11 +41,15 @@ def get_finished_jobs(
     config: dict | None = None,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    pool: "BrowserPool | None" = None,
 ) -> pd.DataFrame:
     """
     Get completed jobs from ClusPro results pages.
 
-    Parses multiple pages of results and filters for finished jobs.
+    Parses multiple pages of results and filters for finished jobs. Pages
+    are read through the browser unless ``results.http`` is enabled (and no
+    pool is given), in which case they are fetched over one HTTP session
+    logged in on the results host, with pages 3+ requested in parallel.
 
     Args:
         filter_pattern: Regex pattern to filter job names
@@ -40,6 +58,7 @@ def get_finished_jobs(
         config: Optional configuration dict
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        pool: Optional BrowserPool to reuse an authenticated browser across calls
 
     Returns:
         DataFrame with completed jobs:
@@ -60,93 +79,230 @@ def get_finished_jobs(
     urls = config.get("cluspro", {}).get("urls", {})
     timeouts = config.get("timeouts", {})
     batch_config = config.get("batch", {})
+    results_config = config.get("results", {})
 
     results_url = urls.get("results", "https://cluspro.org/results.php")
     page_load_wait = timeouts.get("page_load_wait", 3)
     max_pages = min(max_pages, batch_config.get("max_pages_to_parse", 50))
+    use_http = pool is None and results_config.get("http", False)
 
     logger.info(f"Fetching results from up to {max_pages} pages...")
 
-    all_tables = []
-
-    with browser_session(headless=headless, config=config) as driver:
-        try:
-            # Navigate to results page
-            driver.get(results_url)
-            logger.debug(f"Navigated to: {results_url}")
-
-            # Authenticate (guest or account login)
-            authenticate(driver, credentials=credentials, force_guest=force_guest)
-            time.sleep(page_load_wait)
-
-            for page_num in range(1, max_pages + 1):
-                logger.debug(f"Parsing page {page_num}...")
-
-                # Parse current page
-                html = driver.page_source
-                soup = BeautifulSoup(html, "lxml")
-
-                table = soup.find("table", class_="nice")
-                if table:
-                    df = parse_results_table(table)
-                    if not df.empty:
-                        df["page"] = page_num
-                        all_tables.append(df)
-                        logger.debug(f"  Found {len(df)} entries on page {page_num}")
-
-                # Try to navigate to next page
-                try:
-                    next_link = driver.find_element(By.XPATH, "//a[contains(text(),'next ->')]")
-                    next_link.click()
-                    time.sleep(page_load_wait)
-                except NoSuchElementException:
-                    logger.debug(f"No more pages after page {page_num}")
-                    break
-
-            if not all_tables:
-                logger.info("No results found")
-                return pd.DataFrame()
-
-            # Combine all pages
-            combined = pd.concat(all_tables, ignore_index=True)
-
-            # Standardize column names
-            combined.columns = [c.lower().replace(" ", "_") for c in combined.columns]
-
-            # Rename common columns
-            if "name" in combined.columns:
-                combined = combined.rename(columns={"name": "job_name"})
-            if "id" in combined.columns:
-                combined = combined.rename(columns={"id": "job_id"})
-
-            # Convert job_id to numeric
-            if "job_id" in combined.columns:
-                combined["job_id"] = pd.to_numeric(combined["job_id"], errors="coerce")
+    try:
+        if use_http:
+            workers = results_config.get("workers", DEFAULT_PAGE_WORKERS)
+            session = create_http_session(
+                headless=headless,
+                config=config,
+                credentials=credentials,
+                force_guest=force_guest,
+                pool_size=workers,
+                login_url=results_url,
+            )
+            with session:
+                pages = _fetch_pages_http(session, results_url, max_pages, workers)
+        else:
+            with browser_session(headless=headless, config=config, pool=pool) as driver:
+                # Navigate to results page
+                driver.get(results_url)
+                logger.debug(f"Navigated to: {results_url}")
+
+                # Authenticate (guest or account login); pooled drivers only log
+                # in again once their session expired, then reload the results page
+                if pool is not None:
+                    if pool.authenticate(driver, credentials=credentials, force_guest=force_guest):
+                        driver.get(results_url)
+                else:
+                    authenticate(driver, credentials=credentials, force_guest=force_guest)
+                time.sleep(page_load_wait)
+
+                pages = _fetch_pages_browser(driver, max_pages, page_load_wait)
+
+        all_tables = []
+        for page_num, html in enumerate(pages, start=1):
+            logger.debug(f"Parsing page {page_num}...")
+            soup = BeautifulSoup(html, "lxml")
+
+            table = soup.find("table", class_="nice")
+            if table:
+                df = parse_results_table(table)
+                if not df.empty:
+                    df["page"] = page_num
+                    all_tables.append(df)
+                    logger.debug(f"  Found {len(df)} entries on page {page_num}")
+
+        if not all_tables:
+            logger.info("No results found")
+            return pd.DataFrame()
+
+        # Combine all pages
+        combined = pd.concat(all_tables, ignore_index=True)
+
+        # Standardize column names
+        combined.columns = [c.lower().replace(" ", "_") for c in combined.columns]
+
+        # Rename common columns
+        if "name" in combined.columns:
+            combined = combined.rename(columns={"name": "job_name"})
+        if "id" in combined.columns:
+            combined = combined.rename(columns={"id": "job_id"})
+
+        # Convert job_id to nullable integers (float64 would be the default with gaps)
+        if "job_id" in combined.columns:
+            combined["job_id"] = pd.to_numeric(combined["job_id"], errors="coerce").astype("Int64")
+
+        # Filter for finished jobs
+        if "status" in combined.columns:
+            # Exclude error states
+            combined = combined[~combined["status"].str.contains("error", case=False, na=False)]
+            finished = combined[combined["status"] == "finished"]
+        else:
+            finished = combined
+
+        # Apply job name filter
+        if filter_pattern and "job_name" in finished.columns:
+            finished = finished[match_pattern(finished["job_name"], filter_pattern)]
+            logger.debug(f"Filtered by pattern: {filter_pattern}")
+
+        # Sort by job_id
+        if "job_id" in finished.columns:
+            finished = finished.sort_values("job_id")
+
+        logger.info(f"Found {len(finished)} finished jobs")
+        return finished.reset_index(drop=True)
+
+    except Exception as e:
+        logger.error(f"Failed to fetch results: {e}")
+        raise
+
+
+def _fetch_pages_browser(driver, max_pages: int, page_load_wait: float) -> list[str]:
+    """Collect page HTML by clicking through 'next ->' links in the browser."""
+    pages = []
+    for page_num in range(1, max_pages + 1):
+        pages.append(driver.page_source)
+
+        # Navigate to next page; find_elements returns [] on the last page
+        next_links = driver.find_elements(By.XPATH, NEXT_PAGE_XPATH)
+        if not next_links:
+            logger.debug(f"No more pages after page {page_num}")
+            break
+
+        next_links[0].click()
+        time.sleep(page_load_wait)
+
+    return pages
+
+
+def _next_page_url(html: str, base_url: str) -> str | None:
+    """Return the absolute URL of the 'next ->' link, or None on the last page."""
+    soup = BeautifulSoup(html, "lxml")
+    link = soup.find("a", string=lambda s: s is not None and "next ->" in s)
+    if link is None or not link.get("href"):
+        return None
+    return urljoin(base_url, str(link["href"]))
+
+
+def _extrapolate_page_urls(second_url: str, third_url: str, count: int) -> list[str] | None:
+    """
+    Predict the URLs of the pages after ``third_url``.
 
-            # Filter for finished jobs
-            if "status" in combined.columns:
-                # Exclude error states
-                combined = combined[~combined["status"].str.contains("error", case=False, na=False)]
-                finished = combined[combined["status"] == "finished"]
-            else:
-                finished = combined
+    Works when consecutive pages differ in exactly one integer query
+    parameter (a page number or row offset). Returns None otherwise.
+    """
+    second = urlsplit(second_url)
+    third = urlsplit(third_url)
+    if (second.scheme, second.netloc, second.path) != (third.scheme, third.netloc, third.path):
+        return None
+
+    second_query = parse_qsl(second.query, keep_blank_values=True)
+    third_query = parse_qsl(third.query, keep_blank_values=True)
+    if [k for k, _ in second_query] != [k for k, _ in third_query]:
+        return None
+
+    changed = [i for i, (a, b) in enumerate(zip(second_query, third_query)) if a != b]
+    if len(changed) != 1:
+        return None
+
+    index = changed[0]
+    key = third_query[index][0]
+    try:
+        start = int(third_query[index][1])
+        step = start - int(second_query[index][1])
+    except ValueError:
+        return None
+    if step <= 0:
+        return None
+
+    page_urls = []
+    for n in range(1, count + 1):
+        query = list(third_query)
+        query[index] = (key, str(start + n * step))
+        page_urls.append(urlunsplit(third._replace(query=urlencode(query))))
+    return page_urls
+
+
+def _fetch_pages_http(
+    session: requests.Session,
+    results_url: str,
+    max_pages: int,
+    workers: int = DEFAULT_PAGE_WORKERS,
+) -> list[str]:
+    """
+    Fetch up to ``max_pages`` results pages over an authenticated session.
 
-            # Apply job name filter
-            if filter_pattern and "job_name" in finished.columns:
-                pattern = re.compile(filter_pattern)
-                finished = finished[finished["job_name"].str.match(pattern, na=False)]
-                logger.debug(f"Filtered by pattern: {filter_pattern}")
+    Pages 1-3 are fetched in order to learn how the 'next ->' link pages
+    through results. When the scheme steps a single numeric query parameter,
+    the remaining pages are requested in parallel and trimmed at the first
+    page without a 'next ->' link; otherwise links are followed one by one.
 
-            # Sort by job_id
-            if "job_id" in finished.columns:
-                finished = finished.sort_values("job_id")
+    Args:
+        session: Authenticated HTTP session
+        results_url: URL of the first results page
+        max_pages: Maximum number of pages to fetch
+        workers: Maximum number of pages in flight
 
-            logger.info(f"Found {len(finished)} finished jobs")
-            return finished.reset_index(drop=True)
+    Returns:
+        Page HTML in page order
+    """
 
-        except Exception as e:
-            logger.error(f"Failed to fetch results: {e}")
-            raise
+    def fetch(url: str) -> str:
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    pages: list[str] = []
+    page_urls: list[str] = []
+    url: str | None = results_url
+
+    while url is not None and len(pages) < min(max_pages, 3):
+        page_urls.append(url)
+        pages.append(fetch(url))
+        url = _next_page_url(pages[-1], url)
+
+    if url is None or len(pages) == max_pages:
+        return pages
+
+    remaining = _extrapolate_page_urls(page_urls[-2], page_urls[-1], max_pages - len(pages))
+    if remaining is None or remaining[0] != url:
+        logger.debug("Unrecognized paging scheme, following 'next ->' links sequentially")
+        while url is not None and len(pages) < max_pages:
+            pages.append(fetch(url))
+            url = _next_page_url(pages[-1], url)
+        return pages
+
+    logger.debug(f"Fetching {len(remaining)} more pages with {workers} workers")
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for page_url, html in zip(remaining, executor.map(fetch, remaining)):
+            pages.append(html)
+            if _next_page_url(html, page_url) is None:
+                break
+    finally:
+        # Pages past the last one are not needed; drop any not yet started
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return pages
 
 
 def parse_results_table(table) -> pd.DataFrame:
@@ -222,8 +378,7 @@ def get_job_ids_compressed(
     if df.empty or "job_id" not in df.columns:
         return ""
 
-    job_ids = df["job_id"].dropna().astype(int).tolist()
-    return group_sequences(job_ids)
+    return group_sequences(df["job_id"].dropna().tolist())
 
 
 def check_job_finished(
@@ -322,13 +477,13 @@ def get_results_summary(
                     if not df.empty:
                         all_tables.append(df)
 
-                try:
-                    next_link = driver.find_element(By.XPATH, "//a[contains(text(),'next ->')]")
-                    next_link.click()
-                    time.sleep(page_load_wait)
-                except NoSuchElementException:
+                next_links = driver.find_elements(By.XPATH, NEXT_PAGE_XPATH)
+                if not next_links:
                     break
 
+                next_links[0].click()
+                time.sleep(page_load_wait)
+
             if not all_tables:
                 return {
                     "total": 0,
@@ -348,8 +503,7 @@ def get_results_summary(
 
             # Apply filter
             if filter_pattern and "job_name" in combined.columns:
-                pattern = re.compile(filter_pattern)
-                combined = combined[combined["job_name"].str.match(pattern, na=False)]
+                combined = combined[match_pattern(combined["job_name"], filter_pattern)]
 
             # Count statuses
             status_counts = {"finished": 0, "running": 0, "error": 0}
@@ -14,6 +14,7 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 from tenacity import (
+    RetryCallState,
     RetryError,
     before_sleep_log,
     retry,
@@ -72,6 +73,7 @@ def create_retry_decorator(
     max_wait: float = 30,
     multiplier: float = 2,
     exceptions: tuple[type[Exception], ...] = SELENIUM_RETRY_EXCEPTIONS,
+    before_retry: Callable[[RetryCallState], None] | None = None,
 ):
     """
     Create a retry decorator with specified configuration.
@@ -82,15 +84,24 @@ def create_retry_decorator(
         max_wait: Maximum wait time between retries (seconds)
         multiplier: Exponential backoff multiplier
         exceptions: Tuple of exception types to retry on
+        before_retry: Optional hook run before each retry, e.g. to reload the
+                      page a browser step failed on
 
     Returns:
         Configured retry decorator
     """
+    log_retry = before_sleep_log(logger, logging.WARNING)
+
+    def before_sleep(retry_state: RetryCallState) -> None:
+        log_retry(retry_state)
+        if before_retry is not None:
+            before_retry(retry_state)
+
     return retry(
         stop=stop_after_attempt(max_attempts),
         wait=wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait),
         retry=retry_if_exception_type(exceptions),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
+        before_sleep=before_sleep,
         reraise=True,
     )
 
@@ -4,9 +4,14 @@ Job submission module for ClusPro automation.
 Handles submitting protein docking jobs to the ClusPro web server.
 """
 
+import asyncio
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 from selenium.webdriver.common.by import By
@@ -15,11 +20,26 @@ from tqdm import tqdm
 
 from cluspro.auth import Credentials
 from cluspro.browser import authenticate, browser_session, wait_for_element
+from cluspro.browser_pool import BrowserPool
 from cluspro.retry import retry_browser
 from cluspro.utils import load_config, validate_pdb_file
 
 logger = logging.getLogger(__name__)
 
+# Default number of browsers submitting in parallel when the browser is used
+DEFAULT_BROWSER_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Threads used by dry_run to check input files
+DRY_RUN_WORKERS = 32
+
+# Columns read from job CSVs; any other columns are skipped at parse time
+JOB_CSV_DTYPES = {
+    "job_name": str,
+    "receptor_pdb": str,
+    "ligand_pdb": str,
+    "server": "category",
+}
+
 
 class SubmissionError(Exception):
     """Exception raised when job submission fails."""
@@ -103,6 +123,7 @@ def submit_job(
     config: dict | None = None,
     credentials: Credentials | None = None,
     force_guest: bool = False,
+    pool: BrowserPool | None = None,
 ) -> str | None:
     """
     Submit a single docking job to ClusPro.
@@ -116,6 +137,7 @@ def submit_job(
         config: Optional configuration dict
         credentials: Optional credentials for account login
         force_guest: Force guest mode even if credentials provided
+        pool: Optional BrowserPool to reuse an authenticated browser across jobs
 
     Returns:
         Job ID if captured (may be None as ClusPro doesn't always return it)
@@ -148,14 +170,17 @@ def submit_job(
     logger.debug(f"  Receptor: {receptor_path}")
     logger.debug(f"  Ligand: {ligand_path}")
 
-    with browser_session(headless=headless, config=config) as driver:
+    with browser_session(headless=headless, config=config, pool=pool) as driver:
         try:
             # Navigate to ClusPro home page
             driver.get(home_url)
             logger.debug(f"Navigated to: {home_url}")
 
-            # Authenticate (guest or account login)
-            authenticate(driver, credentials=credentials, force_guest=force_guest)
+            # Authenticate (guest or account login); pooled drivers only log in once
+            if pool is not None:
+                pool.authenticate(driver, credentials=credentials, force_guest=force_guest)
+            else:
+                authenticate(driver, credentials=credentials, force_guest=force_guest)
             time.sleep(1)
 
             wait = wait_for_element(driver, timeout=15)
@@ -204,12 +229,22 @@ def submit_batch(
     """
     Submit multiple docking jobs to ClusPro.
 
+    When ``batch.http_submit`` is enabled, account credentials are given and
+    aiohttp is installed (``pip install cluspro-automation-py[async]``), jobs
+    are posted directly over HTTP with up to ``batch.concurrency`` submissions
+    in flight. Called from inside a running event loop, the browser path is
+    used instead. Otherwise ``batch.browser_workers`` pooled browsers (default: CPU count,
+    at most 4) submit jobs in parallel, each logging in once and pausing
+    ``timeouts.between_jobs`` seconds after each of its jobs.
+
     Args:
         jobs: DataFrame or list of dicts with columns:
               - job_name: Unique job identifier
               - receptor_pdb: Path to receptor PDB
               - ligand_pdb: Path to ligand PDB
               - server: (optional) Server type, default "gpu"
+              For large batches, prefer the "string" dtype for name/path
+              columns and a Categorical server column over object dtype.
         headless: Run browser in headless mode
         continue_on_error: Continue with next job if one fails
         config: Optional configuration dict
@@ -248,19 +283,42 @@ def submit_batch(
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    results = []
-    job_iter = jobs.iterrows()
-
-    if progress:
-        job_iter = tqdm(list(job_iter), desc="Submitting jobs", unit="job")
+    # Account batches may opt in to skipping the browser entirely
+    batch_config = config.get("batch", {})
+    if batch_config.get("http_submit", False) and credentials is not None and not force_guest:
+        try:
+            from cluspro.submit_async import DEFAULT_CONCURRENCY, submit_batch_async
+        except ImportError:
+            logger.warning("batch.http_submit needs aiohttp, submitting through the browser")
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                concurrency = batch_config.get("concurrency", DEFAULT_CONCURRENCY)
+                return asyncio.run(
+                    submit_batch_async(
+                        jobs,
+                        credentials,
+                        concurrency=concurrency,
+                        continue_on_error=continue_on_error,
+                        config=config,
+                        progress=progress,
+                    )
+                )
+            logger.info("Event loop already running, submitting through the browser")
+
+    records = jobs.to_dict("records")
+    workers = config.get("batch", {}).get("browser_workers", DEFAULT_BROWSER_WORKERS)
+    workers = max(1, min(workers, len(records)))
+    pool = BrowserPool(size=workers, headless=headless, config=config)
+    stop = threading.Event()
+
+    def run(position: int, row: dict[str, Any]) -> dict[str, Any] | None:
+        if stop.is_set():
+            return None
 
-    for idx, row in job_iter:
         job_name = row["job_name"]
-        receptor_pdb = row["receptor_pdb"]
-        ligand_pdb = row["ligand_pdb"]
-        server = row.get("server", "gpu")
-
-        result = {
+        result: dict[str, Any] = {
             "job_name": job_name,
             "job_id": None,
             "status": "pending",
@@ -268,17 +326,17 @@ def submit_batch(
         }
 
         try:
-            job_id = submit_job(
+            result["job_id"] = submit_job(
                 job_name=job_name,
-                receptor_pdb=receptor_pdb,
-                ligand_pdb=ligand_pdb,
-                server=server,
+                receptor_pdb=row["receptor_pdb"],
+                ligand_pdb=row["ligand_pdb"],
+                server=row.get("server", "gpu"),
                 headless=headless,
                 config=config,
                 credentials=credentials,
                 force_guest=force_guest,
+                pool=pool,
             )
-            result["job_id"] = job_id
             result["status"] = "success"
 
         except Exception as e:
@@ -287,16 +345,32 @@ def submit_batch(
             result["error"] = str(e)
 
             if not continue_on_error:
-                results.append(result)
+                stop.set()
                 raise
 
-        results.append(result)
-
-        # Delay between jobs
-        if idx < len(jobs) - 1:
+        # Delay between this worker's jobs
+        if position < len(records) - workers:
             time.sleep(between_jobs)
 
-    return pd.DataFrame(results)
+        return result
+
+    results: list[dict[str, Any] | None] = [None] * len(records)
+
+    with pool, ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run, i, row): i for i, row in enumerate(records)}
+
+        done = as_completed(futures)
+        if progress:
+            done = tqdm(done, total=len(futures), desc="Submitting jobs", unit="job")
+
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    return pd.DataFrame([r for r in results if r is not None])
 
 
 def submit_from_csv(
@@ -332,7 +406,7 @@ def submit_from_csv(
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    jobs = pd.read_csv(csv_path)
+    jobs = read_jobs_csv(csv_path)
     logger.info(f"Loaded {len(jobs)} jobs from {csv_path}")
 
     return submit_batch(
@@ -345,6 +419,38 @@ def submit_from_csv(
     )
 
 
+def read_jobs_csv(csv_path: str | Path) -> pd.DataFrame:
+    """
+    Read a job CSV, parsing only the columns used for submission.
+
+    Args:
+        csv_path: Path to CSV with job_name, receptor_pdb, ligand_pdb and
+                  optionally server
+
+    Returns:
+        DataFrame of jobs
+    """
+    return pd.read_csv(
+        csv_path,
+        usecols=lambda column: column in JOB_CSV_DTYPES,
+        dtype=JOB_CSV_DTYPES,
+    )
+
+
+def _path_exists(path: str | Path) -> bool:
+    """Check a user-supplied path, expanding ~."""
+    return Path(path).expanduser().exists()
+
+
+def _list_files(directory: Path) -> set[str]:
+    """Names of the files in a directory, or an empty set if it can't be read."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return set()
+
+
 def dry_run(jobs: pd.DataFrame | list[dict], output: bool = True) -> pd.DataFrame:
     """
     Preview jobs without submitting.
@@ -365,32 +471,40 @@ def dry_run(jobs: pd.DataFrame | list[dict], output: bool = True) -> pd.DataFram
     if isinstance(jobs, list):
         jobs = pd.DataFrame(jobs)
 
-    results = []
-
-    for idx, row in jobs.iterrows():
-        job_name = row["job_name"]
-        receptor_pdb = row["receptor_pdb"]
-        ligand_pdb = row["ligand_pdb"]
-
-        result = {
-            "job_name": job_name,
-            "receptor_pdb": receptor_pdb,
-            "ligand_pdb": ligand_pdb,
-            "receptor_exists": Path(receptor_pdb).expanduser().exists(),
-            "ligand_exists": Path(ligand_pdb).expanduser().exists(),
-            "valid": True,
+    results = pd.DataFrame(
+        {
+            "job_name": jobs["job_name"].to_numpy(),
+            "receptor_pdb": jobs["receptor_pdb"].to_numpy(),
+            "ligand_pdb": jobs["ligand_pdb"].to_numpy(),
         }
+    )
 
-        result["valid"] = result["receptor_exists"] and result["ligand_exists"]
-
-        if output:
-            status = "OK" if result["valid"] else "MISSING FILES"
-            print(f"[{status}] {job_name}")
-            if not result["receptor_exists"]:
-                print(f"  ! Receptor not found: {receptor_pdb}")
-            if not result["ligand_exists"]:
-                print(f"  ! Ligand not found: {ligand_pdb}")
-
-        results.append(result)
-
-    return pd.DataFrame(results)
+    # List each parent directory once rather than stat-ing every file. Paths
+    # not found in a listing (e.g. a case mismatch on macOS) are checked
+    # directly. Both steps run on threads, which helps on network filesystems.
+    paths = pd.unique(pd.concat([results["receptor_pdb"], results["ligand_pdb"]]))
+    expanded = {path: Path(path).expanduser() for path in paths}
+    directories = list({path.parent for path in expanded.values()})
+    workers = max(1, min(DRY_RUN_WORKERS, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        listings = dict(zip(directories, executor.map(_list_files, directories)))
+        exists = {path: p.name in listings[p.parent] for path, p in expanded.items()}
+        unlisted = [path for path, found in exists.items() if not found]
+        exists.update(zip(unlisted, executor.map(_path_exists, unlisted)))
+
+    results["receptor_exists"] = results["receptor_pdb"].map(exists).astype(bool)
+    results["ligand_exists"] = results["ligand_pdb"].map(exists).astype(bool)
+    results["valid"] = results["receptor_exists"] & results["ligand_exists"]
+
+    if output and not results.empty:
+        # Build the report in memory and print it once
+        lines = []
+        for row in results.itertuples(index=False):
+            lines.append(f"[{'OK' if row.valid else 'MISSING FILES'}] {row.job_name}")
+            if not row.receptor_exists:
+                lines.append(f"  ! Receptor not found: {row.receptor_pdb}")
+            if not row.ligand_exists:
+                lines.append(f"  ! Ligand not found: {row.ligand_pdb}")
+        print("\n".join(lines))
+
+    return results
@@ -0,0 +1,266 @@
+"""
+Asynchronous batch submission module for ClusPro automation.
+
+Submits docking jobs by posting the ClusPro job form directly over HTTP,
+without driving a browser. All jobs share one pooled aiohttp session that
+is authenticated once, and an asyncio.Semaphore bounds how many
+submissions are in flight.
+
+Requires aiohttp:
+    pip install cluspro-automation-py[async]
+
+Example usage:
+    import asyncio
+    from cluspro.submit_async import submit_batch_async
+
+    results = asyncio.run(submit_batch_async(jobs, credentials, concurrency=8))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from typing import Any
+
+import pandas as pd
+from tqdm import tqdm
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        "aiohttp is required for HTTP batch submission. "
+        "Install with: pip install cluspro-automation-py[async]"
+    )
+
+from cluspro.auth import AuthenticationError, Credentials
+from cluspro.utils import load_config, validate_pdb_file
+
+logger = logging.getLogger(__name__)
+
+# Default number of submissions in flight
+DEFAULT_CONCURRENCY = 16
+
+# Seconds an idle pooled connection is kept open
+KEEPALIVE_TIMEOUT = 75
+
+LOGIN_URL = "https://cluspro.bu.edu/login.php"
+
+# A job link in the page ClusPro answers an accepted submission with
+_JOB_ID_PATTERN = re.compile(r"[?&]job=(\d+)")
+
+
+def _accepted_job_id(final_url: str, body: str) -> str:
+    """
+    Extract the job ID ClusPro assigned to an accepted submission.
+
+    Args:
+        final_url: URL the submission ended on after redirects
+        body: Text of the final page
+
+    Returns:
+        The ClusPro job ID
+
+    Raises:
+        SubmissionError: If the response is a login page or carries no job ID
+    """
+    from cluspro.submit import SubmissionError
+
+    if "/login.php" in final_url:
+        raise SubmissionError(f"Submission was redirected to the login page: {final_url}")
+
+    match = _JOB_ID_PATTERN.search(final_url) or _JOB_ID_PATTERN.search(body)
+    if match is None:
+        raise SubmissionError(f"ClusPro did not confirm the submission (ended on {final_url})")
+    return match.group(1)
+
+
+async def _login(session: aiohttp.ClientSession, credentials: Credentials) -> None:
+    """
+    Log in once and keep the session cookie in the shared cookie jar.
+
+    Args:
+        session: Shared client session
+        credentials: Credentials object with username and password
+
+    Raises:
+        AuthenticationError: If the server does not redirect away from login.php
+    """
+    data = {
+        "username": credentials.username,
+        "password": credentials.password,
+        "action": "Login",
+    }
+
+    async with session.post(LOGIN_URL, data=data) as response:
+        response.raise_for_status()
+        final_url = str(response.url)
+
+    # Same success check as browser.perform_login
+    if "/home.php" not in final_url and "/login.php" in final_url:
+        raise AuthenticationError(
+            f"Login may have failed. Expected redirect to /home.php, but still on {final_url}"
+        )
+
+    logger.info(f"Logged in as: {credentials.username}")
+
+
+async def _submit_one(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    stop: asyncio.Event,
+    submit_url: str,
+    job: dict[str, Any],
+    delay: float = 0,
+) -> dict[str, Any] | None:
+    """
+    Post a single job form once a concurrency slot is free.
+
+    A job only counts as submitted when ClusPro answers with its job ID;
+    any other response (including a bounce to the login page) is an error.
+    The slot is then held for ``delay`` seconds, mirroring the pause each
+    browser worker takes between jobs.
+
+    Returns:
+        Result dict (job_name, job_id, status, error), or None if the batch
+        was stopped before this job started
+    """
+    job_name = job["job_name"]
+    result: dict[str, Any] = {
+        "job_name": job_name,
+        "job_id": None,
+        "status": "pending",
+        "error": None,
+    }
+
+    async with semaphore:
+        if stop.is_set():
+            return None
+
+        try:
+            receptor_path = validate_pdb_file(job["receptor_pdb"])
+            ligand_path = validate_pdb_file(job["ligand_pdb"])
+
+            # PDB files are small; read them off the event loop thread
+            receptor_data, ligand_data = await asyncio.gather(
+                asyncio.to_thread(receptor_path.read_bytes),
+                asyncio.to_thread(ligand_path.read_bytes),
+            )
+
+            form = aiohttp.FormData()
+            form.add_field("jobname", job_name)
+            server = job.get("server")
+            form.add_field("server", server if isinstance(server, str) else "gpu")
+            form.add_field("rec", receptor_data, filename=receptor_path.name)
+            form.add_field("lig", ligand_data, filename=ligand_path.name)
+            form.add_field("action", "Dock")
+
+            async with session.post(submit_url, data=form) as response:
+                response.raise_for_status()
+                final_url = str(response.url)
+                body = await response.text()
+
+            result["job_id"] = _accepted_job_id(final_url, body)
+            logger.info(f"Captured job ID: {result['job_id']}")
+
+            result["status"] = "success"
+            logger.info(f"Job '{job_name}' submitted successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to submit job '{job_name}': {e}")
+            result["status"] = "error"
+            result["error"] = str(e)
+
+        if delay and not stop.is_set():
+            await asyncio.sleep(delay)
+
+    return result
+
+
+async def submit_batch_async(
+    jobs: pd.DataFrame | list[dict],
+    credentials: Credentials,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    continue_on_error: bool = True,
+    config: dict | None = None,
+    progress: bool = False,
+) -> pd.DataFrame:
+    """
+    Submit multiple docking jobs concurrently over HTTP.
+
+    Like the browser workers, each of the ``concurrency`` slots pauses
+    ``timeouts.between_jobs`` seconds after a job before taking the next.
+
+    Args:
+        jobs: DataFrame or list of dicts with columns job_name, receptor_pdb,
+              ligand_pdb and optionally server (default "gpu")
+        credentials: Credentials for account login (used once per batch)
+        concurrency: Maximum number of submissions in flight
+        continue_on_error: Continue with remaining jobs if one fails
+        config: Optional configuration dict
+        progress: Show progress bar
+
+    Returns:
+        DataFrame with job submission results (job_name, job_id, status, error)
+
+    Raises:
+        AuthenticationError: If login fails
+        SubmissionError: If a job fails and continue_on_error is False
+
+    Example:
+        >>> results = asyncio.run(submit_batch_async(jobs, creds, concurrency=8))
+    """
+    from cluspro.submit import SubmissionError
+
+    if config is None:
+        config = load_config()
+
+    urls = config.get("cluspro", {}).get("urls", {})
+    submit_url = urls.get("submit", urls.get("home", "https://cluspro.bu.edu/home.php"))
+    between_jobs = config.get("timeouts", {}).get("between_jobs", 10)
+
+    if isinstance(jobs, pd.DataFrame):
+        records = jobs.to_dict("records")
+    else:
+        records = list(jobs)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT)
+
+    logger.info(f"Submitting {len(records)} jobs over HTTP (concurrency={concurrency})")
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await _login(session, credentials)
+
+        with tqdm(
+            total=len(records), desc="Submitting jobs", unit="job", disable=not progress
+        ) as bar:
+
+            async def run(position: int, job: dict[str, Any]) -> dict[str, Any] | None:
+                # The last job on each slot has nothing to wait for
+                delay = between_jobs if position < len(records) - concurrency else 0
+                result = await _submit_one(session, semaphore, stop, submit_url, job, delay=delay)
+                if result is not None and result["status"] == "error" and not continue_on_error:
+                    stop.set()
+                bar.update()
+                return result
+
+            gathered = await asyncio.gather(*(run(i, job) for i, job in enumerate(records)))
+
+    results = [r for r in gathered if r is not None]
+
+    if stop.is_set():
+        first_error = next(r for r in results if r["status"] == "error")
+        raise SubmissionError(
+            f"Failed to submit job '{first_error['job_name']}': {first_error['error']}"
+        )
+
+    return pd.DataFrame(results)
+
+
+__all__ = [
+    "submit_batch_async",
+    "DEFAULT_CONCURRENCY",
+]
@@ -4,20 +4,33 @@ Utility functions for ClusPro automation.
 Includes configuration loading, sequence compression, and file path helpers.
 """
 
+import copy
+import functools
+import hashlib
+import json
 import logging
+import re
+from collections.abc import Iterator, Sequence
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import yaml
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Characters that give a pattern meaning beyond a literal prefix
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
 # Default config locations (in order of precedence)
 CONFIG_LOCATIONS = [
     Path.home() / ".cluspro" / "settings.yaml",
     Path(__file__).parent.parent.parent.parent / "config" / "settings.yaml",
 ]
 
+# Parsed copy of the last config file loaded, so later CLI runs skip PyYAML
+CONFIG_CACHE_FILE = Path.home() / ".cluspro" / "config_cache.json"
+
 
 def load_config(config_path: str | Path | None = None) -> dict[str, Any]:
     """
@@ -45,15 +58,82 @@ def load_config(config_path: str | Path | None = None) -> dict[str, Any]:
         paths = CONFIG_LOCATIONS
 
     for path in paths:
-        if path.exists():
-            logger.debug(f"Loading config from: {path}")
-            with open(path) as f:
-                return cast(dict[str, Any], yaml.safe_load(f))
+        try:
+            text = path.read_text()
+        except OSError:
+            continue
+
+        # Callers may modify their config, so hand out a copy of the cached parse
+        return copy.deepcopy(_load_config_file(str(path), text))
 
     logger.warning("No config file found, using defaults")
     return get_default_config()
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_file(path: str, text: str) -> dict[str, Any]:
+    """
+    Parse the YAML text of a config file.
+
+    Cached per (path, content) so repeated loads skip the YAML parse while
+    edits to the file still take effect, even ones that keep its mtime. The
+    parse is also kept on disk (CONFIG_CACHE_FILE), keyed on a hash of the
+    content, so a fresh process can skip importing PyYAML.
+    """
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    cached = _read_config_cache(path, digest)
+    if cached is not None:
+        return cached
+
+    import yaml
+
+    try:
+        # libyaml-backed loader, roughly 10x faster than the pure-Python one
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+
+    logger.debug(f"Loading config from: {path}")
+    config = cast(dict[str, Any], yaml.load(text, Loader=Loader))
+
+    _write_config_cache(path, digest, config)
+    return config
+
+
+def _read_config_cache(path: str, digest: str) -> dict[str, Any] | None:
+    """Return the cached parse of a config file, or None if stale or unreadable."""
+    try:
+        cached = json.loads(CONFIG_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("path") != path or cached.get("sha256") != digest:
+        return None
+
+    config = cached.get("config")
+    return config if isinstance(config, dict) else None
+
+
+def _write_config_cache(path: str, digest: str, config: dict[str, Any]) -> None:
+    """Persist a config parse, unless JSON cannot represent it exactly."""
+    try:
+        payload = json.dumps({"path": path, "sha256": digest, "config": config})
+    except (TypeError, ValueError):
+        return
+
+    # YAML allows values JSON would silently change (e.g. integer keys)
+    if json.loads(payload)["config"] != config:
+        return
+
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CONFIG_CACHE_FILE.write_text(payload)
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+
+
 def get_default_config() -> dict[str, Any]:
     """Return default configuration values."""
     return {
@@ -71,8 +151,10 @@ def get_default_config() -> dict[str, Any]:
         "browser": {
             "type": "firefox",
             "headless": True,
-            "implicit_wait": 10,
+            "implicit_wait": 0,
             "page_load_timeout": 30,
+            "page_load_strategy": "eager",
+            "poll_frequency": 0.1,
         },
         "paths": {
             "output_dir": "~/Desktop/ClusPro_results",
@@ -87,6 +169,12 @@ def get_default_config() -> dict[str, Any]:
         "batch": {
             "max_pages_to_parse": 50,
             "jobs_per_chunk": 45,
+            "http_submit": False,
+            "concurrency": 16,
+            "browser_workers": 4,
+        },
+        "organize": {
+            "workers": 8,
         },
     }
 
@@ -139,14 +227,14 @@ def expand_sequences(s: str) -> list[int]:
     return result
 
 
-def group_sequences(ids: list[int]) -> str:
+def group_sequences(ids: Sequence[int]) -> str:
     """
     Compress list of integers to sequence notation.
 
     Inverse of expand_sequences. Groups consecutive numbers into ranges.
 
     Args:
-        ids: List of integers (need not be sorted)
+        ids: Sequence of integers (need not be sorted)
 
     Returns:
         Compressed string notation
@@ -155,39 +243,42 @@ def group_sequences(ids: list[int]) -> str:
         >>> group_sequences([958743, 958744, 958745, 958747, 958748, 958750])
         '958743:958745,958747:958748,958750'
     """
-    if not ids:
-        return ""
+    return ",".join(iter_sequences(ids))
 
-    # Sort and deduplicate
-    sorted_ids = sorted(set(ids))
 
-    if len(sorted_ids) == 1:
-        return str(sorted_ids[0])
+def iter_sequences(ids: Sequence[int]) -> Iterator[str]:
+    """
+    Yield the range tokens of the compressed notation one at a time.
 
-    result = []
-    range_start = sorted_ids[0]
-    range_end = sorted_ids[0]
+    Lets callers write long ID lists to a file token by token instead of
+    building the whole string first.
 
-    for i in range(1, len(sorted_ids)):
-        if sorted_ids[i] == range_end + 1:
-            # Continue current range
-            range_end = sorted_ids[i]
-        else:
-            # End current range, start new one
-            if range_start == range_end:
-                result.append(str(range_start))
-            else:
-                result.append(f"{range_start}:{range_end}")
-            range_start = sorted_ids[i]
-            range_end = sorted_ids[i]
-
-    # Add final range
-    if range_start == range_end:
-        result.append(str(range_start))
-    else:
-        result.append(f"{range_start}:{range_end}")
+    Args:
+        ids: Sequence of integers (need not be sorted)
 
-    return ",".join(result)
+    Yields:
+        "start:end" for runs of consecutive IDs, or a single ID
+
+    Example:
+        >>> list(iter_sequences([3, 1, 2, 7]))
+        ['1:3', '7']
+    """
+    if not ids:
+        return
+
+    # Sort and deduplicate. Plain sorted(set()) and one linear scan beat
+    # np.unique + np.diff here, as formatting the output tokens dominates
+    sorted_ids = sorted(set(ids))
+
+    start = end = sorted_ids[0]
+    for value in sorted_ids[1:]:
+        if value == end + 1:
+            end = value
+            continue
+        yield str(start) if start == end else f"{start}:{end}"
+        start = end = value
+
+    yield str(start) if start == end else f"{start}:{end}"
 
 
 def format_job_ids(job_ids: str, items_per_line: int = 5) -> str:
@@ -215,6 +306,53 @@ def format_job_ids(job_ids: str, items_per_line: int = 5) -> str:
     return ",\n".join(lines)
 
 
+@functools.lru_cache(maxsize=32)
+def compile_name_pattern(pattern: str) -> str | re.Pattern[str]:
+    """
+    Prepare a job name pattern for repeated matching.
+
+    Args:
+        pattern: Regex matched at the start of the name, like re.match
+
+    Returns:
+        The literal prefix for a simple "prefix.*" pattern, otherwise the
+        compiled regex. Results are cached.
+
+    Example:
+        >>> compile_name_pattern("bb-.*")
+        'bb-'
+    """
+    stem = pattern[:-2] if pattern.endswith(".*") else pattern
+    if _REGEX_METACHARACTERS.isdisjoint(stem):
+        return stem
+    return re.compile(pattern)
+
+
+def match_pattern(names: "pd.Series", pattern: str | re.Pattern[str]) -> "pd.Series":
+    """
+    Match job names against a regex anchored at the start, like re.match.
+
+    Simple prefix patterns such as "bb-.*" are matched with str.startswith
+    instead of the regex engine. String patterns are compiled once and
+    cached across calls; an already compiled pattern is used as is.
+
+    Args:
+        names: Series of job names
+        pattern: Regex pattern string or compiled pattern
+
+    Returns:
+        Boolean Series, False for missing names
+
+    Example:
+        >>> match_pattern(pd.Series(["bb-1", "pad-2"]), "bb-.*").tolist()
+        [True, False]
+    """
+    compiled = pattern if isinstance(pattern, re.Pattern) else compile_name_pattern(pattern)
+    if isinstance(compiled, str):
+        return names.str.startswith(compiled, na=False)
+    return names.str.match(compiled, na=False)
+
+
 def resolve_path(path: str | Path) -> Path:
     """
     Resolve path with home directory expansion.
@@ -265,6 +403,13 @@ def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     log_level = getattr(logging, level.upper(), logging.INFO)
 
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured (e.g. main() invoked repeatedly in one process):
+        # basicConfig would ignore new handlers, so only apply the level
+        root.setLevel(log_level)
+        return
+
     handlers: list[logging.Handler] = [logging.StreamHandler()]
 
     if log_file:
@@ -44,6 +44,12 @@ try:
 except ImportError:
     raise ImportError("SciPy is required for docking validation. Install with: pip install scipy")
 
+# orjson is an optional, faster drop-in for parsing UniProt and topology JSON
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Default distance thresholds (Angstroms)
@@ -135,8 +141,7 @@ def load_topology_from_json(json_path: str) -> Topology:
         ]
     }
     """
-    with open(json_path) as f:
-        data = json.load(f)
+    data = _json_loads(Path(json_path).read_bytes())
 
     # Check if UniProt format
     if "features" in data:
@@ -213,7 +218,7 @@ def fetch_topology_from_uniprot(accession: str, alignment_region: str = "ECL1")
 
     try:
         with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+            data = _json_loads(response.read())
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise ValueError(f"UniProt accession not found: {accession}")
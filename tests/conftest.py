@@ -12,6 +12,24 @@ def cli_runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def isolated_geckodriver_cache(monkeypatch, tmp_path):
+    """Keep the persisted geckodriver path out of the real home directory."""
+    monkeypatch.setattr("cluspro.browser.GECKODRIVER_CACHE_FILE", tmp_path / "geckodriver_path")
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(monkeypatch, tmp_path):
+    """Keep the persisted config parse out of the real home directory."""
+    monkeypatch.setattr("cluspro.utils.CONFIG_CACHE_FILE", tmp_path / "config_cache.json")
+
+
+@pytest.fixture(autouse=True)
+def isolated_daemon_socket(monkeypatch, tmp_path):
+    """Keep CLI commands from talking to a daemon running on this machine."""
+    monkeypatch.setattr("cluspro.daemon.DAEMON_SOCKET", tmp_path / "daemon.sock")
+
+
 @pytest.fixture
 def mock_config():
     """Standard test configuration."""
@@ -141,7 +159,9 @@ def test_db(tmp_path):
     from cluspro.database import JobDatabase
 
     db_path = tmp_path / "test_jobs.db"
-    return JobDatabase(db_path=db_path)
+    db = JobDatabase(db_path=db_path)
+    yield db
+    db.close()
 
 
 @pytest.fixture
@@ -1,5 +1,7 @@
 """Tests for the auth module."""
 
+import dataclasses
+
 import pytest
 
 from cluspro.auth import (
@@ -27,6 +29,16 @@ class TestCredentials:
         assert creds.password == "testpass"
         assert creds.source == CredentialSource.ENVIRONMENT
 
+    def test_credentials_immutable(self):
+        """Test Credentials cannot be modified and can be hashed."""
+        creds = Credentials(username="u", password="p", source=CredentialSource.CONFIG)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            creds.password = "other"  # type: ignore[misc]
+
+        assert creds == Credentials(username="u", password="p", source=CredentialSource.CONFIG)
+        assert len({creds, creds}) == 1
+
 
 class TestCredentialSource:
     """Tests for CredentialSource enum."""
@@ -78,6 +90,20 @@ class TestGetCredentialsFromEnv:
         creds = _get_credentials_from_env()
         assert creds is None
 
+    def test_credentials_from_env_reused(self, monkeypatch):
+        """Test repeated lookups reuse credentials until the env changes."""
+        monkeypatch.setenv("CLUSPRO_USERNAME", "envuser")
+        monkeypatch.setenv("CLUSPRO_PASSWORD", "envpass")
+
+        first = _get_credentials_from_env()
+        assert _get_credentials_from_env() is first
+
+        monkeypatch.setenv("CLUSPRO_PASSWORD", "newpass")
+        changed = _get_credentials_from_env()
+
+        assert changed is not first
+        assert changed.password == "newpass"
+
 
 class TestGetCredentialsFromConfig:
     """Tests for _get_credentials_from_config."""
@@ -32,6 +32,141 @@ class TestCreateBrowser:
 
         assert tmp_path.exists()
 
+    def test_download_dir_resolved_once(self, mocker, mock_config, tmp_path):
+        """Test repeated browsers for one download directory resolve it once."""
+        mock_webdriver = mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+
+        from cluspro.browser import _resolve_dir_path, create_browser
+
+        download_dir = tmp_path / "downloads"
+        _resolve_dir_path.cache_clear()
+
+        for _ in range(3):
+            create_browser(download_dir=str(download_dir), config=mock_config)
+
+        assert download_dir.is_dir()
+        assert _resolve_dir_path.cache_info().misses == 1
+        prefs = mock_webdriver.Firefox.call_args.kwargs["options"].preferences
+        assert prefs["browser.download.dir"] == str(download_dir.resolve())
+
+    def test_implicit_wait_defaults_to_zero(self, mocker, mock_config):
+        """Test implicit wait is disabled unless configured."""
+        mock_webdriver = mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+        config = {**mock_config, "browser": {"type": "firefox"}}
+
+        from cluspro.browser import create_browser
+
+        create_browser(config=config)
+
+        mock_webdriver.Firefox.return_value.implicitly_wait.assert_called_once_with(0)
+
+    def test_eager_page_load_strategy(self, mocker, mock_config):
+        """Test page loads return at DOMContentLoaded unless configured otherwise."""
+        mock_webdriver = mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+
+        from cluspro.browser import create_browser
+
+        create_browser(config=mock_config)
+        options = mock_webdriver.Firefox.call_args.kwargs["options"]
+        assert options.page_load_strategy == "eager"
+
+        create_browser(config={**mock_config, "browser": {"page_load_strategy": "normal"}})
+        options = mock_webdriver.Firefox.call_args.kwargs["options"]
+        assert options.page_load_strategy == "normal"
+
+    def test_profile_root(self, mocker, mock_config, tmp_path):
+        """Test browser.profile_root is passed to geckodriver and created."""
+        mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+        mock_service = mocker.patch("cluspro.browser.FirefoxService")
+
+        from cluspro.browser import create_browser
+
+        profile_root = tmp_path / "profiles"
+        create_browser(config={**mock_config, "browser": {"profile_root": str(profile_root)}})
+
+        service_args = mock_service.call_args.kwargs["service_args"]
+        assert service_args == ["--profile-root", str(profile_root.resolve())]
+        assert profile_root.is_dir()
+
+    def test_minimal_prefs(self, mocker, mock_config):
+        """Test minimal-footprint preferences are applied unless disabled."""
+        mock_webdriver = mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+
+        from cluspro.browser import create_browser
+
+        create_browser(config=mock_config)
+        prefs = mock_webdriver.Firefox.call_args.kwargs["options"].preferences
+        assert prefs["permissions.default.image"] == 2
+        assert prefs["toolkit.telemetry.enabled"] is False
+        assert prefs["browser.safebrowsing.malware.enabled"] is False
+
+        create_browser(config={**mock_config, "browser": {"minimal": False}})
+        prefs = mock_webdriver.Firefox.call_args.kwargs["options"].preferences
+        assert "permissions.default.image" not in prefs
+
+    def test_geckodriver_resolved_once(self, mocker, mock_config, monkeypatch):
+        """Test GeckoDriverManager().install() is reused across browsers."""
+        mocker.patch("cluspro.browser.webdriver")
+        mocker.patch("cluspro.browser._GECKODRIVER_PATH", None)
+        monkeypatch.delenv("CLUSPRO_GECKODRIVER", raising=False)
+        mock_manager = mocker.patch("cluspro.browser.GeckoDriverManager")
+        mock_manager.return_value.install.return_value = "/tmp/geckodriver"
+
+        from cluspro.browser import create_browser
+
+        create_browser(config=mock_config)
+        create_browser(config=mock_config)
+
+        mock_manager.return_value.install.assert_called_once()
+
+    def test_geckodriver_persisted_path(self, mocker, monkeypatch, tmp_path):
+        """Test a fresh process reuses the path persisted by an earlier one."""
+        driver_file = tmp_path / "geckodriver"
+        driver_file.write_text("driver")
+        mocker.patch("cluspro.browser._GECKODRIVER_PATH", None)
+        mock_manager = mocker.patch("cluspro.browser.GeckoDriverManager")
+        mock_manager.return_value.install.return_value = str(driver_file)
+
+        from cluspro import browser
+
+        assert browser._install_geckodriver() == str(driver_file)
+        assert browser.GECKODRIVER_CACHE_FILE.read_text() == str(driver_file)
+
+        # Simulate a new process: the in-memory path is gone, the file remains
+        monkeypatch.setattr(browser, "_GECKODRIVER_PATH", None)
+        assert browser._install_geckodriver() == str(driver_file)
+        mock_manager.return_value.install.assert_called_once()
+
+    def test_geckodriver_env_override(self, mocker, mock_config, monkeypatch):
+        """Test CLUSPRO_GECKODRIVER skips webdriver-manager."""
+        mocker.patch("cluspro.browser.webdriver")
+        mock_service = mocker.patch("cluspro.browser.FirefoxService")
+        mock_manager = mocker.patch("cluspro.browser.GeckoDriverManager")
+        monkeypatch.setenv("CLUSPRO_GECKODRIVER", "/opt/geckodriver")
+
+        from cluspro.browser import create_browser
+
+        create_browser(config=mock_config)
+
+        mock_manager.assert_not_called()
+        mock_service.assert_called_once_with("/opt/geckodriver")
+
+    def test_resolve_dir_recreates_removed_dir(self, tmp_path):
+        """Test a download directory removed between browsers is created again."""
+        from cluspro.browser import _resolve_dir
+
+        download_dir = tmp_path / "downloads"
+
+        assert _resolve_dir(str(download_dir)) == str(download_dir.resolve())
+        download_dir.rmdir()
+        assert _resolve_dir(str(download_dir)) == str(download_dir.resolve())
+        assert download_dir.is_dir()
+
 
 class TestBrowserSession:
     """Tests for browser_session context manager."""
@@ -62,6 +197,33 @@ class TestBrowserSession:
         mock_driver.quit.assert_called_once()
 
 
+class TestCreateHttpSession:
+    """Tests for create_http_session function."""
+
+    def test_cookies_match_login_host(self, mocker, mock_config):
+        """Test the session logs in on the given URL and sends its cookies there."""
+        import requests
+
+        mock_driver = MagicMock()
+        mock_driver.get_cookies.return_value = [
+            {"name": "PHPSESSID", "value": "abc", "domain": "cluspro.org", "path": "/"},
+            {"name": "pref", "value": "1", "path": "/"},
+        ]
+        mocker.patch("cluspro.browser.create_browser", return_value=mock_driver)
+        mocker.patch("cluspro.browser.authenticate")
+
+        from cluspro.browser import create_http_session
+
+        results_url = "https://cluspro.org/results.php"
+        session = create_http_session(config=mock_config, login_url=results_url)
+
+        mock_driver.get.assert_called_once_with(results_url)
+        assert {cookie.domain.lstrip(".") for cookie in session.cookies} == {"cluspro.org"}
+        request = session.prepare_request(requests.Request("GET", f"{results_url}?page=2"))
+        assert "PHPSESSID=abc" in request.headers["Cookie"]
+        assert "pref=1" in request.headers["Cookie"]
+
+
 class TestWaitForElement:
     """Tests for wait_for_element function."""
 
@@ -79,6 +241,28 @@ class TestWaitForElement:
         wait = wait_for_element(mock_driver, timeout=30)
         assert wait is not None
 
+    def test_fast_poll_frequency(self, mock_driver):
+        """Test explicit waits poll every 100ms by default."""
+        from cluspro.browser import wait_for_element
+
+        wait = wait_for_element(mock_driver, timeout=10)
+        assert wait._poll == 0.1
+
+    def test_poll_frequency_from_config(self, mocker, mock_config):
+        """Test browser.poll_frequency is used for the driver, floored at 0.1 s."""
+        mock_webdriver = mocker.patch("cluspro.browser.webdriver")
+        mock_webdriver.Firefox.side_effect = lambda **kw: MagicMock()
+        mocker.patch("cluspro.browser.GeckoDriverManager")
+
+        from cluspro.browser import create_browser, wait_for_element
+
+        slow = create_browser(config={**mock_config, "browser": {"poll_frequency": 0.25}})
+        fast = create_browser(config={**mock_config, "browser": {"poll_frequency": 0.01}})
+
+        assert wait_for_element(slow)._poll == 0.25
+        assert wait_for_element(fast)._poll == 0.1
+        assert wait_for_element(slow, poll_frequency=0.5)._poll == 0.5
+
 
 class TestClickGuestLogin:
     """Tests for click_guest_login function."""
@@ -95,6 +279,42 @@ class TestClickGuestLogin:
 
         mock_element.click.assert_called_once()
 
+    def test_retry_reloads_page_in_same_browser(self, mocker, mock_driver, mock_element):
+        """Test a failed click is retried after reloading the page, not a new browser."""
+        from selenium.common.exceptions import TimeoutException
+
+        mock_wait = MagicMock()
+        mock_wait.until = MagicMock(side_effect=[TimeoutException("slow"), mock_element])
+        mocker.patch("cluspro.browser.wait_for_element", return_value=mock_wait)
+        mocker.patch("time.sleep")
+        mock_create = mocker.patch("cluspro.browser.create_browser")
+        mock_driver.current_url = "https://cluspro.bu.edu/home.php"
+
+        from cluspro.browser import click_guest_login
+
+        click_guest_login(mock_driver)
+
+        mock_driver.get.assert_called_once_with("https://cluspro.bu.edu/home.php")
+        mock_element.click.assert_called_once()
+        mock_create.assert_not_called()
+
+    def test_retry_reloads_driver_passed_by_keyword(self, mocker, mock_driver, mock_element):
+        """Test the reload finds the driver when the page step is called with driver=."""
+        from selenium.common.exceptions import TimeoutException
+
+        mock_wait = MagicMock()
+        mock_wait.until = MagicMock(side_effect=[TimeoutException("slow"), mock_element])
+        mocker.patch("cluspro.browser.wait_for_element", return_value=mock_wait)
+        mocker.patch("time.sleep")
+        mock_driver.current_url = "https://cluspro.bu.edu/home.php"
+
+        from cluspro.browser import click_guest_login
+
+        click_guest_login(driver=mock_driver)
+
+        mock_driver.get.assert_called_once_with("https://cluspro.bu.edu/home.php")
+        mock_element.click.assert_called_once()
+
 
 class TestAuthenticate:
     """Tests for authenticate function."""
@@ -170,6 +390,38 @@ class TestPerformLogin:
         # Check that send_keys was called for username and password
         assert mock_element.send_keys.call_count >= 2
 
+    def test_perform_login_error_message(self, mocker, mock_driver, mock_element):
+        """Test an error shown on the login page raises AuthenticationError."""
+        from cluspro.auth import AuthenticationError, Credentials, CredentialSource
+
+        mock_wait = MagicMock()
+        mock_wait.until = MagicMock(side_effect=[mock_element, mock_element, "Invalid password"])
+        mocker.patch("cluspro.browser.wait_for_element", return_value=mock_wait)
+        mock_driver.find_element = MagicMock(return_value=mock_element)
+        mock_driver.current_url = "https://cluspro.bu.edu/login.php"
+
+        from cluspro.browser import perform_login
+
+        creds = Credentials(username="u", password="p", source=CredentialSource.ENVIRONMENT)
+
+        with pytest.raises(AuthenticationError, match="Invalid password"):
+            perform_login(mock_driver, creds)
+
+    def test_login_outcome(self, mock_driver, mock_element):
+        """Test the login wait condition for pending, success and error pages."""
+        from cluspro.browser import _login_outcome
+
+        mock_driver.find_elements = MagicMock(return_value=[])
+        mock_driver.current_url = "https://cluspro.bu.edu/login.php"
+        assert _login_outcome(mock_driver) is False
+
+        mock_driver.current_url = "https://cluspro.bu.edu/home.php"
+        assert _login_outcome(mock_driver) is True
+
+        mock_element.text = "Bad credentials"
+        mock_driver.find_elements = MagicMock(return_value=[mock_element])
+        assert _login_outcome(mock_driver) == "Bad credentials"
+
 
 class TestFindCachedGeckodriver:
     """Tests for _find_cached_geckodriver function."""
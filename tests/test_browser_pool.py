@@ -0,0 +1,116 @@
+"""Tests for browser_pool module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool class."""
+
+    def test_lease_reuses_driver(self, mocker, mock_config):
+        """Test the same driver is handed out across leases."""
+        mock_create = mocker.patch(
+            "cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock()
+        )
+
+        from cluspro.browser_pool import BrowserPool
+
+        pool = BrowserPool(size=1, config=mock_config)
+
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+
+        assert first is second
+        mock_create.assert_called_once()
+        first.quit.assert_not_called()
+
+    def test_lease_discards_driver_on_error(self, mocker, mock_config):
+        """Test a driver that raised is quit and replaced."""
+        mocker.patch("cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock())
+
+        from cluspro.browser_pool import BrowserPool
+
+        pool = BrowserPool(size=1, config=mock_config)
+
+        with pytest.raises(ValueError):
+            with pool.lease() as broken:
+                raise ValueError("Test error")
+
+        broken.quit.assert_called_once()
+
+        with pool.lease() as replacement:
+            assert replacement is not broken
+
+    def test_authenticate_once_per_driver(self, mocker, mock_config):
+        """Test pooled drivers only log in on first use."""
+        mocker.patch("cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock())
+        mock_auth = mocker.patch("cluspro.browser_pool.authenticate")
+
+        from cluspro.browser_pool import BrowserPool
+
+        pool = BrowserPool(config=mock_config)
+
+        for _ in range(3):
+            with pool.lease() as driver:
+                pool.authenticate(driver)
+
+        mock_auth.assert_called_once()
+
+    def test_authenticate_again_after_session_expired(self, mocker, mock_config):
+        """Test a pooled driver bounced to the login page logs in again."""
+        mocker.patch("cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock())
+        mock_auth = mocker.patch("cluspro.browser_pool.authenticate")
+
+        from cluspro.browser_pool import BrowserPool
+
+        pool = BrowserPool(config=mock_config)
+
+        with pool.lease() as driver:
+            driver.current_url = "https://cluspro.bu.edu/queue.php"
+            driver.find_elements.return_value = []
+            assert pool.authenticate(driver) is True
+            assert pool.authenticate(driver) is False
+
+            driver.current_url = "https://cluspro.bu.edu/login.php"
+            assert pool.authenticate(driver) is True
+
+        assert mock_auth.call_count == 2
+
+    def test_shutdown_quits_all(self, mocker, mock_config):
+        """Test shutdown quits every pooled browser."""
+        mocker.patch("cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock())
+
+        from cluspro.browser_pool import BrowserPool
+
+        with BrowserPool(size=2, config=mock_config) as pool:
+            first = pool.acquire()
+            second = pool.acquire()
+            pool.release(first)
+            pool.release(second)
+
+        first.quit.assert_called_once()
+        second.quit.assert_called_once()
+
+
+class TestBrowserSessionWithPool:
+    """Tests for browser_session leasing from a pool."""
+
+    def test_session_returns_driver_to_pool(self, mocker, mock_config):
+        """Test browser_session does not quit pooled drivers."""
+        mocker.patch("cluspro.browser_pool.create_browser", side_effect=lambda **kw: MagicMock())
+        mock_create = mocker.patch("cluspro.browser.create_browser")
+
+        from cluspro.browser import browser_session
+        from cluspro.browser_pool import BrowserPool
+
+        pool = BrowserPool(config=mock_config)
+
+        with browser_session(config=mock_config, pool=pool) as driver:
+            pass
+
+        mock_create.assert_not_called()
+        driver.quit.assert_not_called()
+        assert pool.acquire() is driver
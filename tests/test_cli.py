@@ -1,5 +1,9 @@
 """Tests for CLI module."""
 
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
 
 class TestMainCommand:
     """Tests for main CLI command."""
@@ -35,6 +39,26 @@ class TestMainCommand:
 
         assert result.exit_code == 0
 
+    def test_import_does_not_load_pandas(self):
+        """Test importing the CLI leaves pandas, yaml and auth unloaded until needed."""
+        code = (
+            "import sys, cluspro.cli; print({'pandas', 'yaml', 'cluspro.auth'} & set(sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "set()"
+
+    def test_daemon_import_does_not_load_auth(self):
+        """Test the daemon check in queue/results keeps cluspro.auth unloaded."""
+        code = "import sys, cluspro.daemon; print('cluspro.auth' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
 
 class TestSubmitCommand:
     """Tests for submit CLI command."""
@@ -75,6 +99,67 @@ class TestQueueCommand:
         assert "--pattern" in result.output
         assert "--user" in result.output
 
+    def test_queue_uses_running_daemon(self, cli_runner, mocker):
+        """Test queue is answered by a running daemon without starting a browser."""
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mocker.patch("cluspro.daemon.is_running", return_value=True)
+        mock_call = mocker.patch(
+            "cluspro.daemon.call", return_value=[{"job_name": "bb-1", "status": "running"}]
+        )
+        mock_queue = mocker.patch("cluspro.queue.get_queue_status")
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["queue", "--pattern", "bb-.*"])
+
+        assert result.exit_code == 0
+        assert "bb-1" in result.output
+        assert mock_call.call_args.args == (
+            "queue",
+            {"filter_user": None, "filter_pattern": "bb-.*"},
+        )
+        mock_queue.assert_not_called()
+
+    def test_queue_skips_daemon_with_other_login(self, cli_runner, mocker):
+        """Test a daemon started with another login does not answer --guest queue."""
+        import pandas as pd
+
+        from cluspro.daemon import DaemonMismatchError
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mocker.patch("cluspro.daemon.is_running", return_value=True)
+        mock_call = mocker.patch("cluspro.daemon.call", side_effect=DaemonMismatchError("x"))
+        mock_queue = mocker.patch(
+            "cluspro.queue.get_queue_status",
+            return_value=pd.DataFrame([{"job_name": "guest-1", "status": "running"}]),
+        )
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["--guest", "queue"])
+
+        assert result.exit_code == 0
+        assert "guest-1" in result.output
+        assert mock_call.call_args.kwargs["caller"]["user"] is None
+        assert mock_queue.call_args.kwargs["force_guest"] is True
+
+    def test_queue_long_table_is_tab_separated(self, cli_runner, mocker):
+        """Test a queue longer than the display threshold prints as TSV."""
+        import pandas as pd
+
+        from cluspro.cli import TSV_DISPLAY_ROWS, main
+
+        rows = TSV_DISPLAY_ROWS + 1
+        df = pd.DataFrame({"job_name": [f"bb-{i}" for i in range(rows)], "status": "running"})
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mocker.patch("cluspro.queue.get_queue_status", return_value=df)
+
+        result = cli_runner.invoke(main, ["queue"])
+
+        assert result.exit_code == 0
+        assert "job_name\tstatus" in result.output
+        assert f"bb-{rows - 1}\trunning" in result.output
+
 
 class TestDownloadCommand:
     """Tests for download CLI command."""
@@ -121,6 +206,17 @@ class TestExpandCommand:
         assert result.exit_code == 0
         assert "42" in result.output
 
+    def test_expand_skips_config(self, cli_runner, mocker):
+        """Test expand does not load the config file."""
+        from cluspro.cli import main
+
+        mock_load = mocker.patch("cluspro.cli.load_config")
+
+        result = cli_runner.invoke(main, ["expand", "1:2"])
+
+        assert result.exit_code == 0
+        mock_load.assert_not_called()
+
 
 class TestCompressCommand:
     """Tests for compress utility command."""
@@ -189,7 +285,7 @@ class TestJobsCommand:
 
         # Mock the database at the import location inside cli.py
         mock_db_class = mocker.patch("cluspro.database.JobDatabase")
-        mock_db_class.return_value.get_all_jobs.return_value = []
+        mock_db_class.return_value.iter_jobs.return_value = []
 
         from cluspro.cli import main
 
@@ -198,6 +294,64 @@ class TestJobsCommand:
         assert result.exit_code == 0
         assert "No jobs found" in result.output
 
+    def test_jobs_list_table(self, cli_runner, mocker):
+        """Test jobs list prints aligned, truncated columns."""
+        from datetime import datetime
+        from types import SimpleNamespace
+
+        from cluspro.database import JobStatus
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_db_class = mocker.patch("cluspro.database.JobDatabase")
+        mock_db_class.return_value.iter_jobs.return_value = [
+            SimpleNamespace(
+                id=7,
+                job_name="a-very-long-job-name-that-gets-cut",
+                cluspro_job_id=None,
+                status=JobStatus.PENDING,
+                submitted_at=datetime(2024, 1, 2, 3, 4),
+            )
+        ]
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["jobs", "list"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        header = next(line for line in lines if line.startswith("ID"))
+        row = lines[lines.index(header) + 2]
+        assert header.index("| Name") == row.index("| a-very")
+        assert row.split(" | ") == [
+            "7     ",
+            "a-very-long-job-name-that",
+            "-           ",
+            "pending     ",
+            "2024-01-02 03:04    ",
+        ]
+
+    def test_jobs_list_filters_in_one_query(self, cli_runner, mocker):
+        """Test batch, status and paging options go to a single query."""
+        from cluspro.database import JobStatus
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_db_class = mocker.patch("cluspro.database.JobDatabase")
+        mock_db = mock_db_class.return_value
+        mock_db.iter_jobs.return_value = iter([])
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(
+            main,
+            ["jobs", "list", "--batch", "b1", "--status", "failed", "--limit", "5"]
+            + ["--before-id", "40"],
+        )
+
+        assert result.exit_code == 0
+        mock_db.iter_jobs.assert_called_once_with(
+            batch_id="b1", status=JobStatus.FAILED, limit=5, before_id=40, name_pattern=None
+        )
+
     def test_jobs_status_requires_batch(self, cli_runner, mocker):
         """Test jobs status requires batch ID."""
         mocker.patch("cluspro.cli.load_config", return_value={})
@@ -209,6 +363,21 @@ class TestJobsCommand:
         assert result.exit_code != 0
         assert "Missing option" in result.output
 
+    def test_jobs_status_closes_database(self, cli_runner, mocker):
+        """Test the database is closed (and optimized) when the command ends."""
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_db = mocker.patch("cluspro.database.JobDatabase").return_value
+        mock_db.get_batch_summary.return_value = dict.fromkeys(
+            ["total", "pending", "submitted", "completed", "failed"], 0
+        )
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["jobs", "status", "--batch", "b1"])
+
+        assert result.exit_code == 0
+        mock_db.close.assert_called_once()
+
     def test_jobs_resume_requires_batch(self, cli_runner, mocker):
         """Test jobs resume requires batch ID."""
         mocker.patch("cluspro.cli.load_config", return_value={})
@@ -220,6 +389,102 @@ class TestJobsCommand:
         assert result.exit_code != 0
         assert "Missing option" in result.output
 
+    def test_jobs_resume_shares_pool(self, cli_runner, mocker):
+        """Test resumed jobs share one browser pool and every outcome is recorded."""
+        from types import SimpleNamespace
+
+        # Import before patching so submit keeps the real BrowserPool binding
+        import cluspro.submit  # noqa: F401
+        from cluspro.database import JobStatus
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_db = mocker.patch("cluspro.database.JobDatabase").return_value
+        mock_db.get_resumable_jobs.return_value = [
+            SimpleNamespace(
+                id=i, job_name=f"job{i}", receptor_pdb="r", ligand_pdb="l", server="gpu"
+            )
+            for i in range(3)
+        ]
+        mock_pool_class = mocker.patch("cluspro.browser_pool.BrowserPool")
+        mock_submit = mocker.patch(
+            "cluspro.submit.submit_job",
+            side_effect=lambda job_name, **kw: "100" if job_name != "job1" else 1 / 0,
+        )
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["jobs", "resume", "--batch", "b1", "--workers", "2"])
+
+        assert result.exit_code == 0
+        assert "Completed: 2/3" in result.output
+        assert mock_pool_class.call_args.kwargs["size"] == 2
+        pool = mock_pool_class.return_value.__enter__.return_value
+        assert all(c.kwargs["pool"] is pool for c in mock_submit.call_args_list)
+        mock_db.update_status_many.assert_called_once()
+        statuses = sorted(u[:2] for u in mock_db.update_status_many.call_args.args[0])
+        assert statuses == [
+            (0, JobStatus.SUBMITTED),
+            (1, JobStatus.FAILED),
+            (2, JobStatus.SUBMITTED),
+        ]
+
+    def test_jobs_resume_zero_workers_config(self, cli_runner, mocker):
+        """Test batch.browser_workers: 0 still runs with one browser."""
+        from types import SimpleNamespace
+
+        import cluspro.submit  # noqa: F401
+
+        mocker.patch("cluspro.cli.load_config", return_value={"batch": {"browser_workers": 0}})
+        mock_db = mocker.patch("cluspro.database.JobDatabase").return_value
+        mock_db.get_resumable_jobs.return_value = [
+            SimpleNamespace(id=1, job_name="job1", receptor_pdb="r", ligand_pdb="l", server="gpu")
+        ]
+        mock_pool_class = mocker.patch("cluspro.browser_pool.BrowserPool")
+        mocker.patch("cluspro.submit.submit_job", return_value="100")
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["jobs", "resume", "--batch", "b1"])
+
+        assert result.exit_code == 0
+        assert mock_pool_class.call_args.kwargs["size"] == 1
+
+    def test_jobs_resume_interrupt_cancels_queued_jobs(self, cli_runner, mocker):
+        """Test an interrupt stops queued submissions and records those in flight."""
+        from types import SimpleNamespace
+
+        import cluspro.submit  # noqa: F401
+        from cluspro.database import JobStatus
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_db = mocker.patch("cluspro.database.JobDatabase").return_value
+        mock_db.get_resumable_jobs.return_value = [
+            SimpleNamespace(
+                id=i, job_name=f"job{i}", receptor_pdb="r", ligand_pdb="l", server="gpu"
+            )
+            for i in range(5)
+        ]
+        mocker.patch("cluspro.browser_pool.BrowserPool")
+
+        def fake_submit(job_name, **kw):
+            if job_name == "job0":
+                raise KeyboardInterrupt
+            return "100"
+
+        mock_submit = mocker.patch("cluspro.submit.submit_job", side_effect=fake_submit)
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["jobs", "resume", "--batch", "b1", "--workers", "1"])
+
+        assert result.exit_code != 0
+        # job0 interrupts; at most the job the worker had already picked up runs
+        assert mock_submit.call_count <= 2
+        recorded = mock_db.update_status_many.call_args.args[0]
+        assert [u[:2] for u in recorded] == [
+            (i, JobStatus.SUBMITTED) for i in range(1, mock_submit.call_count)
+        ]
+
 
 class TestResultsCommand:
     """Tests for results CLI command."""
@@ -234,6 +499,43 @@ class TestResultsCommand:
         assert "--pattern" in result.output
         assert "--max-pages" in result.output
 
+    def test_invalid_pattern_rejected(self, cli_runner, mocker):
+        """Test a malformed --pattern fails before any results are fetched."""
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_results = mocker.patch("cluspro.results.get_finished_jobs")
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["results", "--pattern", "bb-("])
+
+        assert result.exit_code != 0
+        assert "invalid regex" in result.output
+        mock_results.assert_not_called()
+
+    def test_results_table_is_capped(self, cli_runner, mocker):
+        """Test only the first rows are printed while all IDs are compressed."""
+        import pandas as pd
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        df = pd.DataFrame(
+            {
+                "job_name": [f"job-{i}" for i in range(60)],
+                "job_id": pd.array(range(1000, 1060), dtype="Int64"),
+                "status": ["finished"] * 60,
+            }
+        )
+        mocker.patch("cluspro.results.get_finished_jobs", return_value=df)
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["results"])
+
+        assert result.exit_code == 0
+        assert "1000:1059" in result.output
+        assert "job-49" in result.output
+        assert "job-50" not in result.output
+        assert "...and 10 more" in result.output
+
 
 class TestSummaryCommand:
     """Tests for summary CLI command."""
@@ -333,6 +635,51 @@ class TestValidateCommand:
         assert result.exit_code != 0
         assert "Either --topology or --uniprot is required" in result.output
 
+    def test_validate_summary_statistics(self, cli_runner, mocker, tmp_path):
+        """Test the summary averages EC% and counts clash-free and high-EC models."""
+        from types import ModuleType, SimpleNamespace
+
+        mocker.patch("cluspro.cli.load_config", return_value={})
+
+        def result(ec_pct, clashes, error=None):
+            return SimpleNamespace(
+                target="t",
+                model="m",
+                clashes=clashes,
+                ec_pct=ec_pct,
+                validity_score=0.0,
+                error=error,
+            )
+
+        fake_validate = ModuleType("cluspro.validate")
+        fake_validate.load_topology_from_json = MagicMock(
+            return_value=SimpleNamespace(extracellular=[], transmembrane=[], intracellular=[])
+        )
+        fake_validate.fetch_topology_from_uniprot = MagicMock()
+        fake_validate.validate_docking = MagicMock(
+            return_value=[result(95.0, 0), result(80.0, 3), result(0.0, 0, error="failed")]
+        )
+        mocker.patch.dict("sys.modules", {"cluspro.validate": fake_validate})
+
+        receptor = tmp_path / "receptor.pdb"
+        receptor.write_text("ATOM")
+        topology = tmp_path / "topology.json"
+        topology.write_text("{}")
+
+        from cluspro.cli import main
+
+        outcome = cli_runner.invoke(
+            main,
+            ["validate", "-r", str(receptor), "-d", str(tmp_path), "-t", str(topology)],
+        )
+
+        assert outcome.exit_code == 0, outcome.output
+        assert "2     t                   m                 3         80.0    0.0" in outcome.output
+        assert "\n3 " not in outcome.output
+        assert "Average EC%: 87.5%" in outcome.output
+        assert "Zero clashes: 1/2" in outcome.output
+        assert "EC% >= 90%: 1/2" in outcome.output
+
 
 class TestMutuallyExclusiveFlags:
     """Tests for mutually exclusive CLI flags."""
@@ -410,6 +757,18 @@ class TestDownloadBatchCommand:
         assert result.exit_code != 0
         assert "Missing option" in result.output
 
+    def test_download_batch_workers(self, cli_runner, mocker):
+        """Test --workers is passed through to download_batch."""
+        mocker.patch("cluspro.cli.load_config", return_value={})
+        mock_batch = mocker.patch("cluspro.download.download_batch", return_value={})
+
+        from cluspro.cli import main
+
+        result = cli_runner.invoke(main, ["download-batch", "--ids", "1:4", "--workers", "3"])
+
+        assert result.exit_code == 0
+        assert mock_batch.call_args.kwargs["workers"] == 3
+
 
 class TestDryRunExecution:
     """Tests for dry-run command execution."""
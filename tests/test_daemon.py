@@ -0,0 +1,132 @@
+"""Tests for daemon module."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def running_daemon(mocker, mock_config, tmp_path):
+    """Serve the daemon on a temporary socket in a background thread."""
+    from cluspro.daemon import create_server
+
+    socket_path = tmp_path / "d.sock"
+    server = create_server(MagicMock(), socket_path=socket_path, config=mock_config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield socket_path, server
+
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestDaemon:
+    """Tests for the daemon server and client."""
+
+    def test_not_running_without_socket(self, tmp_path):
+        """Test is_running is False when no daemon is listening."""
+        from cluspro.daemon import is_running
+
+        assert not is_running(tmp_path / "missing.sock")
+
+    def test_is_running_pings_without_error(self, running_daemon, caplog):
+        """Test is_running gets a reply and leaves no failed request behind."""
+        import logging
+        import socket
+
+        socket_path, _ = running_daemon
+        caplog.set_level(logging.DEBUG, logger="cluspro.daemon")
+
+        from cluspro.daemon import call, is_running
+
+        assert is_running(socket_path)
+        assert call("ping", socket_path=socket_path) == "pong"
+
+        # A client that connects and leaves without a request is ignored
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        assert is_running(socket_path)
+
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+    def test_not_running_when_listener_does_not_answer(self, tmp_path):
+        """Test a socket whose listener closes without replying is not a daemon."""
+        import socket
+
+        from cluspro.daemon import is_running
+
+        path = tmp_path / "other.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(str(path))
+            listener.listen()
+            accepter = threading.Thread(target=lambda: listener.accept()[0].close())
+            accepter.start()
+
+            assert not is_running(path)
+            accepter.join(timeout=5)
+
+    def test_queue_request_uses_pool(self, mocker, running_daemon):
+        """Test a queue request runs against the daemon's pool and returns rows."""
+        socket_path, server = running_daemon
+        mock_queue = mocker.patch(
+            "cluspro.queue.get_queue_status",
+            return_value=pd.DataFrame([{"job_name": "bb-1", "status": "running"}]),
+        )
+
+        from cluspro.daemon import call, is_running
+
+        assert is_running(socket_path)
+        rows = call("queue", {"filter_pattern": "bb-.*"}, socket_path=socket_path)
+
+        assert rows == [{"job_name": "bb-1", "status": "running"}]
+        assert mock_queue.call_args.kwargs["pool"] is server.pool
+        assert mock_queue.call_args.kwargs["filter_pattern"] == "bb-.*"
+
+    def test_errors_are_reported(self, mocker, running_daemon):
+        """Test failures in the daemon surface as DaemonError on the client."""
+        socket_path, _ = running_daemon
+        mocker.patch("cluspro.results.get_finished_jobs", side_effect=ValueError("boom"))
+
+        from cluspro.daemon import DaemonError, call
+
+        with pytest.raises(DaemonError, match="boom"):
+            call("results", socket_path=socket_path)
+
+        with pytest.raises(DaemonError, match="Unknown"):
+            call("not-a-method", socket_path=socket_path)
+
+    def test_refuses_caller_with_other_identity(self, mocker, mock_config, running_daemon):
+        """Test requests from another login or config are refused, matching ones served."""
+        socket_path, server = running_daemon
+        mocker.patch("cluspro.queue.get_queue_status", return_value=pd.DataFrame())
+
+        from cluspro.auth import Credentials, CredentialSource
+        from cluspro.daemon import DaemonMismatchError, call, identity
+
+        account = Credentials("user", "secret", CredentialSource.ENVIRONMENT)
+        same = identity(mock_config, None, False, True)
+        assert call("queue", socket_path=socket_path, caller=same) == []
+
+        for other in (
+            identity(mock_config, account, False, True),
+            identity({**mock_config, "batch": {}}, None, False, True),
+            identity(mock_config, None, False, False),
+        ):
+            with pytest.raises(DaemonMismatchError):
+                call("queue", socket_path=socket_path, caller=other)
+
+        # Forcing guest mode is the same login as having no credentials
+        assert identity(mock_config, account, True, True) == server.identity
+
+    def test_refuses_second_daemon(self, running_daemon):
+        """Test a second daemon cannot bind a socket that is in use."""
+        socket_path, _ = running_daemon
+
+        from cluspro.daemon import create_server
+
+        with pytest.raises(RuntimeError, match="already running"):
+            create_server(MagicMock(), socket_path=socket_path)
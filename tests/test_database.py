@@ -1,7 +1,11 @@
 """Tests for database module."""
 
+import os
+import time
 from datetime import datetime
 
+import pytest
+
 from cluspro.database import Job, JobStatus
 
 
@@ -33,6 +37,22 @@ class TestJobDatabase:
 
         assert job.batch_id == "batch-001"
 
+    def test_create_jobs(self, test_db):
+        """Test creating several job records in one call."""
+        test_db.create_job("existing", "/r.pdb", "/l.pdb")
+
+        ids = test_db.create_jobs(
+            [
+                ("job1", "/r1.pdb", "/l1.pdb", "gpu", "batch1"),
+                ("job2", "/r2.pdb", "/l2.pdb", "cpu", None),
+            ]
+        )
+
+        first, second = (test_db.get_job(job_id) for job_id in ids)
+        assert (first.job_name, first.server, first.batch_id) == ("job1", "gpu", "batch1")
+        assert (second.job_name, second.server, second.batch_id) == ("job2", "cpu", None)
+        assert test_db.create_jobs([]) == []
+
     def test_get_job(self, test_db):
         """Test retrieving a job by ID."""
         created = test_db.create_job(
@@ -59,6 +79,15 @@ class TestJobDatabase:
         assert retrieved is not None
         assert retrieved.job_name == "unique-job-name"
 
+    def test_job_exists_and_id_by_name(self, test_db):
+        """Test name lookups that skip loading the job record."""
+        job = test_db.create_job("named-job", "/r.pdb", "/l.pdb")
+
+        assert test_db.job_exists("named-job")
+        assert not test_db.job_exists("other-job")
+        assert test_db.get_job_id_by_name("named-job") == job.id
+        assert test_db.get_job_id_by_name("other-job") is None
+
     def test_get_job_not_found(self, test_db):
         """Test retrieving non-existent job."""
         result = test_db.get_job(99999)
@@ -79,6 +108,36 @@ class TestJobDatabase:
         assert updated.cluspro_job_id == 12345
         assert updated.submitted_at is not None
 
+    def test_close_twice(self, tmp_path):
+        """Test closing an already closed database is a no-op."""
+        from cluspro.database import JobDatabase
+
+        with JobDatabase(tmp_path / "jobs.db") as db:
+            db.close()
+
+        db.close()
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="time.tzset is Unix-only")
+    def test_update_status_stamps_local_time(self, test_db, monkeypatch):
+        """Test SQLite stamps status changes in local time, like datetime.now()."""
+        original_tz = os.environ.get("TZ")
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        try:
+            job = test_db.create_job("test-job", "/r.pdb", "/l.pdb")
+            test_db.update_status(job.id, JobStatus.COMPLETED)
+            completed_at = test_db.get_job(job.id).completed_at
+            drift = abs((completed_at - datetime.now()).total_seconds())
+        finally:
+            # Put TZ back before re-reading it; other fixtures stay patched
+            if original_tz is None:
+                monkeypatch.delenv("TZ")
+            else:
+                monkeypatch.setenv("TZ", original_tz)
+            time.tzset()
+
+        assert drift < 60
+
     def test_update_status_completed(self, test_db):
         """Test updating job status to completed."""
         job = test_db.create_job(
@@ -107,6 +166,80 @@ class TestJobDatabase:
         assert updated.status == JobStatus.FAILED
         assert updated.error_message == "Test error"
 
+    def test_update_status_many(self, test_db):
+        """Test several status updates applied together."""
+        jobs = [test_db.create_job(f"job{i}", "/r.pdb", "/l.pdb") for i in range(3)]
+
+        test_db.update_status_many(
+            [
+                (jobs[0].id, JobStatus.SUBMITTED, 111, None),
+                (jobs[1].id, JobStatus.FAILED, None, "boom"),
+                (jobs[2].id, JobStatus.RUNNING, None, None),
+            ]
+        )
+
+        first, second, third = (test_db.get_job(job.id) for job in jobs)
+        assert (first.status, first.cluspro_job_id) == (JobStatus.SUBMITTED, 111)
+        assert (second.status, second.error_message) == (JobStatus.FAILED, "boom")
+        assert third.status == JobStatus.RUNNING
+
+    def test_update_status_many_last_update_wins(self, test_db):
+        """Test repeated updates for one job apply in list order."""
+        job = test_db.create_job("job", "/r.pdb", "/l.pdb")
+
+        test_db.update_status_many(
+            [
+                (job.id, JobStatus.COMPLETED, None, None),
+                (job.id, JobStatus.SUBMITTED, 222, None),
+            ]
+        )
+
+        updated = test_db.get_job(job.id)
+        assert (updated.status, updated.cluspro_job_id) == (JobStatus.SUBMITTED, 222)
+
+    def test_update_status_bulk(self, test_db, mocker):
+        """Test one status applied to many jobs, across several chunks."""
+        mocker.patch("cluspro.database.BULK_UPDATE_CHUNK", 2)
+        ids = test_db.create_jobs([(f"job{i}", "/r.pdb", "/l.pdb", "gpu", None) for i in range(5)])
+
+        test_db.update_status_bulk(ids[:4], JobStatus.FAILED, error_message="quota")
+
+        jobs = [test_db.get_job(job_id) for job_id in ids]
+        assert [j.status for j in jobs] == [JobStatus.FAILED] * 4 + [JobStatus.PENDING]
+        assert all(j.error_message == "quota" and j.completed_at for j in jobs[:4])
+
+    def test_uses_wal_journal(self, test_db):
+        """Test the database is switched to write-ahead logging."""
+        with test_db._connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_reuses_one_connection(self, test_db):
+        """Test every call shares the connection opened by the instance."""
+        with test_db._connection() as first, test_db._connection() as second:
+            assert first is second
+
+    def test_close_releases_connection(self, tmp_path):
+        """Test close() closes the shared connection."""
+        import sqlite3
+
+        from cluspro.database import JobDatabase
+
+        with JobDatabase(db_path=tmp_path / "jobs.db") as db:
+            db.create_job("job1", "/r.pdb", "/l.pdb")
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.get_job(1)
+        assert JobDatabase(db_path=tmp_path / "jobs.db").get_job(1).job_name == "job1"
+
+    def test_connections_use_normal_sync(self, test_db):
+        """Test connections relax fsync to NORMAL, which is safe under WAL."""
+        with test_db._connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        assert synchronous == 1
+
     def test_get_pending_jobs(self, test_db):
         """Test getting pending jobs."""
         test_db.create_job("job1", "/r.pdb", "/l.pdb", batch_id="batch1")
@@ -134,6 +267,21 @@ class TestJobDatabase:
 
         assert len(failed) == 1
 
+    def test_get_resumable_jobs(self, test_db):
+        """Test resumable jobs are pending, plus failed on request."""
+        job1 = test_db.create_job("job1", "/r.pdb", "/l.pdb", batch_id="batch1")
+        job2 = test_db.create_job("job2", "/r.pdb", "/l.pdb", batch_id="batch1")
+        test_db.create_job("job3", "/r.pdb", "/l.pdb", batch_id="batch1")
+        test_db.create_job("job4", "/r.pdb", "/l.pdb", batch_id="batch2")
+        test_db.update_status(job1.id, JobStatus.FAILED)
+        test_db.update_status(job2.id, JobStatus.SUBMITTED)
+
+        pending = test_db.get_resumable_jobs("batch1")
+        resumable = test_db.get_resumable_jobs("batch1", include_failed=True)
+
+        assert [j.job_name for j in pending] == ["job3"]
+        assert [j.job_name for j in resumable] == ["job1", "job3"]
+
     def test_get_jobs_by_batch(self, test_db):
         """Test getting jobs by batch ID."""
         test_db.create_job("job1", "/r.pdb", "/l.pdb", batch_id="batch1")
@@ -144,6 +292,20 @@ class TestJobDatabase:
 
         assert len(batch1_jobs) == 2
 
+    def test_iter_batch_jobs(self, test_db):
+        """Test batch jobs stream lazily, in creation order."""
+        ids = test_db.create_jobs(
+            [(f"job{i}", "/r.pdb", "/l.pdb", "gpu", "batch1") for i in range(3)]
+        )
+        test_db.update_status(ids[1], JobStatus.COMPLETED)
+
+        jobs = test_db.iter_batch_jobs("batch1")
+        first = next(jobs)
+        jobs.close()
+
+        assert first.id == ids[0]
+        assert [j.id for j in test_db.iter_batch_jobs("batch1", [JobStatus.COMPLETED])] == [ids[1]]
+
     def test_get_all_jobs(self, test_db):
         """Test getting all jobs."""
         test_db.create_job("job1", "/r.pdb", "/l.pdb")
@@ -166,6 +328,62 @@ class TestJobDatabase:
         assert len(completed) == 1
         assert len(pending) == 1
 
+    def test_query_jobs_filters_and_pages(self, test_db):
+        """Test query_jobs combines filters and pages newest first by ID."""
+        jobs = [
+            test_db.create_job(f"job{i}", "/r.pdb", "/l.pdb", batch_id="batch1") for i in range(5)
+        ]
+        test_db.create_job("other", "/r.pdb", "/l.pdb", batch_id="batch2")
+        test_db.update_status(jobs[1].id, JobStatus.FAILED)
+
+        first_page = test_db.query_jobs(batch_id="batch1", status=JobStatus.PENDING, limit=2)
+        next_page = test_db.query_jobs(
+            batch_id="batch1", status=JobStatus.PENDING, limit=2, before_id=first_page[-1].id
+        )
+
+        assert [j.job_name for j in first_page] == ["job4", "job3"]
+        assert [j.job_name for j in next_page] == ["job2", "job0"]
+
+    def test_query_jobs_name_pattern(self, test_db):
+        """Test name patterns run in SQL with --pattern (re.match) semantics."""
+        for name in ["bb-1", "bb-2", "BB-3", "pad-bb-4", "b*x", "bb_5"]:
+            test_db.create_job(name, "/r.pdb", "/l.pdb")
+
+        def names(pattern):
+            return sorted(j.job_name for j in test_db.query_jobs(name_pattern=pattern))
+
+        assert names("bb-.*") == ["bb-1", "bb-2"]
+        assert names("bb[-_][15]") == ["bb-1", "bb_5"]
+        assert names("b\\*") == ["b*x"]
+
+    def test_iter_jobs_is_lazy(self, test_db):
+        """Test iter_jobs yields jobs one at a time, newest first."""
+        for i in range(3):
+            test_db.create_job(f"job{i}", "/r.pdb", "/l.pdb")
+
+        jobs = test_db.iter_jobs(limit=2)
+
+        assert next(jobs).job_name == "job2"
+        assert [j.job_name for j in jobs] == ["job1"]
+
+    def test_iter_jobs_releases_connection_between_rows(self, test_db):
+        """Test another thread can write while an iterator is paused mid-way."""
+        import threading
+
+        for i in range(3):
+            test_db.create_job(f"job{i}", "/r.pdb", "/l.pdb")
+
+        jobs = test_db.iter_jobs()
+        first = next(jobs)
+
+        writer = threading.Thread(target=test_db.create_job, args=("late", "/r.pdb", "/l.pdb"))
+        writer.start()
+        writer.join(timeout=5)
+
+        assert not writer.is_alive()
+        assert first.job_name == "job2"
+        assert [j.job_name for j in jobs] == ["job1", "job0"]
+
     def test_get_batch_summary(self, test_db):
         """Test batch summary."""
         job1 = test_db.create_job("job1", "/r.pdb", "/l.pdb", batch_id="batch1")
@@ -178,6 +396,14 @@ class TestJobDatabase:
         assert summary["total"] == 2
         assert summary["pending"] == 1
         assert summary["completed"] == 1
+        assert summary["failed"] == 0
+
+    def test_get_batch_summary_unknown_batch(self, test_db):
+        """Test summary counts are zero for a batch with no jobs."""
+        summary = test_db.get_batch_summary("missing")
+
+        assert summary["total"] == 0
+        assert summary["pending"] == 0
 
     def test_delete_job(self, test_db):
         """Test deleting a job."""
@@ -1,8 +1,11 @@
 """Tests for download module."""
 
+import io
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 
 class TestDownloadResults:
     """Tests for download_results function."""
@@ -43,6 +46,33 @@ class TestDownloadResults:
 
         assert result_path.exists()
 
+    def test_download_timeout_leaves_shared_dir_alone(self, mocker, mock_config, tmp_path):
+        """Test a timed-out download does not pick up another job's files."""
+        mock_driver = MagicMock()
+        mock_driver.find_element.return_value.text = "Job Details: test-job"
+
+        mock_session = mocker.patch("cluspro.download.browser_session")
+        mock_session.return_value.__enter__ = MagicMock(return_value=mock_driver)
+        mock_session.return_value.__exit__ = MagicMock(return_value=False)
+
+        mocker.patch("cluspro.download.authenticate")
+        mocker.patch("cluspro.download.wait_for_element")
+        mocker.patch("cluspro.download._download_pdb_models", return_value=None)
+        mocker.patch("cluspro.download._download_scores", return_value=None)
+        mocker.patch("time.sleep")
+
+        # Downloads belonging to other jobs in the shared output directory
+        (tmp_path / "cluspro.999.tar.bz2").write_bytes(b"")
+        (tmp_path / "cluspro.999.csv").write_text("scores")
+
+        from cluspro.download import download_results
+
+        result_path = download_results(job_id=12345, output_dir=tmp_path, config=mock_config)
+
+        assert (tmp_path / "cluspro.999.tar.bz2").exists()
+        assert (tmp_path / "cluspro.999.csv").exists()
+        assert list(result_path.iterdir()) == []
+
 
 class TestExtractArchive:
     """Tests for extract_archive function."""
@@ -74,6 +104,148 @@ class TestExtractArchive:
 
         assert "No tar.bz2 archive found" in caplog.text
 
+    def test_extract_moves_archive_contents(self, tmp_path):
+        """Test the archive is unpacked into the job directory and removed."""
+        import tarfile
+
+        source = tmp_path / "source" / "cluspro.123"
+        source.mkdir(parents=True)
+        (source / "model.000.00.pdb").write_text("ATOM\n")
+        archive = tmp_path / "cluspro.123.tar.bz2"
+        with tarfile.open(archive, "w:bz2") as tar:
+            tar.add(source, arcname="cluspro.123")
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        from cluspro.download import extract_archive
+
+        extract_archive(tmp_path, output_dir)
+
+        assert (output_dir / "model.000.00.pdb").read_text() == "ATOM\n"
+        assert not archive.exists()
+        assert not (tmp_path / "cluspro.123").exists()
+
+    def test_extract_replaces_existing_outputs(self, tmp_path):
+        """Test re-extracting overwrites files and directories from a previous run."""
+        import tarfile
+
+        source = tmp_path / "source" / "cluspro.123"
+        (source / "models").mkdir(parents=True)
+        (source / "models" / "new.pdb").write_text("new\n")
+        (source / "model.pdb").write_text("new\n")
+        with tarfile.open(tmp_path / "cluspro.123.tar.bz2", "w:bz2") as tar:
+            tar.add(source, arcname="cluspro.123")
+
+        output_dir = tmp_path / "output"
+        (output_dir / "models").mkdir(parents=True)
+        (output_dir / "models" / "old.pdb").write_text("old\n")
+        (output_dir / "model.pdb").write_text("old\n")
+
+        from cluspro.download import extract_archive
+
+        extract_archive(tmp_path, output_dir)
+
+        assert (output_dir / "model.pdb").read_text() == "new\n"
+        assert [p.name for p in (output_dir / "models").iterdir()] == ["new.pdb"]
+
+    def test_extract_without_data_filter(self, monkeypatch, tmp_path):
+        """Test the fallback for Pythons without tarfile.data_filter still extracts."""
+        import tarfile
+
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        source = tmp_path / "source" / "cluspro.123"
+        source.mkdir(parents=True)
+        (source / "model.pdb").write_text("ATOM\n")
+        (source / "latest.pdb").symlink_to("model.pdb")
+        with tarfile.open(tmp_path / "cluspro.123.tar.bz2", "w:bz2") as tar:
+            tar.add(source, arcname="cluspro.123")
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        from cluspro.download import extract_archive
+
+        extract_archive(tmp_path, output_dir)
+
+        assert (output_dir / "model.pdb").read_text() == "ATOM\n"
+        assert (output_dir / "latest.pdb").is_symlink()
+
+    @pytest.mark.parametrize(
+        ("name", "kind", "linkname"),
+        [
+            ("/tmp/evil.pdb", "file", ""),
+            ("cluspro.123/../../evil.pdb", "file", ""),
+            ("cluspro.123/evil", "symlink", "../../evil"),
+            ("cluspro.123/evil", "symlink", "/etc/passwd"),
+            ("cluspro.123/evil", "hardlink", "../evil.pdb"),
+            ("cluspro.123/evil", "fifo", ""),
+        ],
+    )
+    def test_extract_without_data_filter_refuses_unsafe_members(
+        self, monkeypatch, tmp_path, caplog, name, kind, linkname
+    ):
+        """Test the fallback refuses members that would land outside download_dir."""
+        import tarfile
+
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        download_dir = tmp_path / "downloads"
+        download_dir.mkdir()
+        archive = download_dir / "cluspro.123.tar.bz2"
+
+        member = tarfile.TarInfo(name)
+        member.type = {
+            "file": tarfile.REGTYPE,
+            "symlink": tarfile.SYMTYPE,
+            "hardlink": tarfile.LNKTYPE,
+            "fifo": tarfile.FIFOTYPE,
+        }[kind]
+        member.linkname = linkname
+        with tarfile.open(archive, "w:bz2") as tar:
+            tar.addfile(member, io.BytesIO(b""))
+
+        from cluspro.download import extract_archive
+
+        extract_archive(download_dir, tmp_path / "output")
+
+        assert "Refusing" in caplog.text
+        assert archive.exists()
+        assert not (tmp_path / "evil.pdb").exists()
+        assert not (download_dir / "cluspro.123" / "evil").exists()
+
+
+class TestWaitForDownload:
+    """Tests for _wait_for_download function."""
+
+    def test_returns_new_finished_file(self, tmp_path):
+        """Test the wait ends at the first new file without a .part sibling."""
+        from cluspro.download import _wait_for_download
+
+        (tmp_path / "old.csv").write_text("")
+        (tmp_path / "partial.csv").write_text("")
+        (tmp_path / "partial.csv.part").write_text("")
+        (tmp_path / "scores.csv").write_text("")
+
+        result = _wait_for_download(tmp_path, ".csv", timeout=5, existing={"old.csv"})
+
+        assert result == tmp_path / "scores.csv"
+
+    def test_times_out_without_download(self, tmp_path, caplog):
+        """Test the wait gives up after the timeout when nothing finishes."""
+        import logging
+
+        caplog.set_level(logging.WARNING)
+
+        from cluspro.download import _wait_for_download
+
+        (tmp_path / "job.tar.bz2").write_text("")
+        (tmp_path / "job.tar.bz2.part").write_text("")
+
+        result = _wait_for_download(tmp_path, ".tar.bz2", timeout=0, existing=set())
+
+        assert result is None
+        assert "No .tar.bz2 download finished" in caplog.text
+
 
 class TestMoveScoreFile:
     """Tests for move_score_file function."""
@@ -95,6 +267,22 @@ class TestMoveScoreFile:
         moved_files = list(output_dir.glob("*.balanced.csv"))
         assert len(moved_files) == 1
 
+    def test_move_score_file_given_path(self, tmp_path):
+        """Test a known CSV path is moved even when other CSVs are present."""
+        (tmp_path / "a_other.csv").write_text("other\n")
+        csv_file = tmp_path / "scores.csv"
+        csv_file.write_text("col1,col2\n1,2\n")
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        from cluspro.download import move_score_file
+
+        move_score_file(tmp_path, output_dir, csv_path=csv_file)
+
+        assert (output_dir / "scores.balanced.csv").exists()
+        assert (tmp_path / "a_other.csv").exists()
+
     def test_move_score_file_no_csv(self, tmp_path, caplog):
         """Test move_score_file with no CSV present."""
         import logging
@@ -116,6 +304,7 @@ class TestDownloadBatch:
 
     def test_download_batch_expands_sequence(self, mocker, mock_config):
         """Test batch download expands sequence notation."""
+        mock_config["download"] = {"http": False}
         mock_download = mocker.patch("cluspro.download.download_results")
         mock_download.return_value = Path("/tmp/result")
         mocker.patch("cluspro.download.load_config", return_value=mock_config)
@@ -127,8 +316,25 @@ class TestDownloadBatch:
 
         assert mock_download.call_count == 3
 
+    def test_download_batch_reuses_one_browser(self, mocker, mock_config, tmp_path):
+        """Test browser downloads share one pool whose download dir is the output dir."""
+        mock_config["download"] = {"http": False}
+        mock_download = mocker.patch("cluspro.download.download_results")
+        mocker.patch("time.sleep")
+
+        from cluspro.download import download_batch
+
+        download_batch([1, 2], output_dir=tmp_path, progress=False, config=mock_config)
+
+        pools = {call.kwargs["pool"] for call in mock_download.call_args_list}
+        assert len(pools) == 1
+        pool = pools.pop()
+        assert pool.size == 1
+        assert pool.download_dir == str(tmp_path.resolve())
+
     def test_download_batch_continues_on_error(self, mocker, mock_config):
         """Test continue_on_error behavior."""
+        mock_config["download"] = {"http": False}
         mocker.patch("cluspro.download.download_results", side_effect=Exception("Error"))
         mocker.patch("cluspro.download.load_config", return_value=mock_config)
         mocker.patch("time.sleep")
@@ -150,6 +356,100 @@ class TestDownloadBatch:
 
         assert results == {}
 
+    def test_download_batch_uses_http_for_multiple_jobs(self, mocker, mock_config):
+        """Test multi-job batches go through the parallel HTTP path."""
+        mock_http = mocker.patch(
+            "cluspro.download_fast.download_batch_http",
+            return_value={1: {"status": "success", "path": "/tmp/a"}},
+        )
+        mock_download = mocker.patch("cluspro.download.download_results")
+
+        from cluspro.download import download_batch
+
+        results = download_batch([1, 2], progress=False, config=mock_config)
+
+        mock_http.assert_called_once()
+        mock_download.assert_not_called()
+        assert results[1]["status"] == "success"
+
+
+class TestDownloadBatchHttp:
+    """Tests for the parallel HTTP download path."""
+
+    MODELS_HTML = """
+    <html><body>
+    <div id="main-header-right"></div><h3>Job Details: my-job</h3>
+    <a href="/files/cluspro.1.tar.bz2">Download all Models for all Coefficients</a>
+    <a href="scores.php?job=1">View Model Scores</a>
+    </body></html>
+    """
+    SCORES_HTML = """
+    <html><body>
+    <a href="/files/model_scores.csv">Download Model Scores for this Coefficient</a>
+    </body></html>
+    """
+
+    def _fake_session(self):
+        """Build a session whose GETs return canned pages and files."""
+
+        def get(url, stream=False, timeout=None):
+            response = MagicMock()
+            response.url = url
+            response.headers = {}
+            response.__enter__ = MagicMock(return_value=response)
+            response.__exit__ = MagicMock(return_value=False)
+            if "models.php" in url:
+                response.text = self.MODELS_HTML
+            elif "scores.php" in url:
+                response.text = self.SCORES_HTML
+            else:
+                response.raw = io.BytesIO(b"a,b\n1,2\n")
+            return response
+
+        session = MagicMock()
+        session.get = MagicMock(side_effect=get)
+        return session
+
+    def test_download_one_writes_scores(self, mocker, tmp_path):
+        """Test a job's score CSV is streamed into its named directory."""
+        mocker.patch("cluspro.download_fast.extract_archive")
+
+        from cluspro.download_fast import _download_one
+
+        job_dir = _download_one(
+            self._fake_session(),
+            1,
+            tmp_path,
+            "https://cluspro.bu.edu/models.php",
+            download_pdb=True,
+        )
+
+        assert job_dir == tmp_path / "my-job"
+        assert (job_dir / "model_scores.balanced.csv").read_text() == "a,b\n1,2\n"
+        # Staging directories are cleaned up
+        assert [p.name for p in tmp_path.iterdir()] == ["my-job"]
+
+    def test_download_batch_http_collects_errors(self, mocker, mock_config, tmp_path):
+        """Test failures are recorded per job in input order."""
+        mocker.patch("cluspro.download_fast.create_http_session", return_value=MagicMock())
+
+        def fake_download(session, job_id, *args):
+            if job_id == 2:
+                raise Exception("boom")
+            return tmp_path
+
+        mocker.patch("cluspro.download_fast._download_one", side_effect=fake_download)
+
+        from cluspro.download_fast import download_batch_http
+
+        results = download_batch_http(
+            [3, 2, 1], output_dir=tmp_path, progress=False, config=mock_config
+        )
+
+        assert list(results) == [3, 2, 1]
+        assert results[2]["status"] == "error"
+        assert results[3]["status"] == "success"
+
 
 class TestGetJobNameFromPage:
     """Tests for get_job_name_from_page function."""
@@ -0,0 +1,39 @@
+"""Tests for the package-level lazy exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestLazyExports:
+    """Tests for cluspro.__getattr__."""
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ can be imported from the package."""
+        import cluspro
+
+        for name in cluspro.__all__:
+            assert getattr(cluspro, name) is not None
+
+    def test_lazy_table_matches_all(self):
+        """Test the lazy import table and __all__ list the same names."""
+        import cluspro
+
+        assert set(cluspro._LAZY_IMPORTS) == set(cluspro.__all__)
+
+    def test_unknown_attribute(self):
+        """Test unknown names raise AttributeError."""
+        import cluspro
+
+        with pytest.raises(AttributeError):
+            cluspro.not_a_real_name  # noqa: B018
+
+    def test_import_does_not_load_selenium(self):
+        """Test importing the package alone leaves Selenium unloaded."""
+        code = "import sys, cluspro; print('selenium' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
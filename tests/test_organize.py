@@ -69,6 +69,33 @@ class TestOrganizeResults:
         pdb_files = list(result_dir.glob("*.pdb"))
         assert len(pdb_files) == 2
 
+    def test_organize_csv_only(self, mocker, mock_config, tmp_path):
+        """Test that include_pdb=False copies only CSV files."""
+        source_dir = tmp_path / "source"
+        target_dir = tmp_path / "target"
+        job_dir = source_dir / "test-job"
+        job_dir.mkdir(parents=True)
+
+        (job_dir / "model1.pdb").write_text("PDB content")
+        (job_dir / "scores.csv").write_text("scores")
+
+        mocker.patch("cluspro.organize.load_config", return_value=mock_config)
+
+        from cluspro.organize import organize_results
+
+        mapping = [{"job_name": "test-job", "peptide_name": "pep1", "receptor_name": "rec1"}]
+
+        organize_results(
+            mapping,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            include_pdb=False,
+            config=mock_config,
+        )
+
+        result_dir = target_dir / "pep1_v_rec1"
+        assert sorted(p.name for p in result_dir.iterdir()) == ["scores.csv"]
+
     def test_organize_skips_missing_source(self, mocker, mock_config, tmp_path):
         """Test organize handles missing source directories."""
         source_dir = tmp_path / "source"
@@ -96,6 +123,65 @@ class TestOrganizeResults:
 
         assert results["pep1_v_rec1"]["status"] == "error"
 
+    def test_organize_applies_receptor_substitutions(self, mocker, mock_config, tmp_path):
+        """Test receptor substitutions are applied to directory names."""
+        source_dir = tmp_path / "source"
+        target_dir = tmp_path / "target"
+        for job in ["job-1", "job-2"]:
+            (source_dir / job).mkdir(parents=True)
+
+        mocker.patch("cluspro.organize.load_config", return_value=mock_config)
+
+        from cluspro.organize import organize_results
+
+        mapping = [
+            {"job_name": "job-1", "peptide_name": "pep1", "receptor_name": "mMrgprx2"},
+            {"job_name": "job-2", "peptide_name": "pep2", "receptor_name": "hLrp1"},
+        ]
+
+        results = organize_results(
+            mapping,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            config=mock_config,
+        )
+
+        assert set(results) == {"pep1_v_rMrgprx2", "pep2_v_hLrp1"}
+        assert (target_dir / "pep1_v_rMrgprx2").exists()
+
+    def test_organize_parallel_keeps_mapping_order(self, mock_config, tmp_path):
+        """Test parallel copies report in mapping order; shared targets merge in order."""
+        source_dir = tmp_path / "source"
+        target_dir = tmp_path / "target"
+        for i in range(6):
+            (source_dir / f"job-{i}").mkdir(parents=True)
+            (source_dir / f"job-{i}" / f"scores{i}.csv").write_text("a,b\n")
+
+        from cluspro.organize import organize_results
+
+        mapping = [
+            {"job_name": f"job-{i}", "peptide_name": f"pep{i}", "receptor_name": "rec"}
+            for i in range(5)
+        ]
+        # Same target as job-0, so both rows are copied by one task
+        mapping.append({"job_name": "job-5", "peptide_name": "pep0", "receptor_name": "rec"})
+
+        results = organize_results(
+            mapping,
+            source_dir=source_dir,
+            target_dir=target_dir,
+            include_pdb=False,
+            config=mock_config,
+            workers=3,
+        )
+
+        assert list(results) == [f"pep{i}_v_rec" for i in range(5)]
+        assert all(r["status"] == "success" for r in results.values())
+        assert sorted(p.name for p in (target_dir / "pep0_v_rec").iterdir()) == [
+            "scores0.csv",
+            "scores5.csv",
+        ]
+
 
 class TestApplyReceptorSubstitutions:
     """Tests for apply_receptor_substitutions function."""
@@ -129,6 +215,14 @@ class TestListOrganizedResults:
 
         assert df.empty
 
+    def test_list_missing_directory(self, mock_config, tmp_path):
+        """Test a missing target directory gives an empty listing."""
+        from cluspro.organize import list_organized_results
+
+        df = list_organized_results(target_dir=tmp_path / "missing", config=mock_config)
+
+        assert df.empty
+
     def test_list_with_results(self, mocker, mock_config, tmp_path):
         """Test listing directory with results."""
         # Create sample result directories
@@ -181,6 +275,24 @@ class TestOrganizeFromCsv:
         assert "peptide1_v_receptor1" in results
         assert "peptide2_v_receptor2" in results
 
+    def test_organize_from_csv_numeric_job_names(self, mock_config, tmp_path):
+        """Test job names that look like numbers still match their directories."""
+        source_dir = tmp_path / "source"
+        (source_dir / "007").mkdir(parents=True)
+        csv_path = tmp_path / "mapping.csv"
+        csv_path.write_text("job_name,peptide_name,receptor_name,notes\n007,pep,rec,x\n")
+
+        from cluspro.organize import organize_from_csv
+
+        results = organize_from_csv(
+            csv_path=csv_path,
+            source_dir=source_dir,
+            target_dir=tmp_path / "target",
+            config=mock_config,
+        )
+
+        assert results["pep_v_rec"]["status"] == "success"
+
 
 class TestCleanupEmptyDirs:
     """Tests for cleanup_empty_dirs function."""
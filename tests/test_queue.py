@@ -39,6 +39,24 @@ class TestGetQueueStatus:
 
         # The table should be parsed (result captured for side effect verification)
 
+    def test_pooled_relogin_reloads_queue(self, mocker, mock_config):
+        """Test a pooled browser that had to log in again reloads the queue page."""
+        mock_driver = MagicMock()
+        mock_driver.page_source = "<html><body></body></html>"
+        mock_session = mocker.patch("cluspro.queue.browser_session")
+        mock_session.return_value.__enter__ = MagicMock(return_value=mock_driver)
+        mock_session.return_value.__exit__ = MagicMock(return_value=False)
+        mocker.patch("time.sleep")
+        pool = MagicMock()
+        pool.authenticate.return_value = True
+
+        from cluspro.queue import get_queue_status
+
+        get_queue_status(config=mock_config, pool=pool)
+
+        queue_url = mock_config["cluspro"]["urls"]["queue"]
+        assert [c.args for c in mock_driver.get.call_args_list] == [(queue_url,), (queue_url,)]
+
 
 class TestParseHtmlTable:
     """Tests for parse_html_table function."""
@@ -1,5 +1,7 @@
 """Tests for results module."""
 
+from unittest.mock import MagicMock
+
 import pandas as pd
 from bs4 import BeautifulSoup
 
@@ -29,6 +31,7 @@ class TestGetFinishedJobs:
         mocker.patch("cluspro.results.authenticate")
         mocker.patch("cluspro.results.load_config", return_value=mock_config)
         mocker.patch("time.sleep")
+        mock_config["results"] = {"http": False}
 
         from cluspro.results import get_finished_jobs
 
@@ -40,6 +43,105 @@ class TestGetFinishedJobs:
             pass  # Some internal parsing might fail, that's ok for this test
 
 
+def _results_page(rows: list[tuple[str, int]], next_href: str | None) -> str:
+    """Build a results page with an optional 'next ->' link."""
+    body = "".join(
+        f"<tr><td>{name}</td><td>{job_id}</td><td>finished</td></tr>" for name, job_id in rows
+    )
+    link = f'<a href="{next_href}">next -&gt;</a>' if next_href else ""
+    return (
+        '<html><body><table class="nice"><tr><th>Name</th><th>ID</th><th>Status</th></tr>'
+        f"{body}</table>{link}</body></html>"
+    )
+
+
+class _FakeHttpSession:
+    """Serves results pages keyed on the 'offset' query parameter."""
+
+    def __init__(self, num_pages: int):
+        self.num_pages = num_pages
+        self.requested: list[str] = []
+
+    def get(self, url, timeout=None):
+        from urllib.parse import parse_qs, urlsplit
+
+        self.requested.append(url)
+        offset = int(parse_qs(urlsplit(url).query).get("offset", ["0"])[0])
+        page = offset // 10
+        next_href = f"results.php?offset={offset + 10}" if page + 1 < self.num_pages else None
+        html = _results_page([(f"job-{page}", page)], next_href)
+        return MagicMock(url=url, text=html)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestFetchPagesHttp:
+    """Tests for fetching results pages over HTTP."""
+
+    def test_fetches_all_pages_in_order(self):
+        """Test pages past the third are fanned out and kept in order."""
+        from cluspro.results import _fetch_pages_http
+
+        session = _FakeHttpSession(num_pages=6)
+
+        pages = _fetch_pages_http(session, "https://cluspro.org/results.php", max_pages=20)
+
+        assert len(pages) == 6
+        assert all(f"job-{i}" in html for i, html in enumerate(pages))
+
+    def test_respects_max_pages(self):
+        """Test no more than max_pages are returned."""
+        from cluspro.results import _fetch_pages_http
+
+        session = _FakeHttpSession(num_pages=10)
+
+        pages = _fetch_pages_http(session, "https://cluspro.org/results.php", max_pages=4)
+
+        assert len(pages) == 4
+        assert len(session.requested) == 4
+
+    def test_extrapolate_page_urls(self):
+        """Test page URLs are predicted from a numeric query step."""
+        from cluspro.results import _extrapolate_page_urls
+
+        urls = _extrapolate_page_urls(
+            "https://x/results.php?offset=10&u=a", "https://x/results.php?offset=20&u=a", 2
+        )
+
+        assert urls == [
+            "https://x/results.php?offset=30&u=a",
+            "https://x/results.php?offset=40&u=a",
+        ]
+
+    def test_extrapolate_unknown_scheme(self):
+        """Test non-numeric paging is not extrapolated."""
+        from cluspro.results import _extrapolate_page_urls
+
+        assert _extrapolate_page_urls("https://x/r?c=ab", "https://x/r?c=cd", 2) is None
+
+    def test_get_finished_jobs_uses_http(self, mocker, mock_config):
+        """Test results.http reads pages over a session logged in on the results host."""
+        mock_create = mocker.patch(
+            "cluspro.results.create_http_session", return_value=_FakeHttpSession(3)
+        )
+        mock_browser = mocker.patch("cluspro.results.browser_session")
+        mock_config["results"] = {"http": True}
+
+        from cluspro.results import get_finished_jobs
+
+        df = get_finished_jobs(max_pages=5, config=mock_config)
+
+        mock_browser.assert_not_called()
+        results_url = mock_config["cluspro"]["urls"]["results"]
+        assert mock_create.call_args.kwargs["login_url"] == results_url
+        assert df["job_id"].tolist() == [0, 1, 2]
+        assert df["job_id"].dtype == "Int64"
+
+
 class TestParseResultsTable:
     """Tests for parse_results_table function."""
 
@@ -153,6 +255,7 @@ class TestCheckJobFinished:
         mocker.patch("cluspro.results.authenticate")
         mocker.patch("cluspro.results.load_config", return_value=mock_config)
         mocker.patch("time.sleep")
+        mock_config["results"] = {"http": False}
 
         from cluspro.results import check_job_finished
 
@@ -177,6 +280,7 @@ class TestCheckJobFinished:
         mocker.patch("cluspro.results.authenticate")
         mocker.patch("cluspro.results.load_config", return_value=mock_config)
         mocker.patch("time.sleep")
+        mock_config["results"] = {"http": False}
 
         from cluspro.results import check_job_finished
 
@@ -84,6 +84,27 @@ class TestRetryDecorators:
 
         assert call_count == 1  # Should only be called once
 
+    def test_before_retry_hook_runs_between_attempts(self):
+        """Test the before_retry hook runs once per retry with the call's arguments."""
+        from cluspro.retry import create_retry_decorator
+
+        seen = []
+        fast_retry = create_retry_decorator(
+            max_attempts=3,
+            min_wait=0.01,
+            max_wait=0.02,
+            before_retry=lambda state: seen.append(state.args[0]),
+        )
+
+        @fast_retry
+        def always_times_out(driver):
+            raise TimeoutException("Timeout")
+
+        with pytest.raises(TimeoutException):
+            always_times_out("driver")
+
+        assert seen == ["driver", "driver"]
+
 
 class TestWithRetry:
     """Tests for with_retry decorator."""
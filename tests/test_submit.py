@@ -91,6 +91,25 @@ class TestSubmitBatch:
         assert all(r == "error" for r in results["status"])
 
 
+class TestReadJobsCsv:
+    """Tests for read_jobs_csv function."""
+
+    def test_reads_only_job_columns(self, tmp_path):
+        """Test extra columns are dropped and job names stay strings."""
+        from cluspro.submit import read_jobs_csv
+
+        csv_file = tmp_path / "jobs.csv"
+        csv_file.write_text(
+            "job_name,receptor_pdb,ligand_pdb,server,notes\n001,r.pdb,l.pdb,gpu,first run\n"
+        )
+
+        jobs = read_jobs_csv(csv_file)
+
+        assert list(jobs.columns) == ["job_name", "receptor_pdb", "ligand_pdb", "server"]
+        assert jobs.iloc[0]["job_name"] == "001"
+        assert isinstance(jobs["server"].dtype, pd.CategoricalDtype)
+
+
 class TestDryRun:
     """Tests for dry_run function."""
 
@@ -154,6 +173,28 @@ class TestDryRun:
         assert results.iloc[0]["valid"]  # First job valid
         assert not results.iloc[1]["valid"]  # Second job invalid
 
+    def test_dry_run_checks_shared_paths_once(self, mocker, temp_pdb_files, capsys):
+        """Test shared paths are checked once and listed files skip the stat."""
+        from cluspro import submit
+
+        spy = mocker.spy(submit, "_path_exists")
+        receptor = str(temp_pdb_files["receptor"])
+
+        jobs = pd.DataFrame(
+            {
+                "job_name": ["job1", "job2", "job3"],
+                "receptor_pdb": [receptor] * 3,
+                "ligand_pdb": [str(temp_pdb_files["ligand"]), "/nonexistent/a.pdb", "/x/b.pdb"],
+            }
+        )
+
+        results = submit.dry_run(jobs)
+
+        # Receptor and first ligand are found in their directory listing
+        assert sorted(c.args[0] for c in spy.call_args_list) == ["/nonexistent/a.pdb", "/x/b.pdb"]
+        assert results["valid"].tolist() == [True, False, False]
+        assert "[OK] job1" in capsys.readouterr().out
+
 
 class TestSubmissionError:
     """Tests for SubmissionError exception."""
@@ -208,3 +249,49 @@ class TestSubmitBatchSuccess:
         assert len(results) == 2
         assert all(r == "success" for r in results["status"])
         assert all(r == "12345" for r in results["job_id"])
+
+    def test_submit_batch_shares_pool(self, mocker, mock_config, temp_pdb_files):
+        """Test browser batches run through one shared BrowserPool in input order."""
+        mock_submit = mocker.patch(
+            "cluspro.submit.submit_job", side_effect=lambda job_name, **kw: job_name
+        )
+        mocker.patch("time.sleep")
+        mock_config["batch"]["browser_workers"] = 2
+
+        from cluspro.browser_pool import BrowserPool
+        from cluspro.submit import submit_batch
+
+        jobs = pd.DataFrame(
+            {
+                "job_name": [f"job{i}" for i in range(5)],
+                "receptor_pdb": [str(temp_pdb_files["receptor"])] * 5,
+                "ligand_pdb": [str(temp_pdb_files["ligand"])] * 5,
+            }
+        )
+
+        results = submit_batch(jobs, progress=False, config=mock_config)
+
+        assert results["job_id"].tolist() == [f"job{i}" for i in range(5)]
+        pools = {call.kwargs["pool"] for call in mock_submit.call_args_list}
+        assert len(pools) == 1
+        pool = pools.pop()
+        assert isinstance(pool, BrowserPool)
+        assert pool.size == 2
+
+    def test_submit_batch_stops_on_error(self, mocker, mock_config, temp_pdb_files):
+        """Test the first failure is raised when continue_on_error is False."""
+        mocker.patch("cluspro.submit.submit_job", side_effect=ValueError("Test error"))
+        mocker.patch("time.sleep")
+
+        from cluspro.submit import submit_batch
+
+        jobs = pd.DataFrame(
+            {
+                "job_name": ["job1", "job2"],
+                "receptor_pdb": [str(temp_pdb_files["receptor"])] * 2,
+                "ligand_pdb": [str(temp_pdb_files["ligand"])] * 2,
+            }
+        )
+
+        with pytest.raises(ValueError, match="Test error"):
+            submit_batch(jobs, continue_on_error=False, progress=False, config=mock_config)
@@ -0,0 +1,283 @@
+"""Tests for submit_async module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+# Skip all tests in this module if aiohttp not installed
+pytest.importorskip("aiohttp")
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, url: str, body: str = ""):
+        self.url = url
+        self.body = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def text(self) -> str:
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestSubmitOne:
+    """Tests for _submit_one coroutine."""
+
+    def test_submit_one_captures_job_id(self, temp_pdb_files):
+        """Test job ID is parsed from the redirect URL."""
+        from cluspro.submit_async import _submit_one
+
+        session = MagicMock()
+        session.post = MagicMock(
+            return_value=_FakeResponse("https://cluspro.bu.edu/models.php?job=12345")
+        )
+        job = {
+            "job_name": "job1",
+            "receptor_pdb": str(temp_pdb_files["receptor"]),
+            "ligand_pdb": str(temp_pdb_files["ligand"]),
+        }
+
+        async def run():
+            return await _submit_one(
+                session, asyncio.Semaphore(1), asyncio.Event(), "https://example", job
+            )
+
+        result = asyncio.run(run())
+
+        assert result["status"] == "success"
+        assert result["job_id"] == "12345"
+
+    def test_submit_one_job_id_from_page(self, temp_pdb_files):
+        """Test the job ID is found in the confirmation page when there is no redirect."""
+        from cluspro.submit_async import _submit_one
+
+        session = MagicMock()
+        session.post = MagicMock(
+            return_value=_FakeResponse(
+                "https://cluspro.bu.edu/home.php",
+                '<a href="models.php?job=67890">View job</a>',
+            )
+        )
+        job = {
+            "job_name": "job1",
+            "receptor_pdb": str(temp_pdb_files["receptor"]),
+            "ligand_pdb": str(temp_pdb_files["ligand"]),
+        }
+
+        async def run():
+            return await _submit_one(
+                session, asyncio.Semaphore(1), asyncio.Event(), "https://example", job
+            )
+
+        result = asyncio.run(run())
+
+        assert result["status"] == "success"
+        assert result["job_id"] == "67890"
+
+    @pytest.mark.parametrize(
+        ("url", "body", "message"),
+        [
+            ("https://cluspro.bu.edu/login.php", "<form>", "login page"),
+            ("https://cluspro.bu.edu/home.php", "<p>Invalid PDB</p>", "did not confirm"),
+        ],
+    )
+    def test_submit_one_unconfirmed_is_error(self, temp_pdb_files, url, body, message):
+        """Test a 2xx response without a job ID is not counted as submitted."""
+        from cluspro.submit_async import _submit_one
+
+        session = MagicMock()
+        session.post = MagicMock(return_value=_FakeResponse(url, body))
+        job = {
+            "job_name": "job1",
+            "receptor_pdb": str(temp_pdb_files["receptor"]),
+            "ligand_pdb": str(temp_pdb_files["ligand"]),
+        }
+
+        async def run():
+            return await _submit_one(
+                session, asyncio.Semaphore(1), asyncio.Event(), "https://example", job
+            )
+
+        result = asyncio.run(run())
+
+        assert result["status"] == "error"
+        assert result["job_id"] is None
+        assert message in result["error"]
+
+    def test_submit_one_missing_file(self):
+        """Test missing PDB files are reported as errors."""
+        from cluspro.submit_async import _submit_one
+
+        session = MagicMock()
+        job = {
+            "job_name": "job1",
+            "receptor_pdb": "/nonexistent/receptor.pdb",
+            "ligand_pdb": "/nonexistent/ligand.pdb",
+        }
+
+        async def run():
+            return await _submit_one(
+                session, asyncio.Semaphore(1), asyncio.Event(), "https://example", job
+            )
+
+        result = asyncio.run(run())
+
+        assert result["status"] == "error"
+        session.post.assert_not_called()
+
+
+class TestSubmitBatchAsync:
+    """Tests for submit_batch_async function."""
+
+    def test_logs_in_once(self, mocker, mock_config, mock_credentials):
+        """Test a single login is shared by all jobs."""
+        mock_login = mocker.patch("cluspro.submit_async._login", new=AsyncMock())
+        mocker.patch(
+            "cluspro.submit_async._submit_one",
+            new=AsyncMock(
+                side_effect=lambda *args, **kwargs: {
+                    "job_name": args[4]["job_name"],
+                    "job_id": None,
+                    "status": "success",
+                    "error": None,
+                }
+            ),
+        )
+
+        from cluspro.submit_async import submit_batch_async
+
+        jobs = [{"job_name": f"job{i}", "receptor_pdb": "r", "ligand_pdb": "l"} for i in range(3)]
+
+        results = asyncio.run(submit_batch_async(jobs, mock_credentials, config=mock_config))
+
+        assert mock_login.await_count == 1
+        assert len(results) == 3
+        assert all(r == "success" for r in results["status"])
+
+    def test_slots_pause_between_jobs(self, mocker, mock_config, mock_credentials):
+        """Test each slot waits between_jobs after a job unless it has no job left."""
+        mocker.patch("cluspro.submit_async._login", new=AsyncMock())
+        mock_submit = mocker.patch(
+            "cluspro.submit_async._submit_one",
+            new=AsyncMock(
+                side_effect=lambda *args, **kwargs: {
+                    "job_name": args[4]["job_name"],
+                    "job_id": "1",
+                    "status": "success",
+                    "error": None,
+                }
+            ),
+        )
+        mock_tqdm = mocker.patch("cluspro.submit_async.tqdm")
+
+        from cluspro.submit_async import submit_batch_async
+
+        jobs = [{"job_name": f"job{i}", "receptor_pdb": "r", "ligand_pdb": "l"} for i in range(5)]
+
+        asyncio.run(
+            submit_batch_async(
+                jobs, mock_credentials, concurrency=2, config=mock_config, progress=True
+            )
+        )
+
+        delays = [call.kwargs["delay"] for call in mock_submit.await_args_list]
+        assert delays == [1, 1, 1, 0, 0]
+        assert mock_tqdm.call_args.kwargs["disable"] is False
+        assert mock_tqdm.return_value.__enter__.return_value.update.call_count == 5
+
+    def test_stop_on_error(self, mocker, mock_config, mock_credentials):
+        """Test SubmissionError is raised when continue_on_error is False."""
+        mocker.patch("cluspro.submit_async._login", new=AsyncMock())
+        mocker.patch(
+            "cluspro.submit_async._submit_one",
+            new=AsyncMock(
+                return_value={"job_name": "job1", "job_id": None, "status": "error", "error": "x"}
+            ),
+        )
+
+        from cluspro.submit import SubmissionError
+        from cluspro.submit_async import submit_batch_async
+
+        jobs = pd.DataFrame({"job_name": ["job1"], "receptor_pdb": ["r"], "ligand_pdb": ["l"]})
+
+        with pytest.raises(SubmissionError):
+            asyncio.run(
+                submit_batch_async(
+                    jobs, mock_credentials, continue_on_error=False, config=mock_config
+                )
+            )
+
+
+class TestSubmitBatchRouting:
+    """Tests for submit_batch selecting the HTTP engine."""
+
+    def test_credentials_use_http_engine(self, mocker, mock_config, mock_credentials):
+        """Test account batches opting in are routed to submit_batch_async."""
+        mock_config["batch"]["http_submit"] = True
+        mock_async = mocker.patch(
+            "cluspro.submit_async.submit_batch_async",
+            new=AsyncMock(return_value=pd.DataFrame([{"job_name": "job1", "status": "success"}])),
+        )
+        mock_submit_job = mocker.patch("cluspro.submit.submit_job")
+
+        from cluspro.submit import submit_batch
+
+        jobs = pd.DataFrame({"job_name": ["job1"], "receptor_pdb": ["r"], "ligand_pdb": ["l"]})
+
+        results = submit_batch(
+            jobs, progress=False, config=mock_config, credentials=mock_credentials
+        )
+
+        mock_async.assert_awaited_once()
+        mock_submit_job.assert_not_called()
+        assert results.iloc[0]["status"] == "success"
+
+    def test_http_engine_is_opt_in(self, mocker, mock_config, mock_credentials):
+        """Test account batches use the browser unless batch.http_submit is set."""
+        mock_async = mocker.patch("cluspro.submit_async.submit_batch_async", new=AsyncMock())
+        mock_submit_job = mocker.patch("cluspro.submit.submit_job", return_value="1")
+        mocker.patch("time.sleep")
+
+        from cluspro.submit import submit_batch
+
+        jobs = pd.DataFrame({"job_name": ["job1"], "receptor_pdb": ["r"], "ligand_pdb": ["l"]})
+
+        results = submit_batch(
+            jobs, progress=False, config=mock_config, credentials=mock_credentials
+        )
+
+        mock_async.assert_not_called()
+        mock_submit_job.assert_called_once()
+        assert results.iloc[0]["status"] == "success"
+
+    def test_running_loop_uses_browser(self, mocker, mock_config, mock_credentials):
+        """Test submit_batch called from inside an event loop falls back to the browser."""
+        mock_config["batch"]["http_submit"] = True
+        mock_async = mocker.patch("cluspro.submit_async.submit_batch_async", new=AsyncMock())
+        mock_submit_job = mocker.patch("cluspro.submit.submit_job", return_value="1")
+        mocker.patch("time.sleep")
+
+        from cluspro.submit import submit_batch
+
+        jobs = pd.DataFrame({"job_name": ["job1"], "receptor_pdb": ["r"], "ligand_pdb": ["l"]})
+
+        async def run():
+            return submit_batch(
+                jobs, progress=False, config=mock_config, credentials=mock_credentials
+            )
+
+        results = asyncio.run(run())
+
+        mock_async.assert_not_called()
+        mock_submit_job.assert_called_once()
+        assert results.iloc[0]["status"] == "success"
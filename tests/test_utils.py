@@ -1,6 +1,20 @@
 """Tests for utility functions."""
 
-from cluspro.utils import expand_sequences, format_job_ids, group_sequences
+import os
+import re
+
+import pandas as pd
+import yaml
+
+from cluspro.utils import (
+    expand_sequences,
+    format_job_ids,
+    group_sequences,
+    iter_sequences,
+    load_config,
+    match_pattern,
+    setup_logging,
+)
 
 
 class TestExpandSequences:
@@ -36,6 +50,10 @@ class TestExpandSequences:
         result = expand_sequences("958743:958745,958747:958748,958750")
         assert result == [958743, 958744, 958745, 958747, 958748, 958750]
 
+    def test_invalid_parts_skipped(self):
+        """Test invalid tokens are skipped and valid ones kept."""
+        assert expand_sequences("1:2,abc,4:x,6") == [1, 2, 6]
+
 
 class TestGroupSequences:
     """Tests for group_sequences function."""
@@ -94,6 +112,26 @@ class TestRoundTrip:
         compressed = group_sequences(expanded)
         assert compressed == original
 
+    def test_roundtrip_large(self):
+        """Test roundtrip for a large sequence with many gaps."""
+        original = ",".join(f"{i}:{i + 9}" for i in range(1000000, 1100000, 20))
+        assert group_sequences(expand_sequences(original)) == original
+
+    def test_short_and_long_inputs_agree(self):
+        """Test short and long inputs with duplicates give the same answer."""
+        ids = [5, 3, 4, 10, 12, 11, 11, 20]
+        padded = ids * 20
+
+        assert group_sequences(ids) == group_sequences(padded) == "3:5,10:12,20"
+
+    def test_iter_sequences_yields_tokens(self):
+        """Test iter_sequences yields one token per run."""
+        ids = [7, 1, 2, 3]
+
+        assert list(iter_sequences(ids)) == ["1:3", "7"]
+        assert list(iter_sequences(ids * 20)) == ["1:3", "7"]
+        assert list(iter_sequences([])) == []
+
 
 class TestFormatJobIds:
     """Tests for format_job_ids function."""
@@ -111,3 +149,132 @@ class TestFormatJobIds:
         """Test with fewer items than limit."""
         result = format_job_ids("1,2,3", items_per_line=5)
         assert result == "1,2,3"
+
+
+class TestMatchPattern:
+    """Tests for match_pattern function."""
+
+    def test_prefix_pattern(self):
+        """Test simple prefix patterns match like re.match."""
+        names = pd.Series(["bb-1", "bb-2", "pad-1", None])
+        assert match_pattern(names, "bb-.*").tolist() == [True, True, False, False]
+
+    def test_compiled_pattern(self):
+        """Test an already compiled pattern is accepted."""
+        names = pd.Series(["bb-1", "BB-2", "pad-1"])
+        compiled = re.compile("bb-", re.IGNORECASE)
+        assert match_pattern(names, compiled).tolist() == [True, True, False]
+
+    def test_regex_pattern(self):
+        """Test patterns with regex syntax use the regex engine."""
+        names = pd.Series(["bb-1", "bb-x", "pad-1"])
+        assert match_pattern(names, r"bb-\d+").tolist() == [True, False, False]
+
+    def test_dot_is_not_literal(self):
+        """Test an unescaped dot in the stem keeps its regex meaning."""
+        names = pd.Series(["a.b", "axb"])
+        assert match_pattern(names, "a.b.*").tolist() == [True, True]
+
+
+class TestSetupLogging:
+    """Tests for setup_logging function."""
+
+    def test_repeat_calls_only_change_level(self, tmp_path):
+        """Test a configured root logger gets no new handlers or log files."""
+        import logging
+
+        root = logging.getLogger()
+        root.addHandler(logging.NullHandler())
+        handlers = list(root.handlers)
+        level = root.level
+
+        try:
+            setup_logging("DEBUG", log_file=str(tmp_path / "cluspro.log"))
+            setup_logging("DEBUG")
+
+            assert root.handlers == handlers
+            assert root.level == logging.DEBUG
+            assert not (tmp_path / "cluspro.log").exists()
+        finally:
+            root.removeHandler(handlers[-1])
+            root.setLevel(level)
+
+
+class TestLoadConfig:
+    """Tests for load_config function."""
+
+    def test_parses_file_once(self, mocker, tmp_path):
+        """Test repeated loads of an unchanged file reuse the parse."""
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("batch:\n  jobs_per_chunk: 5\n")
+        spy = mocker.spy(yaml, "load")
+
+        first = load_config(config_file)
+        second = load_config(config_file)
+
+        assert first == second == {"batch": {"jobs_per_chunk": 5}}
+        assert spy.call_count == 1
+
+    def test_new_process_reuses_disk_cache(self, mocker, tmp_path):
+        """Test a cleared in-memory cache falls back to the parse saved on disk."""
+        from cluspro.utils import _load_config_file
+
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("batch:\n  jobs_per_chunk: 5\n")
+        load_config(config_file)
+
+        _load_config_file.cache_clear()
+        spy = mocker.spy(yaml, "load")
+
+        assert load_config(config_file) == {"batch": {"jobs_per_chunk": 5}}
+        assert spy.call_count == 0
+
+    def test_skips_disk_cache_for_non_json_values(self, tmp_path):
+        """Test configs JSON cannot round-trip are not written to the disk cache."""
+        import cluspro.utils
+
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("ports:\n  1: a\n")
+
+        assert load_config(config_file) == {"ports": {1: "a"}}
+        assert not cluspro.utils.CONFIG_CACHE_FILE.exists()
+
+    def test_reloads_after_edit(self, tmp_path):
+        """Test editing the file invalidates the cache."""
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("batch:\n  jobs_per_chunk: 5\n")
+        load_config(config_file)
+
+        config_file.write_text("batch:\n  jobs_per_chunk: 7\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(config_file)["batch"]["jobs_per_chunk"] == 7
+
+    def test_reloads_after_edit_with_same_mtime(self, tmp_path):
+        """Test an edit that keeps the size and mtime (e.g. cp -p) is still picked up."""
+        from cluspro.utils import _load_config_file
+
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("batch:\n  jobs_per_chunk: 5\n")
+        stat = config_file.stat()
+        load_config(config_file)
+
+        config_file.write_text("batch:\n  jobs_per_chunk: 7\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config_file.stat().st_mtime_ns == stat.st_mtime_ns
+
+        assert load_config(config_file)["batch"]["jobs_per_chunk"] == 7
+
+        # A fresh process must not be served the stale parse from disk either
+        _load_config_file.cache_clear()
+        assert load_config(config_file)["batch"]["jobs_per_chunk"] == 7
+
+    def test_returns_independent_copies(self, tmp_path):
+        """Test mutating a loaded config does not leak into later loads."""
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("batch:\n  jobs_per_chunk: 5\n")
+
+        load_config(config_file)["batch"]["jobs_per_chunk"] = 99
+
+        assert load_config(config_file)["batch"]["jobs_per_chunk"] == 5